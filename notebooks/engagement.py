@@ -1,3 +1,4 @@
+import sys
 import numpy as np
 import pandas as pd
 import matplotlib
@@ -12,12 +13,18 @@ import nltk
 from typing import Any
 from nltk.corpus import stopwords
 
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.append(str(PROJECT_ROOT))
+
+from src.engagement_data import load_engagement_data
+
 nltk.download("stopwords")
 
 data_path = Path("../data/processed/combined_engagement_data.csv")
 processed_dir = Path("../data/processed")
 processed_dir.mkdir(parents=True, exist_ok=True)
-df = pd.read_csv(data_path)
+df = load_engagement_data(data_path, categorical=False)
 
 print("Shape:", df.shape)
 
@@ -33,8 +40,8 @@ df["total_engagement"] = df["like_count"] + df["comment_count"] + df["share_coun
 df["engagement_rate"] = df["total_engagement"] / df["view_count"].replace(0, np.nan)
 df["engagement_rate"] = df["engagement_rate"].fillna(0)
 
-df.to_csv(data_path, index=False)
-print(f"💾 Updated engagement metrics saved to: {data_path.resolve()}")
+# Not written back: the combined CSV is normalize.py's output (string ISO posted_at,
+# used as an incremental dedupe key), and this frame is typed.
 
 stop_words = set(stopwords.words("english"))
 
@@ -3,7 +3,6 @@ from pathlib import Path
 
 import pandas as pd
 import streamlit as st
-from textblob import TextBlob
 
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 if str(PROJECT_ROOT) not in sys.path:
@@ -12,9 +11,13 @@ if str(PROJECT_ROOT) not in sys.path:
 from src.content_generation import (
 	GenerationContext,
 	load_generation_context,
-	run_generation,
+	stream_generation,
 )
-from src.scorer import build_scoring_summary
+from src.engagement_data import WEEKDAYS, load_engagement_data, posting_time_columns
+from src.learned_model import load_learned_model
+from src.scorer import build_scoring_summary, resolve_scoring_mode
+from src.sentiment import get_sentiment_backend, sentiment_backend
+from src.text_features import text_features
 
 
 DATA_DIR = PROJECT_ROOT / "data"
@@ -30,9 +33,17 @@ def _safe_read_csv(path: Path) -> pd.DataFrame:
 	return pd.read_csv(path)
 
 
+# Labels shown in the app always come from TextBlob (the thresholds below were tuned
+# for it), whichever SCORER_SENTIMENT_BACKEND the scorer uses for speed.
+LABEL_SENTIMENT_BACKEND = "textblob"
+
+
 def _analyze_sentiment(text: str) -> tuple[float, str]:
-	blob = TextBlob(str(text))
-	polarity = float(blob.sentiment.polarity)
+	if get_sentiment_backend().name == LABEL_SENTIMENT_BACKEND:
+		# Shared with the scorer's feature cache: posts scored above are not re-analysed.
+		polarity = text_features(str(text)).polarity or 0.0
+	else:
+		polarity = sentiment_backend(LABEL_SENTIMENT_BACKEND).polarity(str(text))
 	if polarity > 0.2:
 		label = "Positive"
 	elif polarity < -0.2:
@@ -78,7 +89,7 @@ def _run_performance_metrics():
 		how="left",
 	)
 
-	df_eng = _safe_read_csv(engagement_file)
+	df_eng = load_engagement_data(engagement_file, categorical=False)
 	df_eng["topic"] = df_eng["platform"]
 
 	metrics = ["like_count", "comment_count", "share_count", "view_count"]
@@ -135,36 +146,20 @@ def _run_performance_metrics():
 def _load_posting_recommendations():
 	data_file = PROCESSED_DIR / "combined_engagement_data.csv"
 	try:
-		df = _safe_read_csv(data_file)
+		df = load_engagement_data(data_file, columns=["posted_at_epoch", "engagement_rate"])
+		if "posted_at_epoch" not in df.columns:
+			df = load_engagement_data(data_file, columns=["posted_at", "engagement_rate"])
 	except FileNotFoundError:
 		return None
-	if "posted_at" not in df.columns or "engagement_rate" not in df.columns:
-		return None
-	working = df[["posted_at", "engagement_rate"]].dropna()
-	if working.empty:
+	if "engagement_rate" not in df.columns or not {"posted_at_epoch", "posted_at"} & set(df.columns):
 		return None
-	working["posted_at"] = pd.to_datetime(working["posted_at"], errors="coerce")
-	working = working.dropna(subset=["posted_at", "engagement_rate"])
-	if working.empty:
-		return None
-	working["day_of_week"] = working["posted_at"].dt.day_name()
-	working["hour_of_day"] = working["posted_at"].dt.hour
-	valid = working.dropna(subset=["day_of_week", "hour_of_day"])
+	valid = posting_time_columns(df).join(df["engagement_rate"]).dropna()
 	if valid.empty:
 		return None
-	week_order = [
-		"Monday",
-		"Tuesday",
-		"Wednesday",
-		"Thursday",
-		"Friday",
-		"Saturday",
-		"Sunday",
-	]
 	day_stats = (
-		valid.groupby("day_of_week")["engagement_rate"]
+		valid.groupby("day_of_week", observed=False)["engagement_rate"]
 		.mean()
-		.reindex(week_order)
+		.reindex(WEEKDAYS)
 		.dropna()
 	)
 	hour_stats = valid.groupby("hour_of_day")["engagement_rate"].mean().sort_values(ascending=False)
@@ -180,6 +175,29 @@ def _load_posting_recommendations():
 	}
 
 
+def _stream_variations(stream, num_variations: int) -> tuple[pd.DataFrame, pd.DataFrame]:
+	"""Render each variation as its tokens arrive; returns the stream's (scored, optimized) frames."""
+	live = st.empty()
+	with live.container():
+		st.markdown("### Generating")
+		slots = [st.empty() for _ in range(num_variations)]
+	for slot in slots:
+		slot.caption("Waiting for the model...")
+	while True:
+		try:
+			update = next(stream)
+		except StopIteration as finished:
+			result = finished.value
+			break
+		header = f"**Variation {update.variation_no}**"
+		if update.done:
+			header += f" – Score {update.score:.2f}"
+		slots[update.variation_no - 1].markdown(f"{header}\n\n{update.text}{'' if update.done else ' ▌'}")
+	# The ranked A/B results below replace the live view.
+	live.empty()
+	return result
+
+
 def get_generation_context() -> GenerationContext:
 	return load_generation_context(top_n_keywords=None, max_prompt_hashtags=None)
 
@@ -259,6 +277,18 @@ def main() -> None:
 			"Must-use hashtags (comma separated)",
 			help="Add specific hashtags you want inserted into every variation.",
 		)
+		fresh_results = st.checkbox(
+			"Fresh results",
+			value=False,
+			help="Always call the model instead of reusing cached posts for the same inputs.",
+		)
+		target_platform = None
+		if resolve_scoring_mode() == "learned":
+			target_platform = st.selectbox(
+				"Target platform",
+				options=list(load_learned_model().platforms),
+				help="Learned scoring ranks posts against this platform's engagement history.",
+			)
 
 		submitted = st.form_submit_button("Generate posts", width="stretch")
 
@@ -275,8 +305,8 @@ def main() -> None:
 		user_hashtags = [ht.strip() for ht in custom_hashtags.split(",") if ht.strip()] if custom_hashtags else []
 		if user_hashtags:
 			selected_hashtags = user_hashtags + [ht for ht in selected_hashtags if ht not in user_hashtags]
-		with st.spinner("Generating posts..."):
-			scored_df, _ = run_generation(
+		scored_df, _ = _stream_variations(
+			stream_generation(
 				topic=topic.strip(),
 				tone=tone.strip() or context.best_tone,
 				context=context,
@@ -284,7 +314,11 @@ def main() -> None:
 				hashtags=selected_hashtags,
 				num_variations=3,
 				max_words=max_words,
-			)
+				use_cache=not fresh_results,
+				platform=target_platform,
+			),
+			num_variations=3,
+		)
 
 		st.success(f"Generated {len(scored_df)} variations.")
 		if posting_recommendations:
@@ -303,10 +337,11 @@ def main() -> None:
 			hour_col.metric("Best hour to publish", hour_value, delta=hour_delta)
 		st.session_state["latest_posts"] = scored_df
 		st.session_state["latest_keywords"] = selected_keywords
+		st.session_state["latest_platform"] = target_platform
 		if not scored_df.empty:
 			winner = scored_df.iloc[0]
 			st.success(f"Recommended Winner: Variation A (Control) (Score {winner['score']:.2f})")
-			summary_table = build_scoring_summary(scored_df, selected_keywords)
+			summary_table = build_scoring_summary(scored_df, selected_keywords, platform=target_platform)
 			winner_features = summary_table.iloc[0]
 			reasons = []
 			kw_hits = int(winner_features.get("keyword_hits", 0))
@@ -382,7 +417,9 @@ def main() -> None:
 		else:
 			keywords = st.session_state.get("latest_keywords") or context.top_keywords
 			with st.spinner("Scoring latest posts..."):
-				scoring_table = build_scoring_summary(latest_df, keywords)
+				scoring_table = build_scoring_summary(
+					latest_df, keywords, platform=st.session_state.get("latest_platform")
+				)
 			st.dataframe(
 				scoring_table[[
 					"variation_no",
@@ -2,7 +2,7 @@
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Iterable, Sequence
+from typing import Generator, Iterable, NamedTuple, Sequence
 
 import pandas as pd
 
@@ -10,8 +10,9 @@ PROJECT_ROOT = Path(__file__).resolve().parents[1]
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.append(str(PROJECT_ROOT))
 
-from src.llm.groq_generate import generate_content
-from src.scorer import optimize_post, score_post
+from src.hashtag_index import load_hashtag_index
+from src.llm.groq_generate import generate_contents, stream_contents
+from src.scorer import optimize_many, score_many
 
 
 DATA_DIR = PROJECT_ROOT / "data" / "processed"
@@ -66,20 +67,8 @@ def load_generation_context(
         .iloc[0]["sentiment_label"]
     )
 
-    hashtags: list[str] = []
-    if hashtags_dir.exists():
-        for csv in hashtags_dir.glob("*_hashtags.csv"):
-            try:
-                df_h = pd.read_csv(csv)
-            except Exception:
-                continue
-            column = "hashtag" if "hashtag" in df_h.columns else None
-            if column is None and "hashtags" in df_h.columns:
-                column = "hashtags"
-            if column:
-                hashtags.extend(df_h[column].dropna().astype(str).tolist())
-
-    prompt_list = sorted({h.strip() for h in hashtags if h.strip()})
+    # Sorted, de-duplicated hashtags from the cached index (re-read only when a file changes).
+    prompt_list = list(load_hashtag_index(hashtags_dir).vocab)
     if max_prompt_hashtags is not None:
         prompt_list = prompt_list[:max_prompt_hashtags]
 
@@ -97,17 +86,33 @@ def generate_variations(
     hashtags: Sequence[str],
     num_variations: int = 3,
     max_words: int = 150,
+    max_concurrency: int | None = None,
+    use_cache: bool = True,
+    generation_mode: str | None = None,
 ) -> pd.DataFrame:
-    generated_posts = []
     timestamp = datetime.utcnow().isoformat()
-    for i in range(num_variations):
-        text = generate_content(
-            topic=topic,
-            tone=tone,
-            max_words=max_words,
-            keywords=list(keywords),
-            hashtags=list(hashtags),
-        )
+    # All variations are requested at once (concurrent calls, or one call in
+    # "single_request" mode), so the wait is about one Groq round trip instead of
+    # num_variations of them.
+    texts = generate_contents(
+        topic=topic,
+        tone=tone,
+        max_words=max_words,
+        n=num_variations,
+        keywords=list(keywords),
+        hashtags=list(hashtags),
+        max_concurrency=max_concurrency,
+        use_cache=use_cache,
+        mode=generation_mode,
+    )
+    return _generated_posts_frame(topic, tone, keywords, hashtags, texts, timestamp)
+
+
+def _generated_posts_frame(
+    topic: str, tone: str, keywords: Sequence[str], hashtags: Sequence[str], texts: Sequence[str], timestamp: str
+) -> pd.DataFrame:
+    generated_posts = []
+    for i, text in enumerate(texts):
         generated_posts.append(
             {
                 "topic": topic,
@@ -123,38 +128,24 @@ def generate_variations(
     return pd.DataFrame(generated_posts)
 
 
-def score_posts(df_gen: pd.DataFrame, keywords: Sequence[str]) -> pd.DataFrame:
+def score_posts(
+    df_gen: pd.DataFrame, keywords: Sequence[str], workers: int | None = None, platform: str | None = None
+) -> pd.DataFrame:
+    # `platform` is the target platform; SCORER_MODE=learned needs it.
     df_scored = df_gen.copy()
-    df_scored["score"] = df_scored["generated_text"].apply(
-        lambda text: score_post(text, keywords)
-    )
+    df_scored["score"] = score_many(df_scored["generated_text"], keywords, workers=workers, platform=platform)
     return df_scored.sort_values("score", ascending=False).reset_index(drop=True)
 
 
-def build_feature_table(df_scored: pd.DataFrame, keywords: Sequence[str]) -> pd.DataFrame:
-    feature_rows = []
-    for _, row in df_scored.iterrows():
-        feats = optimize_post(row["generated_text"], list(keywords))
-        feature_rows.append(
-            {
-                "topic": row["topic"],
-                "tone": row["tone"],
-                "keywords_used": row["keywords_used"],
-                "variation_no": row["variation_no"],
-                "generated_text": row["generated_text"],
-                "word_count": feats["word_count"],
-                "hashtags": feats["hashtags"],
-                "sentiment": feats["sentiment"],
-                "keyword_hits": feats["keyword_hits"],
-                "readability_bonus": feats["readability_bonus"],
-                "length_bonus": feats["length_bonus"],
-                "hashtag_bonus": feats["hashtag_bonus"],
-                "score": feats["final_score"],
-                "generated_at": row.get("generated_at"),
-            }
-        )
+def build_feature_table(df_scored: pd.DataFrame, keywords: Sequence[str], workers: int | None = None) -> pd.DataFrame:
+    feats = optimize_many(df_scored["generated_text"], list(keywords), workers=workers)
+    df_opt = df_scored[["topic", "tone", "keywords_used", "variation_no", "generated_text"]].copy()
+    for col in ["word_count", "hashtags", "sentiment", "keyword_hits", "readability_bonus", "length_bonus", "hashtag_bonus"]:
+        df_opt[col] = feats[col]
+    df_opt["score"] = feats["final_score"]
+    df_opt["generated_at"] = df_scored["generated_at"] if "generated_at" in df_scored.columns else None
 
-    return pd.DataFrame(feature_rows).sort_values("score", ascending=False).reset_index(drop=True)
+    return df_opt.sort_values("score", ascending=False).reset_index(drop=True)
 
 
 def append_with_dedupe(
@@ -186,6 +177,10 @@ def run_generation(
     num_variations: int = 3,
     max_words: int = 150,
     persist: bool = True,
+    max_concurrency: int | None = None,
+    use_cache: bool = True,
+    generation_mode: str | None = None,
+    platform: str | None = None,
 ) -> tuple[pd.DataFrame, pd.DataFrame]:
     context = context or load_generation_context()
     tone_to_use = tone or context.best_tone
@@ -199,9 +194,18 @@ def run_generation(
         hashtags=hashtags_to_use,
         num_variations=num_variations,
         max_words=max_words,
+        max_concurrency=max_concurrency,
+        use_cache=use_cache,
+        generation_mode=generation_mode,
     )
-    df_scored = score_posts(df_gen, keywords_to_use)
-    df_opt = build_feature_table(df_scored, keywords_to_use)
+    return _score_and_persist(df_gen, keywords_to_use, persist, platform)
+
+
+def _score_and_persist(
+    df_gen: pd.DataFrame, keywords: Sequence[str], persist: bool, platform: str | None = None
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    df_scored = score_posts(df_gen, keywords, platform=platform)
+    df_opt = build_feature_table(df_scored, keywords)
 
     if persist:
         append_with_dedupe(df_scored, GENERATED_POSTS_PATH, ["generated_text"])
@@ -210,6 +214,57 @@ def run_generation(
     return df_scored, df_opt
 
 
+class VariationUpdate(NamedTuple):
+    variation_no: int  # 1-based, as in generated_posts
+    text: str  # text so far
+    done: bool
+    score: float | None  # score_post of the finished variation; None while streaming
+
+
+def stream_generation(
+    topic: str,
+    *,
+    tone: str | None = None,
+    context: GenerationContext | None = None,
+    keywords: Sequence[str] | None = None,
+    hashtags: Sequence[str] | None = None,
+    num_variations: int = 3,
+    max_words: int = 150,
+    persist: bool = True,
+    max_concurrency: int | None = None,
+    use_cache: bool = True,
+    platform: str | None = None,
+) -> Generator[VariationUpdate, None, tuple[pd.DataFrame, pd.DataFrame]]:
+    """
+    run_generation that yields a VariationUpdate per streamed chunk (variations
+    stream concurrently) and one with the score as each variation completes.
+    The generator's return value is run_generation's (scored, optimized) frames.
+    """
+    context = context or load_generation_context()
+    tone_to_use = tone or context.best_tone
+    keywords_to_use = list(keywords or context.top_keywords)
+    hashtags_to_use = list(hashtags or context.prompt_hashtags)
+
+    timestamp = datetime.utcnow().isoformat()
+    texts = [""] * num_variations
+    for event in stream_contents(
+        topic=topic,
+        tone=tone_to_use,
+        max_words=max_words,
+        n=num_variations,
+        keywords=keywords_to_use,
+        hashtags=hashtags_to_use,
+        max_concurrency=max_concurrency,
+        use_cache=use_cache,
+    ):
+        texts[event.variation] = event.text
+        score = float(score_many([event.text.strip()], keywords_to_use, platform=platform).iloc[0]) if event.done else None
+        yield VariationUpdate(event.variation + 1, event.text, event.done, score)
+
+    df_gen = _generated_posts_frame(topic, tone_to_use, keywords_to_use, hashtags_to_use, texts, timestamp)
+    return _score_and_persist(df_gen, keywords_to_use, persist, platform)
+
+
 if __name__ == "__main__":
     ctx = load_generation_context()
     topic_input = input("Enter the main topic for content generation: ").strip()
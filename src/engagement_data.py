@@ -0,0 +1,249 @@
+from pathlib import Path
+from typing import Dict, Iterable
+
+import pandas as pd
+
+# Optional dep: pyarrow. Without it the typed files cannot be written or read,
+# and load_engagement_data() falls back to parsing the CSV into the same dtypes.
+try:
+    import pyarrow as pa
+    import pyarrow.feather as feather
+    import pyarrow.parquet as pq
+except Exception:
+    pa = None
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+COMBINED_CSV_PATH = PROJECT_ROOT / "data" / "processed" / "combined_engagement_data.csv"
+TYPED_SUFFIXES = (".arrow", ".parquet")
+
+# Fixed schema of the combined engagement dataset (column -> kind).
+COLUMN_KINDS: Dict[str, str] = {
+    "platform": "category",
+    "post_id": "string",
+    "author_id": "string",
+    "author_name": "string",
+    "posted_at": "timestamp",
+    "posted_at_epoch": "epoch",
+    "text": "string",
+    "url": "string",
+    "like_count": "int",
+    "comment_count": "int",
+    "share_count": "int",
+    "view_count": "int",
+    "tags": "string",
+    "language": "category",
+    "fetch_ts": "string",
+    "source_meta": "string",
+    "text_len": "int",
+    "engagement_sum": "int",
+    "engagement_rate": "float",
+    "days_since_post": "nullable_int",
+    "sentiment": "string",
+}
+
+if pa is not None:
+    ARROW_TYPES = {
+        "category": pa.dictionary(pa.int32(), pa.string()),
+        "string": pa.string(),
+        "timestamp": pa.timestamp("ns", tz="UTC"),
+        "int": pa.int64(),
+        "float": pa.float64(),
+        "nullable_int": pa.int32(),
+        "epoch": pa.int64(),
+    }
+    STRING_DTYPE = pd.StringDtype("pyarrow")
+else:
+    ARROW_TYPES = {}
+    STRING_DTYPE = object
+
+
+def _blank_to_na(s: pd.Series) -> pd.Series:
+    if s.dtype == object or pd.api.types.is_string_dtype(s):
+        return s.mask(s.astype(str).str.strip() == "")
+    return s
+
+
+def to_typed_frame(df: pd.DataFrame, categorical: bool = True) -> pd.DataFrame:
+    """
+    Coerce a combined-engagement frame (stringly typed CSV or normalize output)
+    to the fixed schema. Blank strings become missing values.
+    """
+    typed: Dict[str, pd.Series] = {}
+    for col in df.columns:
+        kind = COLUMN_KINDS.get(col)
+        s = df[col]
+        if kind == "category":
+            s = _blank_to_na(s).astype("category") if categorical else _blank_to_na(s).astype(STRING_DTYPE)
+        elif kind == "string":
+            s = _blank_to_na(s).astype(STRING_DTYPE)
+        elif kind == "timestamp":
+            s = pd.to_datetime(_blank_to_na(s), utc=True, errors="coerce", format="ISO8601")
+        elif kind == "int":
+            s = pd.to_numeric(s, errors="coerce").fillna(0).astype("int64")
+        elif kind == "float":
+            s = pd.to_numeric(s, errors="coerce").fillna(0.0).astype("float64")
+        elif kind == "nullable_int":
+            s = pd.to_numeric(_blank_to_na(s), errors="coerce").astype("Int32")
+        elif kind == "epoch":
+            s = pd.to_numeric(_blank_to_na(s), errors="coerce").astype("Int64")
+        typed[col] = s
+    return pd.DataFrame(typed, index=df.index)
+
+
+def arrow_schema(columns: Iterable[str]) -> "pa.Schema":
+    return pa.schema([(col, ARROW_TYPES[COLUMN_KINDS[col]]) for col in columns if col in COLUMN_KINDS])
+
+
+class TypedEngagementWriter:
+    """
+    Writes the combined dataset batch by batch as Arrow IPC (.arrow, uncompressed
+    so it can be memory-mapped) or Parquet (.parquet), using the fixed schema.
+
+    Category values are kept in first-seen order across batches, so each Arrow
+    batch only appends to the column dictionaries (written as IPC deltas).
+    """
+
+    def __init__(self, path: Path):
+        if pa is None:
+            raise ImportError("pyarrow is required for typed engagement output (pip install pyarrow)")
+        self.path = Path(path)
+        if self.path.suffix not in TYPED_SUFFIXES:
+            raise ValueError(f"Typed output must end in one of {TYPED_SUFFIXES}: {self.path}")
+        self.rows = 0
+        self._writer = None
+        self._sink = None
+        self._categories: Dict[str, list[str]] = {}
+
+    def write(self, df: pd.DataFrame) -> None:
+        typed = to_typed_frame(df[[col for col in df.columns if col in COLUMN_KINDS]])
+        for col in typed.columns:
+            if COLUMN_KINDS[col] == "category":
+                known = self._categories.setdefault(col, [])
+                seen = set(known)
+                known.extend(value for value in typed[col].cat.categories if value not in seen)
+                typed[col] = typed[col].cat.set_categories(known)
+        schema = arrow_schema(typed.columns)
+        table = pa.Table.from_pandas(typed, schema=schema, preserve_index=False)
+        if self._writer is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            if self.path.suffix == ".parquet":
+                self._writer = pq.ParquetWriter(self.path, schema)
+            else:
+                self._sink = pa.OSFile(str(self.path), "wb")
+                options = pa.ipc.IpcWriteOptions(emit_dictionary_deltas=True)
+                self._writer = pa.ipc.new_file(self._sink, schema, options=options)
+        self._writer.write_table(table)
+        self.rows += len(typed)
+
+    def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+        if self._sink is not None:
+            self._sink.close()
+        self._writer = self._sink = None
+
+    def __enter__(self) -> "TypedEngagementWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def write_typed_engagement(df: pd.DataFrame, path: Path) -> Path:
+    """Write the whole combined dataset to a typed .arrow/.parquet file."""
+    with TypedEngagementWriter(path) as writer:
+        writer.write(df)
+    return writer.path
+
+
+def typed_path_for(csv_path: Path) -> Path | None:
+    """The typed sibling of a CSV (same stem), if present and not older than the CSV."""
+    csv_mtime = csv_path.stat().st_mtime if csv_path.exists() else None
+    for suffix in TYPED_SUFFIXES:
+        candidate = csv_path.with_suffix(suffix)
+        if candidate.exists() and (csv_mtime is None or candidate.stat().st_mtime >= csv_mtime):
+            return candidate
+    return None
+
+
+def _arrow_pandas_type(arrow_type):
+    if arrow_type == pa.string():
+        return STRING_DTYPE
+    if arrow_type == pa.int32():
+        return pd.Int32Dtype()
+    return None
+
+
+def _read_typed(path: Path, columns: list[str] | None, memory_map: bool) -> pd.DataFrame:
+    if path.suffix == ".parquet":
+        available = pq.read_schema(path).names
+    else:
+        with pa.memory_map(str(path)) as source:
+            available = pa.ipc.open_file(source).schema.names
+    wanted = available if columns is None else [col for col in columns if col in available]
+    if path.suffix == ".parquet":
+        table = pq.read_table(path, columns=wanted, memory_map=memory_map)
+    else:
+        table = feather.read_table(path, columns=wanted, memory_map=memory_map)
+    df = table.to_pandas(types_mapper=_arrow_pandas_type)
+    for col in df.columns:
+        if COLUMN_KINDS.get(col) == "epoch":
+            df[col] = df[col].astype("Int64")
+    return df
+
+
+def load_engagement_data(
+    path: Path = COMBINED_CSV_PATH,
+    columns: list[str] | None = None,
+    memory_map: bool = True,
+    categorical: bool = True,
+) -> pd.DataFrame:
+    """
+    Shared reader for the combined engagement dataset.
+
+    Reads the typed Arrow/Parquet file when `path` points at one, or when a
+    fresh typed sibling of the CSV exists; otherwise parses the CSV into the
+    same dtypes. Requested columns missing from the file are skipped.
+    `categorical=False` returns platform/language as plain strings, which is
+    easier to merge and fillna against free-text columns.
+    """
+    path = Path(path)
+    source = path if path.suffix in TYPED_SUFFIXES else typed_path_for(path)
+    if source is not None and pa is not None:
+        if not source.exists():
+            raise FileNotFoundError(f"Missing required file: {source}")
+        df = _read_typed(source, columns, memory_map)
+        print(f"Loaded engagement data: {source}")
+        if not categorical:
+            for col in df.columns:
+                if COLUMN_KINDS.get(col) == "category":
+                    df[col] = df[col].astype(STRING_DTYPE)
+        return df
+    if path.suffix in TYPED_SUFFIXES:
+        raise ImportError(f"pyarrow is required to read {path}")
+    if not path.exists():
+        raise FileNotFoundError(f"Missing required file: {path}")
+    usecols = None if columns is None else (lambda col: col in columns)
+    df = pd.read_csv(path, usecols=usecols, dtype=str, keep_default_na=False)
+    print(f"Loaded engagement data: {path}")
+    return to_typed_frame(df, categorical=categorical)
+
+
+WEEKDAYS = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
+
+
+def posting_time_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    day_of_week / hour_of_day (UTC) for rows with a known post time, computed
+    with integer arithmetic on posted_at_epoch. Falls back to the posted_at
+    timestamps for datasets written before the epoch column existed.
+    """
+    if "posted_at_epoch" in df.columns:
+        epoch = pd.to_numeric(df["posted_at_epoch"], errors="coerce").dropna().astype("int64")
+        # 1970-01-01 was a Thursday (index 3 in WEEKDAYS).
+        days, seconds = epoch // 86400, epoch % 86400
+        day_of_week = pd.Categorical.from_codes(((days + 3) % 7).to_numpy(), categories=WEEKDAYS, ordered=True)
+        return pd.DataFrame({"day_of_week": day_of_week, "hour_of_day": seconds // 3600}, index=epoch.index)
+    posted = pd.to_datetime(df["posted_at"], utc=True, errors="coerce").dropna()
+    day_of_week = pd.Categorical(posted.dt.day_name(), categories=WEEKDAYS, ordered=True)
+    return pd.DataFrame({"day_of_week": day_of_week, "hour_of_day": posted.dt.hour}, index=posted.index)
@@ -0,0 +1,121 @@
+import argparse
+import json
+import platform
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List
+
+import numpy as np
+import pandas as pd
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.append(str(PROJECT_ROOT))
+
+from src.content_generation import (
+    append_with_dedupe,
+    build_feature_table,
+    generate_variations,
+    load_generation_context,
+    score_posts,
+)
+from src.llm.backends import OfflineBackend, set_llm_backend
+from src.pipeline_benchmark import RESULTS_DIR, git_revision
+from src.scorer_benchmark import latency_summary
+
+TOPICS = ["AI in Content Marketing", "Social media growth", "Email newsletters", "SEO for startups", "Video campaigns"]
+STAGES = ("generate", "score", "persist", "total")
+
+
+def run_load_test(args: argparse.Namespace, out_dir: Path) -> Dict[str, List[float]]:
+    """Time each stage of `args.runs` generation runs against the offline backend."""
+    set_llm_backend(OfflineBackend(latency=args.latency, seed=args.seed))
+    context = load_generation_context()
+    keywords = context.top_keywords[: args.keywords]
+    samples: Dict[str, List[float]] = {stage: [] for stage in STAGES}
+    for i in range(args.runs):
+        start = time.perf_counter()
+        df_gen = generate_variations(
+            topic=TOPICS[i % len(TOPICS)],
+            tone=context.best_tone,
+            keywords=keywords,
+            hashtags=context.prompt_hashtags,
+            num_variations=args.variations,
+            max_words=args.max_words,
+            max_concurrency=args.max_concurrency,
+            # Neither reads nor writes the response cache: canned offline posts must
+            # never be served to a later real run with the same prompt.
+            use_cache=False,
+            generation_mode=args.mode,
+        )
+        generated = time.perf_counter()
+        df_scored = score_posts(df_gen, keywords)
+        df_opt = build_feature_table(df_scored, keywords)
+        scored = time.perf_counter()
+        append_with_dedupe(df_scored, out_dir / "generated_posts.csv", ["generated_text"])
+        append_with_dedupe(df_opt, out_dir / "optimized_posts.csv", ["generated_text"])
+        done = time.perf_counter()
+        samples["generate"].append(generated - start)
+        samples["score"].append(scored - generated)
+        samples["persist"].append(done - scored)
+        samples["total"].append(done - start)
+    return samples
+
+
+def parse_args(argv: List[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Load-test generation -> scoring -> persistence with the offline LLM backend (no network)."
+    )
+    parser.add_argument("--runs", type=int, default=50, help="Generation runs (topics cycle).")
+    parser.add_argument("--variations", type=int, default=3, help="Posts per run.")
+    parser.add_argument("--max-words", type=int, default=150)
+    parser.add_argument("--keywords", type=int, default=10, help="Top EDA keywords used for prompts and scoring.")
+    parser.add_argument("--latency", type=float, default=0.5, help="Simulated seconds per LLM call.")
+    parser.add_argument("--max-concurrency", type=int, default=None, help="LLM calls in flight (default: GROQ_MAX_CONCURRENCY).")
+    parser.add_argument("--mode", choices=["batch", "single_request"], default=None, help="Generation mode.")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--persist-dir", default=None, help="Where the CSVs are appended (default: a temporary directory).")
+    parser.add_argument("--output", default=None, help="Results JSON path (default: reports/benchmarks/generation_<timestamp>.json).")
+    return parser.parse_args(argv)
+
+
+def main(argv: List[str] | None = None):
+    args = parse_args(argv)
+    with tempfile.TemporaryDirectory() as tmp:
+        out_dir = Path(args.persist_dir) if args.persist_dir else Path(tmp)
+        samples = run_load_test(args, out_dir)
+
+    results = []
+    for stage in STAGES:
+        result = {"stage": stage, "runs_per_s": round(args.runs / sum(samples[stage]), 2) if sum(samples[stage]) else None}
+        result.update({k: v for k, v in latency_summary(samples[stage]).items() if k != "texts_per_s"})
+        results.append(result)
+        print(
+            f"  {stage:<8} p50 {result['p50_ms']:>10.2f} ms  p99 {result['p99_ms']:>10.2f} ms  {result['runs_per_s'] or 0:>8.2f} runs/s",
+            file=sys.stderr,
+        )
+
+    report = {
+        "version": 1,
+        "benchmark": "generation",
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "git_revision": git_revision(),
+        "python": platform.python_version(),
+        "pandas": pd.__version__,
+        "machine": platform.platform(),
+        "settings": {k: v for k, v in vars(args).items() if k not in ("output", "persist_dir")},
+        "posts_per_s": round(args.runs * args.variations / float(np.sum(samples["total"])), 2),
+        "results": results,
+    }
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    output = Path(args.output) if args.output else RESULTS_DIR / f"generation_{stamp}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    print(f"Saved benchmark results: {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,166 @@
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, FrozenSet, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+HASHTAG_GLOB = "*_hashtags.csv"
+# Reading a CSV is mostly I/O and C parsing, so a few threads overlap the files.
+MAX_LOAD_THREADS = 8
+
+FileSignature = Tuple[str, int, int]  # (name, mtime_ns, size)
+
+
+@dataclass(frozen=True)
+class _HashtagFile:
+    """The rows of one {platform}_hashtags.csv that the index needs."""
+
+    platform: str
+    post_counts: Dict[str, int]  # rows per post_id; {} when the file has no post_id column
+    hashtags: List[str]  # stripped, non-empty hashtags in file order
+
+
+def _read_hashtag_file(path: Path) -> _HashtagFile | None:
+    try:
+        df = pd.read_csv(path)
+    except Exception:
+        return None
+    platform = path.name[: -len("_hashtags.csv")]
+    if "platform" in df.columns and df["platform"].notna().any():
+        platform = str(df["platform"].dropna().iloc[0])
+    post_counts: Dict[str, int] = {}
+    if "post_id" in df.columns:
+        post_counts = {str(pid): int(cnt) for pid, cnt in df.groupby("post_id").size().items()}
+    column = "hashtag" if "hashtag" in df.columns else "hashtags" if "hashtags" in df.columns else None
+    hashtags: List[str] = []
+    if column:
+        stripped = df[column].dropna().astype(str).str.strip()
+        hashtags = [sys.intern(h) for h in stripped[stripped != ""]]
+    return _HashtagFile(sys.intern(platform), post_counts, hashtags)
+
+
+class HashtagIndex:
+    """
+    Hashtags from every {platform}_hashtags.csv in one place: an interned,
+    sorted vocabulary with per-hashtag frequency and platforms, plus the
+    hashtag-row count per post_id (what scorer.load_hashtag_counts returns).
+    """
+
+    def __init__(self, files: List[_HashtagFile]):
+        self.post_counts: Dict[str, int] = {}
+        codes: Dict[str, int] = {}
+        tag_codes: List[int] = []
+        tag_platforms: List[str] = []
+        for f in files:
+            # A post_id listed in several files keeps the count of the last one.
+            self.post_counts.update(f.post_counts)
+            for tag in f.hashtags:
+                tag_codes.append(codes.setdefault(tag, len(codes)))
+            tag_platforms.extend([f.platform] * len(f.hashtags))
+
+        # Re-code so the vocabulary is sorted and codes index it directly.
+        self.vocab: List[str] = sorted(codes)
+        self._codes: Dict[str, int] = {tag: i for i, tag in enumerate(self.vocab)}
+        remap = np.array([self._codes[tag] for tag in codes], dtype="int32")
+        coded = remap[np.array(tag_codes, dtype="int32")] if tag_codes else np.array([], dtype="int32")
+        self.frequencies: np.ndarray = np.bincount(coded, minlength=len(self.vocab)).astype("int64")
+        platforms: List[set] = [set() for _ in self.vocab]
+        for code, platform in zip(coded.tolist(), tag_platforms):
+            platforms[code].add(platform)
+        self.platforms: List[FrozenSet[str]] = [frozenset(p) for p in platforms]
+
+    def __len__(self) -> int:
+        return len(self.vocab)
+
+    def __contains__(self, hashtag: str) -> bool:
+        return hashtag in self._codes
+
+    def frequency(self, hashtag: str) -> int:
+        code = self._codes.get(hashtag)
+        return 0 if code is None else int(self.frequencies[code])
+
+    def hashtag_platforms(self, hashtag: str) -> FrozenSet[str]:
+        code = self._codes.get(hashtag)
+        return frozenset() if code is None else self.platforms[code]
+
+    def post_hashtag_count(self, post_id: str) -> int | None:
+        return self.post_counts.get(str(post_id))
+
+    def top(self, n: int | None = None) -> List[str]:
+        """Hashtags by frequency (ties alphabetical)."""
+        order = np.argsort(-self.frequencies, kind="stable")
+        if n is not None:
+            order = order[:n]
+        return [self.vocab[i] for i in order]
+
+    def to_frame(self) -> pd.DataFrame:
+        return pd.DataFrame(
+            {
+                "hashtag": self.vocab,
+                "frequency": self.frequencies,
+                "platforms": [",".join(sorted(p)) for p in self.platforms],
+            }
+        )
+
+
+def _stat_files(hashtags_dir: Path) -> Dict[Path, FileSignature]:
+    stats: Dict[Path, FileSignature] = {}
+    if not hashtags_dir.exists():
+        return stats
+    for path in sorted(hashtags_dir.glob(HASHTAG_GLOB)):
+        try:
+            st = path.stat()
+        except OSError:
+            continue
+        stats[path] = (path.name, st.st_mtime_ns, st.st_size)
+    return stats
+
+
+# Per directory: the file signatures the index was built from. Per file: parsed
+# rows, so a change to one platform's CSV only re-reads that file.
+_indexes: Dict[Path, Tuple[Tuple[FileSignature, ...], HashtagIndex]] = {}
+_files: Dict[Path, Tuple[FileSignature, _HashtagFile | None]] = {}
+_lock = threading.Lock()
+
+
+def load_hashtag_index(hashtags_dir: Path) -> HashtagIndex:
+    """
+    The HashtagIndex for hashtags_dir, cached in-process. Files are stat'ed on
+    each call and only re-read when their mtime or size changed (or a file was
+    added/removed). Changed files are read concurrently.
+    """
+    hashtags_dir = Path(hashtags_dir).resolve()
+    stats = _stat_files(hashtags_dir)
+    sig = tuple(stats.values())
+    with _lock:
+        cached = _indexes.get(hashtags_dir)
+        if cached is not None and cached[0] == sig:
+            return cached[1]
+        stale = [p for p, s in stats.items() if p not in _files or _files[p][0] != s]
+        loaded = {p: _files[p][1] for p in stats if p not in stale}
+
+    parsed: List[_HashtagFile | None] = []
+    if stale:
+        with ThreadPoolExecutor(max_workers=min(MAX_LOAD_THREADS, len(stale))) as executor:
+            parsed = list(executor.map(_read_hashtag_file, stale))
+
+    with _lock:
+        for path, f in zip(stale, parsed):
+            _files[path] = (stats[path], f)
+            loaded[path] = f
+        # Drop files that were removed from the directory since they were parsed.
+        for path in [p for p in _files if p.parent == hashtags_dir and p not in stats]:
+            del _files[path]
+        index = HashtagIndex([loaded[p] for p in stats if loaded[p] is not None])
+        _indexes[hashtags_dir] = (sig, index)
+    return index
+
+
+def clear_hashtag_index_cache() -> None:
+    with _lock:
+        _indexes.clear()
+        _files.clear()
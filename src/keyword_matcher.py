@@ -0,0 +1,134 @@
+from collections import deque
+from functools import lru_cache
+from typing import Dict, Iterable, List, Sequence, Set
+
+import numpy as np
+
+# Below this many distinct keywords a plain `kw in text` loop (C string search per
+# keyword) beats walking the automaton in Python, so substring counts use it instead.
+# Both give the same counts.
+AUTOMATON_MIN_KEYWORDS = 192
+
+
+def _is_word_char(ch: str) -> bool:
+    # Same characters as \w in a unicode regex.
+    return ch.isalnum() or ch == "_"
+
+
+class KeywordMatcher:
+    """
+    Aho-Corasick automaton over a keyword list, built once and reused.
+
+    count(text) equals `sum(1 for kw in keywords if kw.lower() in text.lower())`:
+    keywords are case-insensitive, each keyword counts once per text however often
+    it occurs, and a keyword listed twice counts twice. All keywords are found in
+    one pass over the text. With word_boundaries=True a keyword only counts when
+    it is not glued to other word characters ("ai" then no longer hits "said").
+    """
+
+    def __init__(self, keywords: Iterable[str], word_boundaries: bool = False):
+        self.keywords = [kw.lower() for kw in keywords]
+        self.word_boundaries = word_boundaries
+        patterns: Dict[str, int] = {}
+        for kw in self.keywords:
+            patterns[kw] = patterns.get(kw, 0) + 1
+        # "" is a substring of every text.
+        self._always = patterns.pop("", 0)
+        self._patterns = list(patterns)
+        self._weights = [patterns[p] for p in self._patterns]
+        self._lengths = [len(p) for p in self._patterns]
+        self._use_automaton = word_boundaries or len(self._patterns) >= AUTOMATON_MIN_KEYWORDS
+        self._build()
+
+    def _build(self) -> None:
+        goto: List[Dict[str, int]] = [{}]
+        own: List[List[int]] = [[]]
+        for pid, pattern in enumerate(self._patterns):
+            state = 0
+            for ch in pattern:
+                nxt = goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[state][ch] = nxt
+                    goto.append({})
+                    own.append([])
+                state = nxt
+            own[state].append(pid)
+
+        fail = [0] * len(goto)
+        out: List[tuple] = [()] * len(goto)
+        queue = deque()
+        for nxt in goto[0].values():
+            queue.append(nxt)
+            out[nxt] = tuple(own[nxt])
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in goto[state].items():
+                queue.append(nxt)
+                f = fail[state]
+                while f and ch not in goto[f]:
+                    f = fail[f]
+                fail[nxt] = goto[f].get(ch, 0)
+                # Patterns ending here plus those ending at the longest proper suffix.
+                out[nxt] = tuple(own[nxt]) + out[fail[nxt]]
+        self._goto, self._fail, self._out = goto, fail, out
+
+    def __len__(self) -> int:
+        return len(self.keywords)
+
+    def found_lowered(self, text: str) -> Set[int]:
+        """Ids of the distinct patterns present in an already lowercased text."""
+        goto, fail, out = self._goto, self._fail, self._out
+        total = len(self._patterns)
+        found: Set[int] = set()
+        if not total:
+            return found
+        state = 0
+        for i, ch in enumerate(text):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if out[state]:
+                if self.word_boundaries:
+                    for pid in out[state]:
+                        start = i - self._lengths[pid] + 1
+                        if (start == 0 or not _is_word_char(text[start - 1])) and (
+                            i + 1 == len(text) or not _is_word_char(text[i + 1])
+                        ):
+                            found.add(pid)
+                else:
+                    found.update(out[state])
+                if len(found) == total:
+                    break
+        return found
+
+    def count_lowered(self, text: str) -> int:
+        if not self._use_automaton:
+            return self._always + sum(w for p, w in zip(self._patterns, self._weights) if p in text)
+        return self._always + sum(self._weights[pid] for pid in self.found_lowered(text))
+
+    def count(self, text: str) -> int:
+        return self.count_lowered(text.lower())
+
+    def count_many(self, texts: Iterable[str], lowered: bool = False) -> np.ndarray:
+        if lowered:
+            return np.array([self.count_lowered(t) for t in texts], dtype="int64")
+        return np.array([self.count_lowered(t.lower()) for t in texts], dtype="int64")
+
+    def matches(self, text: str) -> List[str]:
+        """The distinct keywords found in text, in keyword-list order."""
+        found = {self._patterns[pid] for pid in self.found_lowered(text.lower())}
+        hits = [kw for kw in dict.fromkeys(self.keywords) if kw in found]
+        return ([""] if self._always else []) + hits
+
+
+@lru_cache(maxsize=64)
+def _cached_matcher(keywords: tuple, word_boundaries: bool) -> KeywordMatcher:
+    return KeywordMatcher(keywords, word_boundaries)
+
+
+def keyword_matcher(keywords: "Sequence[str] | KeywordMatcher", word_boundaries: bool = False) -> KeywordMatcher:
+    """A matcher for `keywords`, reusing the one built for the same keyword list earlier."""
+    if isinstance(keywords, KeywordMatcher):
+        return keywords
+    return _cached_matcher(tuple(keywords), word_boundaries)
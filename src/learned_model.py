@@ -0,0 +1,181 @@
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+DEFAULT_MODEL_PATH = PROJECT_ROOT / "data" / "processed" / "learned_scorer_weights.npz"
+
+# Columns of the design matrix, in order (see scorer.learned_feature_matrix). The
+# same terms optimize_post adds up by hand, plus the CTA/question flags score_post uses.
+LEARNED_FEATURES = (
+    "intercept",
+    "keyword_hits",
+    "sentiment",
+    "readability_bonus",
+    "length_bonus",
+    "hashtag_bonus",
+    "has_cta",
+    "is_question",
+)
+# Bumped when the saved format or training target changes; older files must be retrained.
+MODEL_VERSION = 2
+
+
+def _ridge(X: np.ndarray, y: np.ndarray, ridge: float) -> np.ndarray:
+    # The intercept (column 0) is not shrunk.
+    penalty = np.full(X.shape[1], float(ridge))
+    penalty[0] = 0.0
+    return np.linalg.solve(X.T @ X + np.diag(penalty), X.T @ y)
+
+
+def platform_rank_target(y: np.ndarray, platforms: Sequence[str]) -> np.ndarray:
+    """
+    engagement_rate as a percentile rank in [0, 1] within each platform. Rates are
+    defined differently per platform, so only their order within one is comparable.
+    """
+    ranks = pd.Series(np.asarray(y, dtype=float)).groupby(np.asarray(platforms, dtype=object)).rank(pct=True)
+    return ranks.to_numpy(dtype=float)
+
+
+@dataclass(frozen=True)
+class LearnedScoringModel:
+    """
+    Per-platform linear weights over LEARNED_FEATURES, predicting where a post's
+    engagement_rate would rank among that platform's posts (0 = lowest, 1 = highest).
+    Each platform's weights are a pooled fit plus a ridge-shrunk per-platform
+    correction, so platforms with few posts stay close to the pooled fit. Platforms
+    with fewer than min_rows posts or a constant engagement_rate get no weights,
+    and scoring for them (or without a platform) raises.
+    """
+
+    platforms: Tuple[str, ...]
+    features: Tuple[str, ...]
+    weights: np.ndarray  # (len(platforms), len(features))
+    rows: np.ndarray  # training rows per platform
+    ridge: float
+    keywords: Tuple[str, ...] = ()  # trending keywords keyword_hits was counted against
+    _codes: Dict[str, int] = field(default_factory=dict, compare=False, repr=False)
+
+    def __post_init__(self):
+        self._codes.update({p: i for i, p in enumerate(self.platforms)})
+
+    @classmethod
+    def fit(
+        cls,
+        X: np.ndarray,
+        y: np.ndarray,
+        platforms: Sequence[str],
+        ridge: float = 1.0,
+        min_rows: int = 10,
+        keywords: Sequence[str] = (),
+    ) -> "LearnedScoringModel":
+        X = np.asarray(X, dtype=float)
+        y = np.asarray(y, dtype=float)
+        platforms = np.asarray(platforms, dtype=object)
+        trainable = [
+            str(p) for p in sorted(set(platforms))
+            if (platforms == p).sum() >= min_rows and np.ptp(y[platforms == p]) > 0
+        ]
+        if not trainable:
+            raise ValueError(f"No platform has {min_rows}+ posts with varying engagement_rate to learn from")
+        used = np.isin(platforms, trainable)
+        X, platforms = X[used], platforms[used]
+        target = platform_rank_target(y[used], platforms)
+        pooled = _ridge(X, target, ridge)
+        weights = []
+        rows = []
+        for platform in trainable:
+            mask = platforms == platform
+            Xp = X[mask]
+            rows.append(int(mask.sum()))
+            weights.append(pooled + _ridge(Xp, target[mask] - Xp @ pooled, ridge))
+        return cls(tuple(trainable), LEARNED_FEATURES, np.vstack(weights), np.array(rows), float(ridge), tuple(keywords))
+
+    def _code(self, platform: str | None) -> int:
+        if platform not in self._codes:
+            known = ", ".join(self.platforms)
+            raise ValueError(f"No learned weights for platform {platform!r}; learned scoring needs one of: {known}")
+        return self._codes[platform]
+
+    def weights_for(self, platform: str) -> np.ndarray:
+        return self.weights[self._code(platform)]
+
+    def predict(self, X: np.ndarray, platforms: str | Sequence[str]) -> np.ndarray:
+        """
+        X @ w for one platform, or row-wise dot products for one platform per row,
+        clipped to [0, 1]. Raises ValueError for a missing or untrained platform.
+        """
+        X = np.asarray(X, dtype=float)
+        if platforms is None or isinstance(platforms, str):
+            predicted = X @ self.weights_for(platforms)
+        else:
+            codes = np.array([self._code(p) for p in platforms], dtype="int64")
+            predicted = np.einsum("ij,ij->i", X, self.weights[codes])
+        return np.clip(predicted, 0.0, 1.0)
+
+    def to_frame(self) -> pd.DataFrame:
+        frame = pd.DataFrame(self.weights, index=list(self.platforms), columns=list(self.features))
+        frame.insert(0, "rows", self.rows)
+        return frame
+
+    def save(self, path: Path = DEFAULT_MODEL_PATH) -> Path:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "wb") as fh:
+            np.savez_compressed(
+                fh,
+                version=np.array(MODEL_VERSION),
+                platforms=np.array(self.platforms),
+                features=np.array(self.features),
+                weights=self.weights,
+                rows=self.rows,
+                ridge=np.array(self.ridge),
+                keywords=np.array(self.keywords, dtype=str),
+            )
+        return path
+
+    @classmethod
+    def load(cls, path: Path = DEFAULT_MODEL_PATH) -> "LearnedScoringModel":
+        with np.load(Path(path), allow_pickle=False) as data:
+            version = int(data["version"]) if "version" in data.files else 1
+            if version != MODEL_VERSION:
+                raise ValueError(
+                    f"Model at {path} has format version {version}, expected {MODEL_VERSION}; "
+                    "retrain it with `python src/train_scorer.py`."
+                )
+            features = tuple(str(f) for f in data["features"])
+            if features != LEARNED_FEATURES:
+                raise ValueError(f"Model at {path} was trained on features {features}, expected {LEARNED_FEATURES}")
+            return cls(
+                tuple(str(p) for p in data["platforms"]),
+                features,
+                data["weights"].astype(float),
+                data["rows"].astype("int64"),
+                float(data["ridge"]),
+                tuple(str(k) for k in data["keywords"]),
+            )
+
+
+_models: Dict[Path, Tuple[Tuple[int, int], LearnedScoringModel]] = {}
+_lock = threading.Lock()
+
+
+def load_learned_model(path: Path | None = None) -> LearnedScoringModel:
+    """The saved model, cached in-process until the file's mtime or size changes."""
+    path = Path(path or DEFAULT_MODEL_PATH).resolve()
+    if not path.exists():
+        raise FileNotFoundError(f"No learned scoring model at {path}; train one with `python src/train_scorer.py`.")
+    st = path.stat()
+    sig = (st.st_mtime_ns, st.st_size)
+    with _lock:
+        cached = _models.get(path)
+        if cached is not None and cached[0] == sig:
+            return cached[1]
+    model = LearnedScoringModel.load(path)
+    with _lock:
+        _models[path] = (sig, model)
+    return model
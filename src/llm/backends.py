@@ -0,0 +1,296 @@
+import asyncio
+import hashlib
+import json
+import os
+import random
+import threading
+import time
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Sequence
+
+# Optional dep: python-dotenv, only to read GROQ_API_KEY from .env for the groq backend.
+try:
+    from dotenv import load_dotenv
+except Exception:
+    load_dotenv = None
+
+# LLM_BACKEND=offline generates posts locally (no network, no API key); see OfflineBackend.
+LLM_BACKEND_ENV = "LLM_BACKEND"
+DEFAULT_BACKEND = "groq"
+GROQ_MODEL = "openai/gpt-oss-120b"
+
+PROMPT_TEMPLATE = (
+    """You are an expert digital marketer and copywriter.
+    Write a professional and engaging post about {topic}
+
+    Tone: {tone}
+    Style: informative, clear, and audience-friendly.
+    Use the following keywords naturally throughout the post:
+    {keywords}
+    
+    Include 4-5 relevant hashtags. Prefer items from this provided list when applicable:
+    {hashtags}
+    If better, add other accurate, relevant hashtags (no filler or random tags). Do not exceed 8 total.
+
+
+    Each post should:
+    - Feel authentic and insightful.
+    - Include 1 short call-to-action (CTA) or engaging line.
+    - Avoid repetition or hashtags unless needed.
+    Return a post suitable for LinkedIn or Twitter or youtube or any other platform around {max_words} words.
+    """
+)
+# Appended to PROMPT_TEMPLATE to get {n} variations from one request as a JSON array.
+MULTI_VARIATION_SUFFIX = """
+    Write {n} distinct variations of this post. Each one must follow all of the instructions above
+    and differ from the others in angle, opening line and CTA.
+    Respond with only a JSON array of {n} strings, one full post per string, and nothing else.
+    """
+
+# Vocabulary of OfflineBackend's synthetic posts (used when no hashtags are in the prompt).
+OFFLINE_OPENERS = ["Discover", "Learn", "Try", "Join", "Explore", "Check out", "How to", "Why", "Best", "Top 10"]
+OFFLINE_WORDS = (
+    "ai content marketing social media campaign brand growth audience engagement video post "
+    "strategy tools free paid creator automation seo trends tips guide launch product startup "
+    "ideas viral reach followers analytics copywriting prompt design workflow email newsletter "
+    "community story agency clients results budget roi funnel leads influencer platform "
+    "algorithm schedule calendar generation writing images templates best top new how why"
+).split()
+OFFLINE_HASHTAGS = ["#AI", "#marketing", "#contentcreation", "#socialmedia", "#SEO", "#growth", "#AITools", "#startup"]
+OFFLINE_CTAS = ["Learn more in the comments.", "Try it this week.", "Join the conversation below."]
+
+
+class LLMBackend(ABC):
+    """
+    What generation needs from a model: `chain` (prompt inputs -> one post) and
+    `multi_chain` (inputs plus n -> a JSON array of n posts), both with the LCEL
+    Runnable methods invoke/batch/stream/ainvoke/abatch. Built on first use.
+    """
+
+    name = "base"
+    model = ""
+
+    def render(self, inputs: dict) -> str:
+        """The prompt text for `inputs` (what the response cache keys on)."""
+        return PROMPT_TEMPLATE.format(**inputs)
+
+    @property
+    @abstractmethod
+    def chain(self):
+        ...
+
+    @property
+    @abstractmethod
+    def multi_chain(self):
+        ...
+
+
+class GroqBackend(LLMBackend):
+    """ChatGroq behind the prompt templates. Reads GROQ_API_KEY and imports LangChain on first use."""
+
+    name = "groq"
+
+    def __init__(self, model: str = GROQ_MODEL):
+        self.model = model
+        self._chains: tuple | None = None
+        self._lock = threading.Lock()
+
+    def _build(self) -> tuple:
+        with self._lock:
+            if self._chains is None:
+                if load_dotenv is not None:
+                    load_dotenv()
+                api_key = os.getenv("GROQ_API_KEY")
+                if not api_key:
+                    raise RuntimeError("GROQ_API_KEY missing in .env")
+                # Imported here: LangChain is slow to import and not needed offline.
+                from langchain_core.output_parsers import StrOutputParser
+                from langchain_core.prompts import ChatPromptTemplate
+                from langchain_groq import ChatGroq
+
+                llm = ChatGroq(api_key=api_key, model_name=self.model)
+                parser = StrOutputParser()
+                self._chains = (
+                    ChatPromptTemplate.from_template(PROMPT_TEMPLATE) | llm | parser,
+                    ChatPromptTemplate.from_template(PROMPT_TEMPLATE + MULTI_VARIATION_SUFFIX) | llm | parser,
+                )
+            return self._chains
+
+    @property
+    def chain(self):
+        return self._build()[0]
+
+    @property
+    def multi_chain(self):
+        return self._build()[1]
+
+
+class OfflineChain:
+    """Runnable-like stand-in for an LCEL chain: `respond(inputs)` after the backend's latency."""
+
+    def __init__(self, backend: "OfflineBackend", respond: Callable[[dict], str]):
+        self._backend = backend
+        self._respond = respond
+
+    def invoke(self, inputs: dict, config: dict | None = None) -> str:
+        time.sleep(self._backend.latency)
+        return self._respond(inputs)
+
+    def batch(self, inputs: Sequence[dict], config: dict | None = None) -> List[str]:
+        if not inputs:
+            return []
+        limit = (config or {}).get("max_concurrency") or len(inputs)
+        with ThreadPoolExecutor(max_workers=min(limit, len(inputs))) as executor:
+            return list(executor.map(self.invoke, inputs))
+
+    def stream(self, inputs: dict, config: dict | None = None) -> Iterator[str]:
+        # latency is the time to first token; token_delay spaces the rest.
+        text = self.invoke(inputs)
+        for i, word in enumerate(text.split(" ")):
+            if i:
+                time.sleep(self._backend.token_delay)
+            yield word if i == 0 else " " + word
+
+    async def ainvoke(self, inputs: dict, config: dict | None = None) -> str:
+        await asyncio.sleep(self._backend.latency)
+        return self._respond(inputs)
+
+    async def abatch(self, inputs: Sequence[dict], config: dict | None = None) -> List[str]:
+        semaphore = asyncio.Semaphore((config or {}).get("max_concurrency") or max(1, len(inputs)))
+
+        async def one(item: dict) -> str:
+            async with semaphore:
+                return await self.ainvoke(item)
+
+        return list(await asyncio.gather(*(one(item) for item in inputs)))
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name, default))
+    except ValueError:
+        return default
+
+
+def _load_responses(path: str | Path) -> List[str]:
+    # A JSON list of posts, or plain text with posts separated by blank lines.
+    text = Path(path).read_text(encoding="utf-8")
+    if Path(path).suffix == ".json":
+        return [str(post) for post in json.loads(text)]
+    return [post.strip() for post in text.split("\n\n") if post.strip()]
+
+
+class OfflineBackend(LLMBackend):
+    """
+    Deterministic local stand-in for load tests and benchmarks. Each call sleeps
+    `latency` seconds (streams then emit a word every `token_delay` seconds) and
+    returns, in order of preference: the next of the canned `responses`, `template`
+    formatted with the prompt inputs plus {variation}, or a synthetic post built
+    from the topic, keywords and hashtags. The k-th request for the same prompt
+    gets variation k, so a run's output depends only on its sequence of requests.
+    Env: OFFLINE_LLM_LATENCY, OFFLINE_LLM_TOKEN_DELAY, OFFLINE_LLM_RESPONSES
+    (path), OFFLINE_LLM_TEMPLATE.
+    """
+
+    name = "offline"
+    model = "offline"
+
+    def __init__(
+        self,
+        latency: float | None = None,
+        token_delay: float | None = None,
+        responses: Sequence[str] | None = None,
+        template: str | None = None,
+        seed: int = 0,
+    ):
+        self.latency = _env_float("OFFLINE_LLM_LATENCY", 0.0) if latency is None else latency
+        self.token_delay = _env_float("OFFLINE_LLM_TOKEN_DELAY", 0.0) if token_delay is None else token_delay
+        if responses is None and os.getenv("OFFLINE_LLM_RESPONSES"):
+            responses = _load_responses(os.environ["OFFLINE_LLM_RESPONSES"])
+        self.responses = list(responses or [])
+        self.template = template if template is not None else os.getenv("OFFLINE_LLM_TEMPLATE")
+        self.seed = seed
+        self._requests: Dict[str, int] = {}
+        self._calls = 0
+        self._lock = threading.Lock()
+        self._chain = OfflineChain(self, self._post)
+        self._multi_chain = OfflineChain(self, self._posts)
+
+    @property
+    def chain(self) -> OfflineChain:
+        return self._chain
+
+    @property
+    def multi_chain(self) -> OfflineChain:
+        return self._multi_chain
+
+    def _next(self, prompt: str) -> tuple[int, int]:
+        with self._lock:
+            variation = self._requests.get(prompt, 0)
+            self._requests[prompt] = variation + 1
+            call = self._calls
+            self._calls += 1
+            return variation, call
+
+    def _post(self, inputs: dict) -> str:
+        base = {k: v for k, v in inputs.items() if k != "n"}
+        variation, call = self._next(self.render(base))
+        if self.responses:
+            return self.responses[call % len(self.responses)]
+        if self.template:
+            return self.template.format(**base, variation=variation + 1)
+        return self._synthetic_post(base, variation)
+
+    def _posts(self, inputs: dict) -> str:
+        return json.dumps([self._post(inputs) for _ in range(int(inputs.get("n", 1)))])
+
+    def _synthetic_post(self, inputs: dict, variation: int) -> str:
+        digest = hashlib.blake2b(f"{self.seed}\0{variation}\0{self.render(inputs)}".encode("utf-8"), digest_size=8)
+        rng = random.Random(int.from_bytes(digest.digest(), "big"))
+        keywords = [k.strip() for k in str(inputs.get("keywords", "")).split(",") if k.strip()]
+        hashtags = [h.strip() for h in str(inputs.get("hashtags", "")).split(",") if h.strip()] or OFFLINE_HASHTAGS
+        target = max(20, int(inputs.get("max_words", 150)))
+        sentences = [f"{rng.choice(OFFLINE_OPENERS)} {inputs.get('topic', '')} in a {inputs.get('tone', 'clear')} way."]
+        words = len(sentences[0].split())
+        while words < target - 10:
+            picks = rng.sample(OFFLINE_WORDS, rng.randint(6, 12))
+            if keywords:
+                picks.insert(rng.randrange(len(picks)), rng.choice(keywords))
+            sentences.append(" ".join(picks).capitalize() + ".")
+            words += len(picks)
+        sentences.append(rng.choice(OFFLINE_CTAS))
+        tags = rng.sample(hashtags, min(len(hashtags), rng.randint(4, 5)))
+        return " ".join(sentences) + "\n\n" + " ".join(tags)
+
+
+_FACTORIES: Dict[str, Callable[[], LLMBackend]] = {
+    "groq": GroqBackend,
+    "offline": OfflineBackend,
+}
+LLM_BACKENDS = tuple(_FACTORIES)
+_instances: Dict[str, LLMBackend] = {}
+_active: LLMBackend | None = None
+
+
+def llm_backend(name: str) -> LLMBackend:
+    if name not in _FACTORIES:
+        raise ValueError(f"Unknown LLM backend '{name}'. Choose from: {', '.join(LLM_BACKENDS)}")
+    if name not in _instances:
+        _instances[name] = _FACTORIES[name]()
+    return _instances[name]
+
+
+def get_llm_backend() -> LLMBackend:
+    global _active
+    if _active is None:
+        _active = llm_backend(os.getenv(LLM_BACKEND_ENV) or DEFAULT_BACKEND)
+    return _active
+
+
+def set_llm_backend(backend: str | LLMBackend) -> LLMBackend:
+    """Select the backend behind generation ("groq" by default, "offline" for local runs)."""
+    global _active
+    _active = llm_backend(backend) if isinstance(backend, str) else backend
+    return _active
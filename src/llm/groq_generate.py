@@ -1,55 +1,249 @@
 import os
-from dotenv import load_dotenv
-from langchain_groq import ChatGroq
-from langchain_core.prompts import ChatPromptTemplate
-from langchain_core.output_parsers import StrOutputParser
-
-load_dotenv()
-api_key = os.getenv("GROQ_API_KEY")
-if not api_key:
-    raise RuntimeError("GROQ_API_KEY missing in .env")
-
-llm = ChatGroq(api_key=api_key, model_name="openai/gpt-oss-120b")
-parser = StrOutputParser()
-
-prompt = ChatPromptTemplate.from_template(
-    """You are an expert digital marketer and copywriter.
-    Write a professional and engaging post about {topic}
-
-    Tone: {tone}
-    Style: informative, clear, and audience-friendly.
-    Use the following keywords naturally throughout the post:
-    {keywords}
-    
-    Include 4-5 relevant hashtags. Prefer items from this provided list when applicable:
-    {hashtags}
-    If better, add other accurate, relevant hashtags (no filler or random tags). Do not exceed 8 total.
-
-
-    Each post should:
-    - Feel authentic and insightful.
-    - Include 1 short call-to-action (CTA) or engaging line.
-    - Avoid repetition or hashtags unless needed.
-    Return a post suitable for LinkedIn or Twitter or youtube or any other platform around {max_words} words.
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, NamedTuple
+
+from src.llm.backends import LLMBackend, get_llm_backend
+from src.llm.response_cache import ResponseCache, cache_bypassed, cache_from_env, response_key
+from src.llm.variations import parse_variations
+
+# The model behind generation is chosen by LLM_BACKEND ("groq" or "offline") and
+# built on first use, so importing this module needs neither LangChain nor an API key.
+
+# Responses keyed by (model, rendered prompt, variation index); see src/llm/response_cache.py.
+# Opened on first use, so importing this module does not create the SQLite file.
+_response_cache: ResponseCache | None = None
+_response_cache_lock = threading.Lock()
+
+# Upper bound on Groq requests in flight when several variations are generated at
+# once; GROQ_MAX_CONCURRENCY overrides it (e.g. to stay under the account rate limit).
+DEFAULT_MAX_CONCURRENCY = 4
+
+
+# "batch": one request per variation (concurrent). "single_request": all variations
+# from one request as a JSON array, so the prompt is sent once; variations the
+# response does not yield are generated per call. GROQ_GENERATION_MODE sets the default.
+GENERATION_MODES = ("batch", "single_request")
+
+
+def _generation_mode(mode: str | None = None) -> str:
+    mode = mode or os.getenv("GROQ_GENERATION_MODE") or "batch"
+    if mode not in GENERATION_MODES:
+        raise ValueError(f"Unknown generation mode '{mode}'. Choose from: {', '.join(GENERATION_MODES)}")
+    return mode
+
+
+def _max_concurrency(max_concurrency: int | None = None) -> int:
+    if max_concurrency is None:
+        try:
+            max_concurrency = int(os.getenv("GROQ_MAX_CONCURRENCY", DEFAULT_MAX_CONCURRENCY))
+        except ValueError:
+            max_concurrency = DEFAULT_MAX_CONCURRENCY
+    return max(1, max_concurrency)
+
+
+def _prompt_inputs(topic: str, tone: str, max_words: int, keywords: list[str] | None, hashtags: list[str] | None) -> dict:
+    return {
+        "topic": topic,
+        "tone": tone,
+        "keywords": ", ".join(keywords or []),
+        "hashtags": ", ".join(hashtags or []),
+        "max_words": max_words,
+    }
+
+
+def response_cache() -> ResponseCache:
+    """The process-wide response cache (configured from GROQ_RESPONSE_CACHE etc. when first used)."""
+    global _response_cache
+    with _response_cache_lock:
+        if _response_cache is None:
+            _response_cache = cache_from_env()
+        return _response_cache
+
+
+def _cache_lookup(backend: LLMBackend, inputs: dict, n: int, use_cache: bool) -> tuple[list[bytes], list[str | None]]:
+    # Variations 0..n-1 of this prompt; None where the model has to be called.
+    # use_cache=False neither reads nor writes the cache (fresh results).
+    keys = [response_key(backend.model, backend.render(inputs), i) for i in range(n)]
+    if not use_cache:
+        print("LLM response cache: skipped (fresh results requested)")
+        return keys, [None] * n
+    cache = response_cache()
+    texts = [None] * n if cache_bypassed() else cache.get_many(keys)
+    hits = sum(text is not None for text in texts)
+    stats = cache.stats()
+    print(
+        f"LLM response cache: {hits} hits, {n - hits} misses for this run "
+        f"(total {stats['hits']} hits / {stats['misses']} misses, {stats['entries']} entries)"
+    )
+    return keys, texts
+
+
+def _fill_missing(
+    backend: LLMBackend,
+    keys: list[bytes],
+    texts: list[str | None],
+    missing: list[int],
+    generated: list[str],
+    use_cache: bool,
+) -> list[str]:
+    for i, text in zip(missing, generated):
+        texts[i] = text
+    if use_cache:
+        response_cache().put_many(backend.model, {keys[i]: texts[i] for i in missing})
+    return texts
+
+
+def _cached_batch(backend: LLMBackend, inputs: dict, n: int, use_cache: bool, call) -> list[str]:
+    keys, texts = _cache_lookup(backend, inputs, n, use_cache)
+    missing = [i for i, text in enumerate(texts) if text is None]
+    return _fill_missing(backend, keys, texts, missing, call(len(missing)), use_cache) if missing else texts
+
+
+def _single_request(backend: LLMBackend, inputs: dict, k: int, config: dict) -> list[str]:
+    posts = parse_variations(backend.multi_chain.invoke({**inputs, "n": k}), k) if k > 1 else []
+    if len(posts) < k:
+        if k > 1:
+            print(f"[WARN] Multi-variation response gave {len(posts)} of {k} posts; generating the rest one by one")
+        posts += backend.chain.batch([inputs] * (k - len(posts)), config=config)
+    return posts
+
+
+async def _asingle_request(backend: LLMBackend, inputs: dict, k: int, config: dict) -> list[str]:
+    posts = parse_variations(await backend.multi_chain.ainvoke({**inputs, "n": k}), k) if k > 1 else []
+    if len(posts) < k:
+        if k > 1:
+            print(f"[WARN] Multi-variation response gave {len(posts)} of {k} posts; generating the rest one by one")
+        posts += await backend.chain.abatch([inputs] * (k - len(posts)), config=config)
+    return posts
+
+
+def generate_content(topic: str,tone: str ,max_words: int ,keywords: list[str] | None = None,hashtags: list[str] | None = None,use_cache: bool = True,) -> str:
+    """
+    Uses the LLM backend (Groq by default) to generate short marketing posts.
+    Repeated requests are answered from the response cache; use_cache=False
+    always calls the model and leaves the cache untouched.
     """
-)
+    backend = get_llm_backend()
+    inputs = _prompt_inputs(topic, tone, max_words, keywords, hashtags)
+    return _cached_batch(backend, inputs, 1, use_cache, lambda _: [backend.chain.invoke(inputs)])[0]
 
-chain = prompt | llm | parser
 
+def generate_contents(
+    topic: str,
+    tone: str,
+    max_words: int,
+    n: int,
+    keywords: list[str] | None = None,
+    hashtags: list[str] | None = None,
+    max_concurrency: int | None = None,
+    use_cache: bool = True,
+    mode: str | None = None,
+) -> list[str]:
+    """
+    n posts for the same prompt. In "batch" mode they are requested concurrently
+    (at most max_concurrency calls in flight) through the chain's batch interface;
+    in "single_request" mode with one request (see GENERATION_MODES). Posts come
+    back in request order; the first failed call raises, as with generate_content.
+    Variations already in the response cache are not requested again.
+    """
+    backend = get_llm_backend()
+    inputs = _prompt_inputs(topic, tone, max_words, keywords, hashtags)
+    config = {"max_concurrency": _max_concurrency(max_concurrency)}
+    if _generation_mode(mode) == "single_request":
+        return _cached_batch(backend, inputs, n, use_cache, lambda k: _single_request(backend, inputs, k, config))
+    return _cached_batch(backend, inputs, n, use_cache, lambda k: backend.chain.batch([inputs] * k, config=config))
+
+
+async def agenerate_contents(
+    topic: str,
+    tone: str,
+    max_words: int,
+    n: int,
+    keywords: list[str] | None = None,
+    hashtags: list[str] | None = None,
+    max_concurrency: int | None = None,
+    use_cache: bool = True,
+    mode: str | None = None,
+) -> list[str]:
+    """Async generate_contents, for callers already running an event loop."""
+    backend = get_llm_backend()
+    inputs = _prompt_inputs(topic, tone, max_words, keywords, hashtags)
+    keys, texts = _cache_lookup(backend, inputs, n, use_cache)
+    missing = [i for i, text in enumerate(texts) if text is None]
+    if not missing:
+        return texts
+    config = {"max_concurrency": _max_concurrency(max_concurrency)}
+    if _generation_mode(mode) == "single_request":
+        generated = await _asingle_request(backend, inputs, len(missing), config)
+    else:
+        generated = await backend.chain.abatch([inputs] * len(missing), config=config)
+    return _fill_missing(backend, keys, texts, missing, generated, use_cache)
+
+class StreamEvent(NamedTuple):
+    variation: int  # 0-based, in request order
+    delta: str  # new text since the previous event for this variation
+    text: str  # text so far
+    done: bool
 
-def generate_content(topic: str,tone: str ,max_words: int ,keywords: list[str] | None = None,hashtags: list[str] | None = None,) -> str:
+
+def stream_contents(
+    topic: str,
+    tone: str,
+    max_words: int,
+    n: int,
+    keywords: list[str] | None = None,
+    hashtags: list[str] | None = None,
+    max_concurrency: int | None = None,
+    use_cache: bool = True,
+) -> Iterator[StreamEvent]:
     """
-    Uses Groq model to generate short marketing posts.
+    generate_contents as a stream of tokens: variations are streamed concurrently
+    (chain.stream, at most max_concurrency at once) and events for different
+    variations interleave as chunks arrive. Cached variations arrive as one done
+    event up front; finished ones are written to the response cache. Events are
+    yielded on the calling thread, so UI code can render them directly.
     """
-    keyword_text = ", ".join(keywords or [])
-    hashtag_text = ", ".join(hashtags or [])
-
-    return chain.invoke(
-        {
-            "topic": topic,
-            "tone": tone,
-            "keywords": keyword_text,
-            "hashtags": hashtag_text,
-            "max_words": max_words,
-        }
-    )
\ No newline at end of file
+    backend = get_llm_backend()
+    inputs = _prompt_inputs(topic, tone, max_words, keywords, hashtags)
+    keys, texts = _cache_lookup(backend, inputs, n, use_cache)
+    for i, text in enumerate(texts):
+        if text is not None:
+            yield StreamEvent(i, text, text, True)
+    missing = [i for i, text in enumerate(texts) if text is None]
+    if not missing:
+        return
+
+    chunks: "queue.Queue[tuple[int, str | BaseException | None]]" = queue.Queue()
+
+    def stream_one(i: int) -> None:
+        try:
+            for chunk in backend.chain.stream(inputs):
+                chunks.put((i, chunk))
+            chunks.put((i, None))
+        except BaseException as exc:
+            chunks.put((i, exc))
+
+    partial = {i: "" for i in missing}
+    executor = ThreadPoolExecutor(max_workers=min(_max_concurrency(max_concurrency), len(missing)))
+    try:
+        for i in missing:
+            executor.submit(stream_one, i)
+        pending = len(missing)
+        while pending:
+            i, chunk = chunks.get()
+            if isinstance(chunk, BaseException):
+                raise chunk
+            if chunk is None:
+                pending -= 1
+                texts[i] = partial[i]
+                if use_cache:
+                    response_cache().put(backend.model, keys[i], texts[i])
+                yield StreamEvent(i, "", partial[i], True)
+            elif chunk:
+                partial[i] += chunk
+                yield StreamEvent(i, chunk, partial[i], False)
+    finally:
+        # On error (or when the consumer stops early) do not wait for the other streams.
+        executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,184 @@
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+DEFAULT_CACHE_PATH = PROJECT_ROOT / "data" / "cache" / "llm_responses.sqlite"
+
+# GROQ_RESPONSE_CACHE=<path.sqlite> moves the cache, "off" disables it.
+# GROQ_CACHE_TTL (seconds) and GROQ_CACHE_MAX_ENTRIES bound what is kept;
+# GROQ_CACHE_BYPASS=1 always calls the model (fresh responses still replace cached ones).
+CACHE_PATH_ENV = "GROQ_RESPONSE_CACHE"
+CACHE_TTL_ENV = "GROQ_CACHE_TTL"
+CACHE_MAX_ENTRIES_ENV = "GROQ_CACHE_MAX_ENTRIES"
+CACHE_BYPASS_ENV = "GROQ_CACHE_BYPASS"
+DEFAULT_TTL_SECONDS = 7 * 24 * 3600
+DEFAULT_MAX_ENTRIES = 10_000
+
+
+def response_key(model: str, rendered_prompt: str, variation: int) -> bytes:
+    # The variation index keeps N variations of one prompt as N distinct entries.
+    payload = "\0".join([model, str(variation), rendered_prompt])
+    return hashlib.blake2b(payload.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+
+
+class ResponseCache:
+    """
+    LLM responses in a SQLite file, keyed by response_key. Entries older than
+    ttl_seconds are treated as misses; past max_entries the least recently used
+    are evicted. Safe to share between threads.
+    """
+
+    def __init__(
+        self,
+        path: str | Path | None = DEFAULT_CACHE_PATH,
+        ttl_seconds: float | None = DEFAULT_TTL_SECONDS,
+        max_entries: int | None = DEFAULT_MAX_ENTRIES,
+    ):
+        self.path = Path(path) if path else None
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._db = self._open_db(self.path) if self.path is not None else None
+
+    @staticmethod
+    def _open_db(path: Path) -> sqlite3.Connection | None:
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            db = sqlite3.connect(str(path), check_same_thread=False)
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key BLOB PRIMARY KEY, model TEXT, response TEXT, created_at REAL, accessed_at REAL)"
+            )
+            db.execute("CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed_at)")
+            db.commit()
+            return db
+        except Exception as exc:
+            print(f"[WARN] LLM response cache unavailable at {path}: {exc}")
+            return None
+
+    @property
+    def enabled(self) -> bool:
+        return self._db is not None
+
+    def _expired(self, created_at: float, now: float) -> bool:
+        return self.ttl_seconds is not None and now - created_at > self.ttl_seconds
+
+    def get_many(self, keys: Iterable[bytes]) -> List[str | None]:
+        keys = list(keys)
+        if self._db is None:
+            return [None] * len(keys)
+        now = time.time()
+        found: List[str | None] = []
+        with self._lock:
+            for key in keys:
+                row = self._db.execute("SELECT response, created_at FROM responses WHERE key = ?", (key,)).fetchone()
+                if row is not None and self._expired(row[1], now):
+                    self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+                    row = None
+                if row is None:
+                    self.misses += 1
+                    found.append(None)
+                else:
+                    self.hits += 1
+                    self._db.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+                    found.append(row[0])
+            self._db.commit()
+        return found
+
+    def get(self, key: bytes) -> str | None:
+        return self.get_many([key])[0]
+
+    def put_many(self, model: str, items: Dict[bytes, str]) -> None:
+        if self._db is None or not items:
+            return
+        now = time.time()
+        with self._lock:
+            self._db.executemany(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?)",
+                [(key, model, response, now, now) for key, response in items.items()],
+            )
+            self._evict_locked(now)
+            self._db.commit()
+
+    def put(self, model: str, key: bytes, response: str) -> None:
+        self.put_many(model, {key: response})
+
+    def _evict_locked(self, now: float) -> None:
+        evicted = 0
+        if self.ttl_seconds is not None:
+            evicted += self._db.execute("DELETE FROM responses WHERE created_at < ?", (now - self.ttl_seconds,)).rowcount
+        if self.max_entries is not None:
+            count = self._db.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+            if count > self.max_entries:
+                evicted += self._db.execute(
+                    "DELETE FROM responses WHERE key IN (SELECT key FROM responses ORDER BY accessed_at LIMIT ?)",
+                    (count - self.max_entries,),
+                ).rowcount
+        self.evictions += evicted
+
+    def clear(self) -> None:
+        with self._lock:
+            self.hits = self.misses = self.evictions = 0
+            if self._db is not None:
+                self._db.execute("DELETE FROM responses")
+                self._db.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    def __len__(self) -> int:
+        if self._db is None:
+            return 0
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    def stats(self) -> dict:
+        entries = len(self)
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else None,
+                "evictions": self.evictions,
+                "entries": entries,
+                "path": str(self.path or ""),
+            }
+
+
+def cache_bypassed() -> bool:
+    return os.getenv(CACHE_BYPASS_ENV, "").strip().lower() in ("1", "true", "yes", "on")
+
+
+def _env_number(name: str, default, cast):
+    value = os.getenv(name)
+    if value is None or value.strip() == "":
+        return default
+    try:
+        number = cast(value)
+    except ValueError:
+        return default
+    # 0 or less: no limit.
+    return number if number > 0 else None
+
+
+def cache_from_env() -> ResponseCache:
+    path = os.getenv(CACHE_PATH_ENV) or DEFAULT_CACHE_PATH
+    if str(path).strip().lower() in ("off", "0", "false", "none"):
+        path = None
+    return ResponseCache(
+        path,
+        _env_number(CACHE_TTL_ENV, DEFAULT_TTL_SECONDS, float),
+        _env_number(CACHE_MAX_ENTRIES_ENV, DEFAULT_MAX_ENTRIES, int),
+    )
@@ -0,0 +1,54 @@
+import json
+import re
+from typing import Any, List
+
+# ```json ... ``` fences some models wrap structured output in.
+CODE_FENCE_RE = re.compile(r"^\s*```[\w-]*\s*\n?|\n?\s*```\s*$")
+# Keys a model might put each post under when it returns objects instead of strings.
+TEXT_KEYS = ("text", "post", "content", "variation", "body")
+
+
+def _as_text(item: Any) -> str | None:
+    if isinstance(item, str):
+        return item
+    if isinstance(item, dict):
+        for key in TEXT_KEYS:
+            if isinstance(item.get(key), str):
+                return item[key]
+    return None
+
+
+def _load_json(raw: str) -> Any:
+    text = CODE_FENCE_RE.sub("", raw.strip())
+    try:
+        return json.loads(text)
+    except ValueError:
+        pass
+    # Prose around the array: parse from the first "[" to the last "]".
+    start, end = text.find("["), text.rfind("]")
+    if start == -1 or end <= start:
+        return None
+    try:
+        return json.loads(text[start : end + 1])
+    except ValueError:
+        return None
+
+
+def parse_variations(raw: str, n: int) -> List[str]:
+    """
+    Up to n distinct, non-empty posts from a multi-variation response (a JSON array
+    of strings, or of objects with a text/post field, optionally under a
+    "variations"/"posts" key or inside a code fence). Returns [] when nothing
+    parses; callers generate whatever is missing one by one.
+    """
+    data = _load_json(raw or "")
+    if isinstance(data, dict):
+        data = next((data[k] for k in ("variations", "posts") if isinstance(data.get(k), list)), None)
+    if not isinstance(data, list):
+        return []
+    posts: List[str] = []
+    for item in data:
+        text = _as_text(item)
+        if text is not None and text.strip() and text.strip() not in posts:
+            posts.append(text.strip())
+    return posts[:n]
@@ -0,0 +1,118 @@
+import re
+import zlib
+from collections import defaultdict
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
+
+import numpy as np
+
+TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+URL_RE = re.compile(r"https?://\S+")
+# Matches normalization.near_duplicates.threshold in configs/config.yaml.
+DEFAULT_THRESHOLD = 0.85
+
+# Universal hash family h(x) = (a * x + b) mod P over 32-bit shingle hashes.
+# With a, x < 2**32 the product fits in uint64, so no overflow.
+_PRIME = np.uint64(4294967291)  # largest prime below 2**32
+_SEED = 20251127
+
+
+def choose_bands(num_perm: int, threshold: float) -> Tuple[int, int]:
+    """
+    Pick (bands, rows) with bands * rows == num_perm whose LSH S-curve midpoint
+    (1 / bands) ** (1 / rows) is the highest one not above the threshold.
+    Candidates are verified against the signatures afterwards, so erring towards
+    more candidates only costs comparisons while erring the other way loses matches.
+    """
+    best = (num_perm, 1)
+    for rows in range(1, num_perm + 1):
+        if num_perm % rows == 0 and (1.0 / (num_perm // rows)) ** (1.0 / rows) <= threshold:
+            best = (num_perm // rows, rows)
+    return best
+
+
+class NearDuplicateIndex:
+    """
+    MinHash signatures over word shingles with an LSH band index.
+
+    `is_duplicate(text, platform)` returns True when an already indexed text has
+    an estimated Jaccard similarity >= threshold; otherwise the text is added to
+    the index. Each text costs O(num_perm + shingles) plus a lookup in `bands`
+    buckets, so a full pass is roughly linear in the number of posts. With
+    cross_platform=False, matches are only considered within the same platform.
+    """
+
+    def __init__(
+        self,
+        threshold: float = DEFAULT_THRESHOLD,
+        num_perm: int = 64,
+        shingle_size: int = 3,
+        cross_platform: bool = True,
+    ):
+        if not 0.0 < threshold <= 1.0:
+            raise ValueError(f"threshold must be in (0, 1], got {threshold}")
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        self.cross_platform = cross_platform
+        self.bands, self.rows = choose_bands(num_perm, threshold)
+        rng = np.random.default_rng(_SEED)
+        self._a = rng.integers(1, int(_PRIME), size=(num_perm, 1), dtype=np.uint64)
+        self._b = rng.integers(0, int(_PRIME), size=(num_perm, 1), dtype=np.uint64)
+        self._buckets: List[Dict[Tuple[str, bytes], List[int]]] = [defaultdict(list) for _ in range(self.bands)]
+        self._signatures: List[np.ndarray] = []
+
+    def shingles(self, text: str) -> np.ndarray:
+        tokens = TOKEN_RE.findall(URL_RE.sub(" ", text.lower()))
+        k = self.shingle_size
+        if len(tokens) >= k:
+            grams = {" ".join(tokens[i:i + k]) for i in range(len(tokens) - k + 1)}
+        else:
+            grams = set(tokens)
+        return np.fromiter((zlib.crc32(g.encode("utf-8")) for g in grams), dtype=np.uint64, count=len(grams))
+
+    def signature(self, text: str) -> np.ndarray | None:
+        hashed = self.shingles(text)
+        if hashed.size == 0:
+            return None
+        return ((self._a * hashed[None, :] + self._b) % _PRIME).min(axis=1).astype(np.uint32)
+
+    def _band_keys(self, platform: str, sig: np.ndarray) -> Iterator[Tuple[int, Tuple[str, bytes]]]:
+        scope = "" if self.cross_platform else platform
+        for band in range(self.bands):
+            yield band, (scope, sig[band * self.rows:(band + 1) * self.rows].tobytes())
+
+    def is_duplicate(self, text: str, platform: str = "") -> bool:
+        sig = self.signature(text)
+        if sig is None:
+            return False
+        keys = list(self._band_keys(platform, sig))
+        checked: set[int] = set()
+        for band, key in keys:
+            for doc_id in self._buckets[band].get(key, ()):
+                if doc_id in checked:
+                    continue
+                checked.add(doc_id)
+                if np.mean(self._signatures[doc_id] == sig) >= self.threshold:
+                    return True
+        doc_id = len(self._signatures)
+        self._signatures.append(sig)
+        for band, key in keys:
+            self._buckets[band][key].append(doc_id)
+        return False
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+
+def iter_near_dedupe_rows(
+    rows: Iterable[Any],
+    index: NearDuplicateIndex,
+    stats: Dict[str, int] | None = None,
+) -> Iterator[Any]:
+    """Drop posts whose text near-duplicates an earlier post (first occurrence wins)."""
+    for r in rows:
+        if index.is_duplicate(r.text or "", r.platform):
+            if stats is not None:
+                stats[r.platform] = stats.get(r.platform, 0) + 1
+            continue
+        yield r
@@ -1,13 +1,25 @@
-﻿import json
+﻿import argparse
+import json
 import re
 import sys
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import List, Dict, Any, Tuple
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Tuple
 
+import numpy as np
 import pandas as pd
 import yaml
 
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.append(str(PROJECT_ROOT))
+
+from src.engagement_data import TypedEngagementWriter, pa, write_typed_engagement
+from src.near_duplicates import DEFAULT_THRESHOLD, NearDuplicateIndex, iter_near_dedupe_rows
+from src.raw_data import RAW_SCHEMAS, iter_raw_csv_chunks, read_raw_csv
+
 WHITESPACE_RE = re.compile(r"[ \t]+")
 LINEBREAK_RE = re.compile(r"\s*\n\s*")
 HASHTAG_RE = re.compile(r"#([\w\d_]+)", re.UNICODE)
@@ -19,6 +31,7 @@ TARGET_COLUMNS = [
     "author_id",
     "author_name",
     "posted_at",
+    "posted_at_epoch",
     "text",
     "url",
     "like_count",
@@ -53,6 +66,7 @@ def base_row(platform: str) -> Dict[str, Any]:
         "author_id": "",
         "author_name": "",
         "posted_at": "",
+        "posted_at_epoch": "",
         "text": "",
         "url": "",
         "like_count": 0,
@@ -71,6 +85,50 @@ def base_row(platform: str) -> Dict[str, Any]:
     }
 
 
+# Internal column carried from the twitter normalizers to enrich (not written out).
+FOLLOWERS_COLUMN = "_followers"
+RECORD_FIELDS = tuple(TARGET_COLUMNS) + (FOLLOWERS_COLUMN,)
+
+
+class NormalizedPost:
+    """
+    One normalized post between normalize and the output frame. Slots instead of
+    a per-post dict keep the filter/dedupe/enrich stages several times smaller;
+    the stages pass the same objects along and update them in place. platform
+    and language are interned since they repeat on every post.
+    """
+
+    __slots__ = RECORD_FIELDS
+
+    def __init__(self, *values: Any):
+        for name, value in zip(RECORD_FIELDS, values):
+            setattr(self, name, value)
+        if isinstance(self.platform, str):
+            self.platform = sys.intern(self.platform)
+        if isinstance(self.language, str):
+            self.language = sys.intern(self.language)
+
+    def __getstate__(self) -> Tuple[Any, ...]:
+        return tuple(getattr(self, name) for name in RECORD_FIELDS)
+
+    def __setstate__(self, state: Tuple[Any, ...]) -> None:
+        self.__init__(*state)
+
+    @classmethod
+    def from_dict(cls, row: Dict[str, Any]) -> "NormalizedPost":
+        return cls(*(row.get(name, RECORD_DEFAULTS[name]) for name in RECORD_FIELDS))
+
+
+def records_from_dicts(rows: List[Dict[str, Any]]) -> List[NormalizedPost]:
+    return [NormalizedPost.from_dict(r) for r in rows]
+
+
+def records_to_frame(records: List[NormalizedPost]) -> pd.DataFrame:
+    """Output columns built straight from the record slots (no intermediate dicts)."""
+    data = {col: [getattr(r, col) for r in records] for col in TARGET_COLUMNS}
+    return pd.DataFrame(data, columns=TARGET_COLUMNS).fillna("")
+
+
 def safe_int(value: Any) -> int:
     try:
         if pd.isna(value):
@@ -327,40 +385,367 @@ def normalize_pinterest(df: pd.DataFrame) -> List[Dict[str, Any]]:
     return rows
 
 
-def filter_rows(rows: List[Dict[str, Any]], languages: List[str], min_len: int) -> List[Dict[str, Any]]:
-    filtered: List[Dict[str, Any]] = []
+# Columnar normalizers: same output as the row-wise functions above, but computed
+# on whole columns. Cells the fast paths cannot handle fall back to the scalar helpers.
+COLUMN_DEFAULTS: Dict[str, Any] = base_row("")
+RECORD_DEFAULTS: Dict[str, Any] = {**COLUMN_DEFAULTS, FOLLOWERS_COLUMN: 0}
+
+
+def _column(df: pd.DataFrame, col: str) -> pd.Series:
+    if col in df.columns:
+        return df[col]
+    return pd.Series([None] * len(df), index=df.index, dtype=object)
+
+
+def _str_cells(df: pd.DataFrame, col: str) -> pd.Series:
+    """String cells of a column; anything that is not a str becomes NaN."""
+    s = _column(df, col)
+    if s.dtype != object and not pd.api.types.is_string_dtype(s):
+        return pd.Series(np.nan, index=df.index, dtype=object)
+    return s.where(s.map(lambda v: isinstance(v, str)))
+
+
+def _safe_str_col(df: pd.DataFrame, col: str) -> pd.Series:
+    s = _column(df, col)
+    out = s.astype(str).str.strip()
+    return out.mask(s.isna(), "")
+
+
+def _stripped_or_empty(df: pd.DataFrame, col: str) -> pd.Series:
+    # Vectorized `(row.get(col) or "").strip()`.
+    return _str_cells(df, col).str.strip().fillna("")
+
+
+def _safe_int_col(df: pd.DataFrame, col: str) -> pd.Series:
+    s = _column(df, col)
+    numeric = pd.to_numeric(s, errors="coerce").astype(float)
+    fast = np.isfinite(numeric) & (numeric.abs() < 2**63)
+    out = pd.Series(0, index=df.index, dtype="int64")
+    out[fast] = np.trunc(numeric[fast]).astype("int64")
+    slow = ~fast & s.notna()
+    if slow.any():
+        out[slow] = s[slow].map(safe_int)
+    return out
+
+
+def _clean_text_col(text: pd.Series, max_len: int = 3000) -> pd.Series:
+    text = text.fillna("").str.strip()
+    # LINEBREAK_RE backtracks over every whitespace run; only multi-line cells need it.
+    multiline = text.str.contains("\n", regex=False)
+    if multiline.any():
+        text = text.mask(multiline, text[multiline].str.replace(LINEBREAK_RE, "\n", regex=True))
+    return (
+        text.str.replace(WHITESPACE_RE, " ", regex=True)
+        .str.slice(0, max_len)
+        .str.strip()
+    )
+
+
+def _join_text_col(df: pd.DataFrame, title_col: str, body_col: str, max_len: int = 3000) -> pd.Series:
+    title = _stripped_or_empty(df, title_col)
+    body = _stripped_or_empty(df, body_col)
+    sep = pd.Series("", index=df.index, dtype=object).mask((title != "") & (body != ""), "\n\n")
+    return _clean_text_col(title + sep + body, max_len=max_len)
+
+
+def _pipe_tags_col(df: pd.DataFrame, col: str) -> pd.Series:
+    # Vectorized "|"-split, strip, lower and drop-empty of a tags column.
+    tags = _str_cells(df, col).str.lower()
+    tags = tags.str.replace(r"\s*\|\s*", "|", regex=True).str.strip()
+    tags = tags.str.replace(r"\|{2,}", "|", regex=True).str.strip("|")
+    return tags.fillna("")
+
+
+def _hashtags_col(text: pd.Series) -> pd.Series:
+    return text.fillna("").str.findall(HASHTAG_RE).str.join("|").str.lower()
+
+
+def _lower_lang_col(df: pd.DataFrame, col: str) -> pd.Series:
+    return _stripped_or_empty(df, col).str.lower()
+
+
+def _iso_utc(ts: pd.Series) -> pd.Series:
+    """Vectorized `Timestamp.isoformat()` for valid UTC timestamps."""
+    values = ts.dt.tz_convert("UTC").dt.tz_localize(None).to_numpy(dtype="datetime64[ns]")
+    seconds = values.astype("datetime64[s]").astype(str)
+    sub_ns = (values - values.astype("datetime64[s]")).astype("int64")
+    micros = pd.Series(sub_ns // 1000, index=ts.index).astype(str).str.zfill(6)
+    nanos = pd.Series(sub_ns % 1000, index=ts.index).astype(str).str.zfill(3)
+    frac = pd.Series("", index=ts.index, dtype=object)
+    frac = frac.mask(sub_ns > 0, "." + micros)
+    frac = frac.mask(sub_ns % 1000 > 0, "." + micros + nanos)
+    return pd.Series(seconds, index=ts.index) + frac + "+00:00"
+
+
+def _epoch_seconds(ts: pd.Series) -> pd.Series:
+    """Whole UTC epoch seconds (floored) for parsed timestamps, "" where missing."""
+    out = pd.Series("", index=ts.index, dtype=object)
+    ok = ts.notna()
+    if ok.any():
+        out[ok] = ts[ok].astype("int64") // 10**9
+    return out
+
+
+def posted_epoch_col(posted_at: pd.Series) -> pd.Series:
+    """posted_at_epoch for a column of normalized ISO posted_at strings."""
+    return _epoch_seconds(pd.to_datetime(posted_at, utc=True, errors="coerce", format="ISO8601"))
+
+
+def add_posted_epoch(rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Fill posted_at_epoch on row-wise normalizer output with one batch parse."""
+    if rows:
+        epochs = posted_epoch_col(pd.Series([r["posted_at"] for r in rows], dtype=object))
+        for r, epoch in zip(rows, epochs):
+            r["posted_at_epoch"] = epoch
+    return rows
+
+
+def _posted_at_cols(df: pd.DataFrame, col: str) -> Dict[str, pd.Series]:
+    """posted_at/posted_at_epoch from a date column, parsed once for the whole column."""
+    s = _column(df, col)
+    strings = _str_cells(df, col)
+    parsed = pd.to_datetime(strings, utc=True, errors="coerce", format="ISO8601")
+    # Non-ISO strings and non-string values go through the scalar parser.
+    slow = parsed.isna() & s.notna() & (strings != "")
+    if slow.any():
+        parsed[slow] = pd.to_datetime(s[slow].map(parse_datetime), utc=True, errors="coerce", format="ISO8601")
+    out = pd.Series("", index=df.index, dtype=object)
+    ok = parsed.notna()
+    if ok.any():
+        out[ok] = _iso_utc(parsed[ok])
+    return {"posted_at": out, "posted_at_epoch": _epoch_seconds(parsed)}
+
+
+def _posted_at_epoch_cols(df: pd.DataFrame, col: str) -> Dict[str, pd.Series]:
+    """posted_at/posted_at_epoch from an epoch-seconds column; the epoch is kept as is (floored)."""
+    s = _column(df, col)
+    out = pd.Series("", index=df.index, dtype=object)
+    numeric = pd.to_numeric(s, errors="coerce").astype(float)
+    # Whole seconds inside the datetime64[ns] range format identically to datetime.isoformat().
+    fast = np.isfinite(numeric) & (numeric == np.floor(numeric)) & (numeric.abs() < 9.2e9)
+    if fast.any():
+        ts = pd.to_datetime(numeric[fast].astype("int64"), unit="s", utc=True)
+        out[fast] = _iso_utc(ts)
+    slow = ~fast & s.notna()
+    if slow.any():
+        out[slow] = s[slow].map(epoch_to_iso)
+    # Slow-path values are non-numeric or fractional; re-read their ISO form so
+    # the epoch matches what the row-wise path derives from posted_at.
+    epoch = pd.Series("", index=df.index, dtype=object)
+    if fast.any():
+        epoch[fast] = numeric[fast].astype("int64")
+    if slow.any():
+        epoch[slow] = posted_epoch_col(out[slow])
+    return {"posted_at": out, "posted_at_epoch": epoch}
+
+
+def _frame_from_columns(platform: str, length: int, columns: Dict[str, Any]) -> pd.DataFrame:
+    # Every Series was built on the raw frame's index, so positions line up.
+    data: Dict[str, Any] = {}
+    for col in TARGET_COLUMNS:
+        data[col] = columns[col] if col in columns else COLUMN_DEFAULTS[col]
+    data["platform"] = platform
+    extra = [col for col in columns if col not in TARGET_COLUMNS]
+    for col in extra:
+        data[col] = columns[col]
+    data = {col: value.to_numpy() if isinstance(value, pd.Series) else value for col, value in data.items()}
+    return pd.DataFrame(data, index=pd.RangeIndex(length), columns=TARGET_COLUMNS + extra)
+
+
+def normalize_youtube_columnar(df: pd.DataFrame) -> pd.DataFrame:
+    vid = _safe_str_col(df, "video_id")
+    video_url = _column(df, "video_url")
+    built_url = ("https://www.youtube.com/watch?v=" + vid).mask(vid == "", "")
+    # `row.get("video_url") or built_url`: NaN is truthy there and ends up as "" after fillna.
+    url = video_url.where(video_url.map(bool), built_url).fillna("")
+    thumbnails = _column(df, "thumbnail_url").tolist()
+    categories = _column(df, "category_id").tolist()
+    source_meta = [
+        json.dumps({"thumbnail_url": thumb, "category_id": cat})
+        for thumb, cat in zip(thumbnails, categories)
+    ]
+    return _frame_from_columns("youtube", len(df), {
+        "post_id": vid,
+        "author_id": _safe_str_col(df, "channel_id"),
+        "author_name": _safe_str_col(df, "channel_title"),
+        **_posted_at_cols(df, "publish_date"),
+        "text": _join_text_col(df, "title", "description"),
+        "url": url,
+        "like_count": _safe_int_col(df, "like_count"),
+        "comment_count": _safe_int_col(df, "comment_count"),
+        "view_count": _safe_int_col(df, "view_count"),
+        "tags": _pipe_tags_col(df, "tags"),
+        "language": _safe_str_col(df, "language").str.lower(),
+        "source_meta": source_meta,
+    })
+
+
+def normalize_twitter_columnar(df: pd.DataFrame) -> pd.DataFrame:
+    tweet_id = _safe_str_col(df, "tweet_id")
+    username = _safe_str_col(df, "author_username")
+    raw_text = _str_cells(df, "text")
+    has_url = (tweet_id != "") & (username != "")
+    url = ("https://twitter.com/" + username + "/status/" + tweet_id).where(has_url, "")
+    followers = _safe_int_col(df, "author_followers")
+    return _frame_from_columns("twitter", len(df), {
+        "post_id": tweet_id,
+        "author_id": _safe_str_col(df, "author_id"),
+        "author_name": username.where(username != "", _safe_str_col(df, "author_name")),
+        **_posted_at_cols(df, "created_at"),
+        "text": _clean_text_col(raw_text),
+        "url": url,
+        "like_count": _safe_int_col(df, "like_count"),
+        "comment_count": _safe_int_col(df, "reply_count"),
+        "share_count": _safe_int_col(df, "retweet_count") + _safe_int_col(df, "quote_count"),
+        "tags": _hashtags_col(raw_text),
+        "language": _lower_lang_col(df, "lang"),
+        "source_meta": '{"followers": ' + followers.astype(str) + "}",
+        FOLLOWERS_COLUMN: followers,
+    })
+
+
+def normalize_reddit_columnar(df: pd.DataFrame) -> pd.DataFrame:
+    author = _safe_str_col(df, "author")
+    url = _str_cells(df, "url")
+    permalink = _str_cells(df, "permalink")
+    url = url.where(url.fillna("") != "", permalink).str.strip().fillna("")
+    like_count = _safe_int_col(df, "ups")
+    comment_count = _safe_int_col(df, "num_comments")
+    crossposts = _column(df, "crosspost_parent_list").map(lambda v: len(v) if isinstance(v, list) else 0)
+    share_count = _safe_int_col(df, "num_crossposts")
+    share_count = share_count.where(share_count != 0, crossposts.astype("int64"))
+    view_count = _safe_int_col(df, "view_count")
+    derived_views = (like_count + comment_count + share_count).clip(lower=1)
+    view_count = view_count.where(view_count != 0, derived_views)
+    subreddit = _stripped_or_empty(df, "subreddit")
+    sub_tag = ("subreddit:" + subreddit.str.lower()).where(subreddit != "", "")
+    hashtags = _hashtags_col(_str_cells(df, "selftext"))
+    sep = pd.Series("", index=df.index, dtype=object).mask((sub_tag != "") & (hashtags != ""), "|")
+    return _frame_from_columns("reddit", len(df), {
+        "post_id": _safe_str_col(df, "id"),
+        "author_id": author,
+        "author_name": author,
+        **_posted_at_epoch_cols(df, "created_utc"),
+        "text": _join_text_col(df, "title", "selftext"),
+        "url": url,
+        "like_count": like_count,
+        "comment_count": comment_count,
+        "share_count": share_count,
+        "view_count": view_count,
+        "tags": sub_tag + sep + hashtags,
+        "language": _lower_lang_col(df, "language"),
+        "source_meta": subreddit.map(lambda sub: json.dumps({"subreddit": sub})),
+    })
+
+
+def normalize_pinterest_columnar(df: pd.DataFrame) -> pd.DataFrame:
+    author = _safe_str_col(df, "author")
+    link = _str_cells(df, "link")
+    fallback_url = _str_cells(df, "url")
+    url = link.where(link.fillna("") != "", fallback_url).str.strip().fillna("")
+    return _frame_from_columns("pinterest", len(df), {
+        "post_id": _safe_str_col(df, "pin_id"),
+        "author_id": author,
+        "author_name": author,
+        **_posted_at_cols(df, "created_at"),
+        "text": _join_text_col(df, "title", "description"),
+        "url": url,
+        "comment_count": _safe_int_col(df, "comment_count"),
+        "share_count": _safe_int_col(df, "repin_count"),
+        "tags": _pipe_tags_col(df, "tags"),
+        "language": _lower_lang_col(df, "language"),
+        "source_meta": json.dumps({}),
+    })
+
+
+NORMALIZERS = {
+    "youtube": (normalize_youtube, normalize_youtube_columnar),
+    "twitter": (normalize_twitter, normalize_twitter_columnar),
+    "reddit": (normalize_reddit, normalize_reddit_columnar),
+    "pinterest": (normalize_pinterest, normalize_pinterest_columnar),
+}
+ENGINES = ("rows", "columnar", "verify")
+
+
+def frame_to_records(frame: pd.DataFrame) -> List[NormalizedPost]:
+    columns = [
+        frame[name].tolist() if name in frame.columns else [RECORD_DEFAULTS[name]] * len(frame)
+        for name in RECORD_FIELDS
+    ]
+    return [NormalizedPost(*values) for values in zip(*columns)]
+
+
+def diff_normalized(rows: List[Dict[str, Any]], frame: pd.DataFrame) -> List[str]:
+    """Columns where row-wise and columnar output disagree (empty list = identical)."""
+    expected = pd.DataFrame(rows, columns=frame.columns).fillna("")
+    if len(expected) != len(frame):
+        return ["<row count>"]
+    return [
+        col for col in frame.columns
+        if expected[col].tolist() != frame[col].tolist()
+    ]
+
+
+def normalize_platform(platform: str, df: pd.DataFrame, engine: str = "rows") -> List[NormalizedPost]:
+    row_fn, columnar_fn = NORMALIZERS[platform]
+    if engine == "rows":
+        return records_from_dicts(add_posted_epoch(row_fn(df)))
+    frame = columnar_fn(df)
+    if engine == "verify":
+        rows = add_posted_epoch(row_fn(df))
+        mismatched = diff_normalized(rows, frame)
+        if mismatched:
+            raise RuntimeError(f"Columnar {platform} normalizer differs from row-wise output in: {', '.join(mismatched)}")
+        print(f"[verify] {platform}: columnar output matches row-wise ({len(rows)} rows)")
+        return records_from_dicts(rows)
+    return frame_to_records(frame)
+
+
+# The iter_* stages are generators so the streaming mode can chain them over
+# chunks; filter_rows/dedupe_rows/enrich_rows are the list versions.
+def iter_filter_rows(rows: Iterable[NormalizedPost], languages: List[str], min_len: int) -> Iterator[NormalizedPost]:
     lang_set = {lang.lower() for lang in languages if lang}
     for r in rows:
-        lang = (r["language"] or "").lower()
+        lang = (r.language or "").lower()
         if lang_set and lang and lang not in lang_set:
             continue
-        if len((r["text"] or "").strip()) < min_len:
+        if len((r.text or "").strip()) < min_len:
             continue
-        filtered.append(r)
-    return filtered
+        yield r
+
+
+def filter_rows(rows: List[NormalizedPost], languages: List[str], min_len: int) -> List[NormalizedPost]:
+    return list(iter_filter_rows(rows, languages, min_len))
 
 
-def dedupe_rows(rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+def iter_dedupe_rows(rows: Iterable[NormalizedPost]) -> Iterator[NormalizedPost]:
     seen: set[Tuple[str, str]] = set()
     seen_text: set[Tuple[str, str, str]] = set()
-    deduped: List[Dict[str, Any]] = []
     for r in rows:
-        key = (r["platform"], r["post_id"])
+        key = (r.platform, r.post_id)
         if key in seen:
             continue
-        text_key = (r["platform"], r["text"], r["posted_at"])
+        text_key = (r.platform, r.text, r.posted_at)
         if text_key in seen_text:
             continue
         seen.add(key)
         seen_text.add(text_key)
-        deduped.append(r)
-    return deduped
+        yield r
 
 
-def load_dataframe(path: Path) -> pd.DataFrame:
+def dedupe_rows(rows: List[NormalizedPost]) -> List[NormalizedPost]:
+    return list(iter_dedupe_rows(rows))
+
+
+def load_dataframe(path: Path, platform: str | None = None, quarantine_dir: Path | None = None) -> pd.DataFrame:
+    """Platform exports are read with their declared schema (see raw_data.RAW_SCHEMAS)."""
     if not path.exists():
         print(f"[WARN] Input file missing: {path}", file=sys.stderr)
         return pd.DataFrame()
+    if platform in RAW_SCHEMAS:
+        df, stats = read_raw_csv(path, platform, quarantine_dir)
+        stats.report()
+        return df
     try:
         return pd.read_csv(path)
     except pd.errors.ParserError:
@@ -368,88 +753,507 @@ def load_dataframe(path: Path) -> pd.DataFrame:
         return pd.read_csv(path, engine="python", on_bad_lines="skip")
 
 
-def enrich_rows(rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-    enriched: List[Dict[str, Any]] = []
-    now = datetime.now(timezone.utc)
+def iter_dataframe_chunks(
+    path: Path, chunksize: int, platform: str | None = None, quarantine_dir: Path | None = None
+) -> Iterator[pd.DataFrame]:
+    """Chunked load_dataframe: same C-engine-then-python fallback, without re-emitting rows."""
+    if not path.exists():
+        print(f"[WARN] Input file missing: {path}", file=sys.stderr)
+        return
+    if platform in RAW_SCHEMAS:
+        yield from iter_raw_csv_chunks(path, platform, chunksize, quarantine_dir)
+        return
+    emitted = 0
+    try:
+        with pd.read_csv(path, chunksize=chunksize) as reader:
+            for chunk in reader:
+                emitted += len(chunk)
+                yield chunk
+        return
+    except pd.errors.ParserError:
+        print(f"[WARN] ParserError for {path} after {emitted} rows, continuing with python engine + on_bad_lines='skip'")
+    # Every row before the C parser's first bad line was good, so the python
+    # engine yields the same rows first; drop the ones already emitted.
+    with pd.read_csv(path, chunksize=chunksize, engine="python", on_bad_lines="skip") as reader:
+        for chunk in reader:
+            if emitted >= len(chunk):
+                emitted -= len(chunk)
+                continue
+            yield chunk.iloc[emitted:]
+            emitted = 0
+
+
+def iter_enrich_rows(rows: Iterable[NormalizedPost]) -> Iterator[NormalizedPost]:
+    now = datetime.now(timezone.utc).timestamp()
     for r in rows:
-        text = (r["text"] or "").strip()
-        r["text_len"] = len(text)
-        like_count = safe_int(r["like_count"])
-        comment_count = safe_int(r["comment_count"])
-        share_count = safe_int(r["share_count"])
-        r["engagement_sum"] = like_count + comment_count + share_count
-        followers = safe_int(r.pop("_followers", 0))
+        text = (r.text or "").strip()
+        r.text_len = len(text)
+        like_count = safe_int(r.like_count)
+        comment_count = safe_int(r.comment_count)
+        share_count = safe_int(r.share_count)
+        r.engagement_sum = like_count + comment_count + share_count
+        followers = safe_int(r._followers)
         if followers > 0:
-            r["engagement_rate"] = round(r["engagement_sum"] / max(1, followers), 6)
-        else:
-            r["engagement_rate"] = 0.0
-        posted_at = r.get("posted_at")
-        if posted_at:
-            try:
-                posted_dt = pd.to_datetime(posted_at, utc=True)
-                if pd.notna(posted_dt):
-                    r["days_since_post"] = (now - posted_dt).days
-                else:
-                    r["days_since_post"] = ""
-            except Exception:
-                r["days_since_post"] = ""
+            r.engagement_rate = round(r.engagement_sum / max(1, followers), 6)
         else:
-            r["days_since_post"] = ""
-        r["sentiment"] = ""
-        enriched.append(r)
-    return enriched
+            r.engagement_rate = 0.0
+        epoch = r.posted_at_epoch
+        r.days_since_post = int((now - epoch) // 86400) if epoch not in ("", None) else ""
+        r.sentiment = ""
+        yield r
+
+
+def enrich_rows(rows: List[NormalizedPost]) -> List[NormalizedPost]:
+    return list(iter_enrich_rows(rows))
+
+
+# Incremental mode: the watermark per platform is {post_id: fingerprint of the raw row}
+# from the last run. Only rows with an unseen id or a different fingerprint are
+# normalized; they are merged into the existing combined dataset, replacing the
+# stored row for re-fetched posts (or removing it when the new version no longer
+# passes the filters). Posts that drop out of a raw export are kept.
+RAW_ID_COLUMNS = {
+    "youtube": "video_id",
+    "twitter": "tweet_id",
+    "reddit": "id",
+    "pinterest": "pin_id",
+}
+DEFAULT_RAW_PATHS = {
+    "youtube": "data/raw/youtube_search_200_results.csv",
+    "twitter": "data/raw/twitter_search_10_results.csv",
+    "reddit": "data/raw/reddit_search_100_results.csv",
+    "pinterest": "data/raw/pinterest_posts_detailed.csv",
+}
+COUNT_COLUMNS = ["like_count", "comment_count", "share_count", "view_count", "engagement_sum"]
+
+
+def load_watermarks(path: Path) -> Dict[str, Dict[str, str]]:
+    if not path.exists():
+        return {}
+    try:
+        with open(path, "r", encoding="utf-8") as fh:
+            return json.load(fh).get("platforms", {})
+    except (OSError, ValueError) as exc:
+        print(f"[WARN] Could not read normalization state {path}: {exc}; running a full rebuild", file=sys.stderr)
+        return {}
+
+
+def save_watermarks(path: Path, watermarks: Dict[str, Dict[str, str]]) -> None:
+    ensure_output_dir(path)
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as fh:
+        json.dump({"version": 1, "platforms": watermarks}, fh)
+    tmp_path.replace(path)
+
+
+def raw_fingerprints(platform: str, df: pd.DataFrame) -> pd.Series:
+    """Hex hash of each raw row, indexed by post id (first occurrence of an id wins)."""
+    if df.empty:
+        return pd.Series(dtype=object)
+    ids = _safe_str_col(df, RAW_ID_COLUMNS[platform])
+    hashes = pd.util.hash_pandas_object(df, index=False).map("{:016x}".format)
+    prints = pd.Series(hashes.to_numpy(), index=ids.to_numpy())
+    return prints[~prints.index.duplicated()]
+
+
+def changed_raw_rows(platform: str, df: pd.DataFrame, prints: pd.Series, seen: Dict[str, str]) -> pd.Series:
+    """Boolean mask over the raw frame: rows whose id is new or whose fingerprint moved."""
+    if df.empty:
+        return pd.Series(False, index=df.index)
+    previous = pd.Series(seen, dtype=object).reindex(prints.index)
+    changed_ids = prints.index[(previous != prints).to_numpy()]
+    return _safe_str_col(df, RAW_ID_COLUMNS[platform]).isin(changed_ids)
+
+
+def load_combined(path: Path) -> pd.DataFrame:
+    df = pd.read_csv(path, dtype=str, keep_default_na=False)
+    return df.reindex(columns=TARGET_COLUMNS, fill_value="")
+
+
+def merge_incremental(
+    existing: pd.DataFrame,
+    delta: pd.DataFrame,
+    refreshed: Iterable[Tuple[str, str]] = (),
+) -> pd.DataFrame:
+    """
+    Update re-fetched posts in place and append new ones, then refresh days_since_post.
+    `refreshed` holds the (platform, post_id) of every re-normalized raw row; stored
+    rows among them that are missing from the (filtered) delta are removed.
+    """
+    delta = delta.astype(str)
+    refreshed_keys = pd.MultiIndex.from_tuples(list(refreshed), names=["platform", "post_id"])
+    delta_keys = pd.MultiIndex.from_frame(delta[["platform", "post_id"]])
+    existing_keys = pd.MultiIndex.from_frame(existing[["platform", "post_id"]])
+    dropped = existing_keys.isin(refreshed_keys) & ~existing_keys.isin(delta_keys)
+    if dropped.any():
+        existing = existing[~dropped].reset_index(drop=True)
+        existing_keys = pd.MultiIndex.from_frame(existing[["platform", "post_id"]])
+    positions = pd.Series(np.arange(len(existing)), index=existing_keys)
+    positions = positions[~positions.index.duplicated()]
+    is_update = delta_keys.isin(positions.index)
+
+    merged = existing.copy()
+    if is_update.any():
+        merged.iloc[positions.loc[delta_keys[is_update]].to_numpy()] = delta[is_update].to_numpy()
+
+    additions = delta[~is_update]
+    text_keys = pd.MultiIndex.from_frame(existing[["platform", "text", "posted_at"]])
+    additions = additions[~pd.MultiIndex.from_frame(additions[["platform", "text", "posted_at"]]).isin(text_keys)]
+    print(
+        f"Merged incremental rows: {int(is_update.sum())} updated, {len(additions)} added, "
+        f"{int(dropped.sum())} removed (no longer pass filters)"
+    )
+    merged = pd.concat([merged, additions], ignore_index=True)
+    # Outputs written before posted_at_epoch existed get it backfilled from posted_at.
+    missing_epoch = (merged["posted_at_epoch"] == "") & (merged["posted_at"] != "")
+    if missing_epoch.any():
+        merged.loc[missing_epoch, "posted_at_epoch"] = posted_epoch_col(merged.loc[missing_epoch, "posted_at"])
+    merged["days_since_post"] = days_since_post_col(merged["posted_at_epoch"], datetime.now(timezone.utc))
+    return merged
+
+
+def days_since_post_col(posted_at_epoch: pd.Series, now: datetime) -> pd.Series:
+    epoch = pd.to_numeric(posted_at_epoch, errors="coerce")
+    days = (now.timestamp() - epoch) // 86400
+    return days.astype("Int64").astype(object).where(epoch.notna(), "")
+
 
-PROJECT_ROOT = Path(__file__).resolve().parent.parent
 def resolve_path(path_like: str | Path) -> Path:
     path = Path(path_like)
     return path if path.is_absolute() else PROJECT_ROOT / path
 
 
-def main():
+def parse_args(argv: List[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Normalize raw platform exports into the combined engagement dataset.")
+    parser.add_argument(
+        "--engine",
+        choices=ENGINES,
+        default=None,
+        help="rows = per-row reference path, columnar = vectorized path, verify = run both and compare.",
+    )
+    parser.add_argument(
+        "--incremental",
+        action=argparse.BooleanOptionalAction,
+        default=None,
+        help="Only normalize raw rows that are new or changed since the last run and merge them into the existing output.",
+    )
+    parser.add_argument(
+        "--typed-output",
+        default=None,
+        help="Also write a typed .arrow/.parquet copy of the output (empty string disables).",
+    )
+    parser.add_argument(
+        "--stream",
+        action=argparse.BooleanOptionalAction,
+        default=None,
+        help="Read raw CSVs in chunks and write output incrementally (bounded memory).",
+    )
+    parser.add_argument("--chunksize", type=int, default=None, help="Rows per chunk in streaming mode.")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Processes used to load/normalize platforms (and chunks when streaming); 1 runs in-process.",
+    )
+    parser.add_argument(
+        "--near-duplicates",
+        action=argparse.BooleanOptionalAction,
+        default=None,
+        help=(
+            "Drop near-duplicate texts (MinHash/LSH) after exact dedupe. Off by default. Incremental runs also "
+            "compare new rows against the existing output; streaming runs only within the current run."
+        ),
+    )
+    parser.add_argument(
+        "--near-dup-threshold",
+        type=float,
+        default=None,
+        help="Estimated Jaccard similarity of word shingles at which two texts count as near-duplicates.",
+    )
+    args = parser.parse_args(argv)
+    for option in ("chunksize", "workers"):
+        value = getattr(args, option)
+        if value is not None and value < 1:
+            parser.error(f"--{option} must be at least 1 (got {value})")
+    return args
+
+
+def near_duplicate_index(cfg: Dict[str, Any], args: argparse.Namespace) -> NearDuplicateIndex | None:
+    enabled = cfg.get("enabled", False) if args.near_duplicates is None else args.near_duplicates
+    if not enabled:
+        return None
+    return NearDuplicateIndex(
+        threshold=args.near_dup_threshold if args.near_dup_threshold is not None else cfg.get("threshold", DEFAULT_THRESHOLD),
+        num_perm=cfg.get("num_perm", 64),
+        shingle_size=cfg.get("shingle_size", 3),
+        cross_platform=cfg.get("cross_platform", True),
+    )
+
+
+def near_dedupe(rows: Iterable[NormalizedPost], index: NearDuplicateIndex | None, stats: Dict[str, int]) -> Iterable[NormalizedPost]:
+    return rows if index is None else iter_near_dedupe_rows(rows, index, stats)
+
+
+def seed_near_duplicate_index(
+    index: NearDuplicateIndex | None, existing: pd.DataFrame, skip: set[Tuple[str, str]]
+) -> None:
+    """Index stored rows (except those being re-normalized) so an incremental delta is checked against them."""
+    if index is None:
+        return
+    for platform, post_id, text in zip(existing["platform"], existing["post_id"], existing["text"]):
+        if (platform, post_id) not in skip:
+            index.is_duplicate(text, platform)
+
+
+def report_near_duplicates(index: NearDuplicateIndex | None, stats: Dict[str, int]) -> None:
+    if index is None:
+        return
+    dropped = ", ".join(f"{platform}={count}" for platform, count in sorted(stats.items())) or "none"
+    print(f"Near-duplicates dropped (threshold {index.threshold}, {index.bands}x{index.rows} LSH bands): {dropped}")
+
+
+def main(argv: List[str] | None = None):
+    args = parse_args(argv)
     cfg = load_config().get("normalization", {})
     languages = cfg.get("languages", ["en"])
     min_len = cfg.get("min_text_len", 15)
     raw_paths = cfg.get("raw_paths", {})
     output_path = resolve_path(cfg.get("output_path", "data/processed/combined_engagement_data.csv"))
+    engine = args.engine or cfg.get("engine", "rows")
+    incremental = cfg.get("incremental", False) if args.incremental is None else args.incremental
+    state_path = resolve_path(cfg.get("state_path", "data/cache/normalize_state.json"))
+    typed_output = args.typed_output if args.typed_output is not None else cfg.get("typed_output_path")
+    typed_output_path = resolve_path(typed_output) if typed_output else None
+    stream = cfg.get("stream", False) if args.stream is None else args.stream
+    chunksize = args.chunksize if args.chunksize is not None else cfg.get("chunksize", 50000)
+    workers = args.workers if args.workers is not None else cfg.get("workers", 1)
+    quarantine_dir = resolve_path(cfg.get("quarantine_dir", "data/quarantine"))
+    near_index = near_duplicate_index(cfg.get("near_duplicates", {}), args)
+    near_stats: Dict[str, int] = {}
 
+    if stream:
+        if incremental:
+            print("[WARN] Incremental mode is not available with --stream; running a full streaming rebuild", file=sys.stderr)
+        stream_normalize(
+            raw_paths, engine, languages, min_len, chunksize, output_path, typed_output_path, workers, near_index, quarantine_dir
+        )
+        return
 
-    youtube_df = load_dataframe(resolve_path(raw_paths.get("youtube", "data/raw/youtube_search_200_results.csv")))
-    twitter_df = load_dataframe(resolve_path(raw_paths.get("twitter", "data/raw/twitter_search_10_results.csv")))
-    reddit_df = load_dataframe(resolve_path(raw_paths.get("reddit", "data/raw/reddit_search_100_results.csv")))
-    pinterest_df = load_dataframe(resolve_path(raw_paths.get("pinterest", "data/raw/pinterest_posts_detailed.csv")))
     google_trends_df = load_dataframe(resolve_path(raw_paths.get("google_trends", "data/raw/google_trends_selected.csv")))
 
-    rows: List[Dict[str, Any]] = []
-    rows.extend(normalize_youtube(youtube_df))
-    rows.extend(normalize_twitter(twitter_df))
-    rows.extend(normalize_reddit(reddit_df))
-    rows.extend(normalize_pinterest(pinterest_df))
+    watermarks = load_watermarks(state_path)
+    incremental = incremental and output_path.exists() and bool(watermarks)
+    jobs = [
+        (
+            platform,
+            resolve_path(raw_paths.get(platform, DEFAULT_RAW_PATHS[platform])),
+            engine,
+            watermarks.get(platform, {}) if incremental else None,
+            quarantine_dir,
+        )
+        for platform in NORMALIZERS
+    ]
+    # Platforms are independent until filter/dedupe, so they can load and normalize in parallel.
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=min(workers, len(jobs))) as executor:
+            results = list(executor.map(load_and_normalize, *zip(*jobs)))
+    else:
+        results = [load_and_normalize(*job) for job in jobs]
+
+    rows: List[NormalizedPost] = []
+    fingerprints: Dict[str, pd.Series] = {}
+    skipped = 0
+    for (platform, *_), (platform_rows, prints, platform_skipped) in zip(jobs, results):
+        rows.extend(platform_rows)
+        fingerprints[platform] = prints
+        skipped += platform_skipped
     # rows.extend(normalize_google_trends(google_trends_df))
+    refreshed = {(r.platform, r.post_id) for r in rows} if incremental else set()
+    if incremental:
+        print(f"Incremental run: {len(rows)} new/changed rows normalized, {skipped} unchanged raw rows skipped")
 
     rows = filter_rows(rows, languages, min_len)
     rows = dedupe_rows(rows)
+    existing_df = load_combined(output_path) if incremental else None
+    if existing_df is not None:
+        seed_near_duplicate_index(near_index, existing_df, refreshed)
+    rows = list(near_dedupe(rows, near_index, near_stats))
     rows = enrich_rows(rows)
 
-    output_df = pd.DataFrame(rows, columns=TARGET_COLUMNS).fillna("")
-    for col in ["like_count", "comment_count", "share_count", "view_count", "engagement_sum"]:
+    output_df = records_to_frame(rows)
+    if existing_df is not None:
+        output_df = merge_incremental(existing_df, output_df, refreshed)
+    for col in COUNT_COLUMNS:
         output_df[col] = output_df[col].apply(safe_int)
 
     ensure_output_dir(output_path)
     output_df.to_csv(output_path, index=False, encoding="utf-8")
+    if typed_output_path is not None:
+        if pa is None:
+            print(f"[WARN] pyarrow not installed; skipping typed output {typed_output_path}", file=sys.stderr)
+        else:
+            write_typed_engagement(output_df, typed_output_path)
+            print(f"Saved typed dataset: {typed_output_path}")
+    for platform, prints in fingerprints.items():
+        seen = watermarks.get(platform, {}) if incremental else {}
+        seen.update(prints.to_dict())
+        watermarks[platform] = seen
+    save_watermarks(state_path, watermarks)
+
+    report_near_duplicates(near_index, near_stats)
+    summary = OutputSummary()
+    summary.add(output_df)
+    summary.report(output_path)
+
+
+def output_frame(rows: List[NormalizedPost]) -> pd.DataFrame:
+    output_df = records_to_frame(rows)
+    for col in COUNT_COLUMNS:
+        output_df[col] = output_df[col].apply(safe_int)
+    return output_df
+
+
+class OutputSummary:
+    """Run statistics accumulated batch by batch, so streaming runs can report them too."""
+
+    def __init__(self):
+        self.platform_counts = pd.Series(dtype="int64")
+        self.total = 0
+        self.missing_posted = 0
+        self.empty_text = 0
+        self.top5 = pd.DataFrame(columns=TARGET_COLUMNS)
 
-    print("Rows per platform:")
-    print(output_df["platform"].value_counts())
-    total = len(output_df)
-    missing_posted = (output_df["posted_at"] == "").sum()
-    empty_text = (output_df["text"].str.strip() == "").sum()
-    print(f"Total rows: {total}")
-    print(f"Missing posted_at: {missing_posted} ({missing_posted / max(1, total):.2%})")
-    print(f"Empty text: {empty_text} ({empty_text / max(1, total):.2%})")
-    if not output_df.empty:
-        top5 = output_df.sort_values("engagement_sum", ascending=False).head(5)
-        print("Top 5 by engagement_sum:")
-        print(top5[["platform", "post_id", "engagement_sum", "url"]])
-    print(f"Saved combined dataset: {output_path} with {total} rows")
+    def add(self, output_df: pd.DataFrame) -> None:
+        if output_df.empty:
+            return
+        self.platform_counts = self.platform_counts.add(output_df["platform"].value_counts(), fill_value=0).astype("int64")
+        self.total += len(output_df)
+        self.missing_posted += int((output_df["posted_at"] == "").sum())
+        self.empty_text += int((output_df["text"].str.strip() == "").sum())
+        top = output_df.sort_values("engagement_sum", ascending=False).head(5)
+        self.top5 = top if self.top5.empty else pd.concat([self.top5, top]).sort_values("engagement_sum", ascending=False).head(5)
+
+    def report(self, output_path: Path) -> None:
+        total = self.total
+        print("Rows per platform:")
+        print(self.platform_counts.sort_values(ascending=False).rename_axis("platform").rename("count"))
+        print(f"Total rows: {total}")
+        print(f"Missing posted_at: {self.missing_posted} ({self.missing_posted / max(1, total):.2%})")
+        print(f"Empty text: {self.empty_text} ({self.empty_text / max(1, total):.2%})")
+        if not self.top5.empty:
+            print("Top 5 by engagement_sum:")
+            print(self.top5[["platform", "post_id", "engagement_sum", "url"]])
+        print(f"Saved combined dataset: {output_path} with {total} rows")
+
+
+def ordered_map(executor: Executor, fn: Callable[..., Any], jobs: Iterable[Tuple], window: int) -> Iterator[Any]:
+    """executor.map that keeps at most `window` jobs in flight instead of draining `jobs` up front."""
+    pending: deque[Future] = deque()
+    for job in jobs:
+        pending.append(executor.submit(fn, *job))
+        if len(pending) >= window:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+def load_and_normalize(
+    platform: str,
+    path: Path,
+    engine: str,
+    seen: Dict[str, str] | None = None,
+    quarantine_dir: Path | None = None,
+) -> Tuple[List[NormalizedPost], pd.Series, int]:
+    """
+    Load one raw export and normalize it. With `seen` (incremental mode) only
+    new/changed rows are normalized. Returns (rows, raw fingerprints, skipped).
+    Top-level so it can run in a worker process.
+    """
+    df = load_dataframe(path, platform, quarantine_dir)
+    prints = raw_fingerprints(platform, df)
+    skipped = 0
+    if seen is not None:
+        changed = changed_raw_rows(platform, df, prints, seen)
+        skipped = len(df) - int(changed.sum())
+        df = df[changed]
+    return normalize_platform(platform, df, engine), prints, skipped
+
+
+def iter_batches(rows: Iterable[NormalizedPost], size: int) -> Iterator[List[NormalizedPost]]:
+    batch: List[NormalizedPost] = []
+    for r in rows:
+        batch.append(r)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def stream_normalize(
+    raw_paths: Dict[str, str],
+    engine: str,
+    languages: List[str],
+    min_len: int,
+    chunksize: int,
+    output_path: Path,
+    typed_output_path: Path | None,
+    workers: int = 1,
+    near_index: NearDuplicateIndex | None = None,
+    quarantine_dir: Path | None = None,
+) -> None:
+    """
+    Streaming variant of main(): raw CSVs are read in chunks and piped through
+    filter -> dedupe -> near-dedupe -> enrich as generators, and output is appended
+    batch by batch. Peak memory is one chunk plus the dedupe key sets and MinHash
+    signatures (plus up to
+    2 * workers chunks in flight when chunks are normalized in a process pool).
+    """
+    def raw_chunks() -> Iterator[Tuple[str, pd.DataFrame, str]]:
+        for platform in NORMALIZERS:
+            path = resolve_path(raw_paths.get(platform, DEFAULT_RAW_PATHS[platform]))
+            for chunk in iter_dataframe_chunks(path, chunksize, platform, quarantine_dir):
+                yield platform, chunk, engine
+
+    def normalized_rows() -> Iterator[NormalizedPost]:
+        if workers > 1:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                for chunk_rows in ordered_map(executor, normalize_platform, raw_chunks(), window=2 * workers):
+                    yield from chunk_rows
+        else:
+            for job in raw_chunks():
+                yield from normalize_platform(*job)
+
+    near_stats: Dict[str, int] = {}
+    rows = iter_dedupe_rows(iter_filter_rows(normalized_rows(), languages, min_len))
+    rows = iter_enrich_rows(near_dedupe(rows, near_index, near_stats))
+    typed_writer = None
+    if typed_output_path is not None:
+        if pa is None:
+            print(f"[WARN] pyarrow not installed; skipping typed output {typed_output_path}", file=sys.stderr)
+        else:
+            typed_writer = TypedEngagementWriter(typed_output_path)
+
+    ensure_output_dir(output_path)
+    summary = OutputSummary()
+    first = True
+    try:
+        for batch in iter_batches(rows, chunksize):
+            output_df = output_frame(batch)
+            output_df.to_csv(output_path, mode="w" if first else "a", header=first, index=False, encoding="utf-8")
+            if typed_writer is not None:
+                typed_writer.write(output_df)
+            summary.add(output_df)
+            first = False
+        if first:
+            output_frame([]).to_csv(output_path, index=False, encoding="utf-8")
+    finally:
+        if typed_writer is not None:
+            typed_writer.close()
+    if typed_writer is not None and typed_writer.rows:
+        print(f"Saved typed dataset: {typed_output_path}")
+    report_near_duplicates(near_index, near_stats)
+    summary.report(output_path)
 
 
 if __name__ == "__main__":
@@ -1,3 +1,4 @@
+import sys
 import pandas as pd
 import matplotlib.pyplot as plt
 
@@ -7,6 +8,12 @@ from pathlib import Path
 import matplotlib
 matplotlib.use("Agg")
 
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.append(str(PROJECT_ROOT))
+
+from src.engagement_data import load_engagement_data
+
 # --- Define paths ---
 DATA_DIR = Path("../data/processed")
 REPORTS_DIR = Path("../reports")
@@ -38,7 +45,7 @@ df_opt = df_opt.merge(
     how="left",
 )
 
-df_eng = pd.read_csv(engagement_file)
+df_eng = load_engagement_data(engagement_file, categorical=False)
 df_eng["topic"] = df_eng["platform"]
 
 metrics = ["like_count", "comment_count", "share_count", "view_count"]
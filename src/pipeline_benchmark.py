@@ -0,0 +1,218 @@
+import argparse
+import json
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterator, List
+
+import pandas as pd
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.append(str(PROJECT_ROOT))
+
+from src import normalize
+from src.engagement_data import load_engagement_data, pa, posting_time_columns, write_typed_engagement
+from src.synthetic_data import RAW_FILENAMES, generate_raw_data
+
+# Optional dep: scorer needs TextBlob/textstat; without them the scoring stage is skipped.
+try:
+    from src.scorer import build_scoring_summary
+except Exception:
+    build_scoring_summary = None
+
+RESULTS_DIR = PROJECT_ROOT / "reports" / "benchmarks"
+TRENDING_KEYWORDS = ["content generation", "AI marketing", "social media campaigns"]
+
+
+def _peak_rss_mb() -> float:
+    # High-water mark of the whole process so far (never goes down between stages).
+    # ru_maxrss is KiB on Linux, bytes on macOS.
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+class StageTimer:
+    """
+    Wall time per stage, the process's peak RSS so far (cumulative: a stage reports
+    at least the peak of every earlier one) and, with trace_python, the peak traced
+    Python heap within the stage itself.
+    """
+
+    def __init__(self, trace_python: bool = False):
+        self.trace_python = trace_python
+        self.stages: List[Dict[str, Any]] = []
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[Dict[str, Any]]:
+        info: Dict[str, Any] = {"stage": name}
+        if self.trace_python:
+            tracemalloc.start()
+        start = time.perf_counter()
+        try:
+            yield info
+        finally:
+            info["seconds"] = round(time.perf_counter() - start, 4)
+            info["cumulative_peak_rss_mb"] = _peak_rss_mb()
+            if self.trace_python:
+                info["peak_python_mb"] = round(tracemalloc.get_traced_memory()[1] / 2**20, 1)
+                tracemalloc.stop()
+            self.stages.append(info)
+            line = f"  {name:<16} {info['seconds']:>9.3f}s  peak rss so far {info['cumulative_peak_rss_mb']:>8.1f} MB"
+            if self.trace_python:
+                line += f"  stage python peak {info['peak_python_mb']:>8.1f} MB"
+            print(line, file=sys.stderr)
+
+
+def run_stages(
+    raw_dir: Path,
+    work_dir: Path,
+    engine: str,
+    near_duplicates: bool,
+    score_sample: int,
+    trace_python: bool,
+) -> List[Dict[str, Any]]:
+    """Time normalize -> output -> EDA -> scoring on one raw data directory."""
+    timer = StageTimer(trace_python)
+    raw: Dict[str, pd.DataFrame] = {}
+    with timer.stage("load_raw") as info:
+        for name in normalize.NORMALIZERS:
+            raw[name] = normalize.load_dataframe(raw_dir / RAW_FILENAMES[name], name, work_dir / "quarantine")
+        info["rows"] = sum(len(df) for df in raw.values())
+
+    with timer.stage("normalize") as info:
+        rows: List[normalize.NormalizedPost] = []
+        for name, df in raw.items():
+            rows.extend(normalize.normalize_platform(name, df, engine))
+        info["rows"] = len(rows)
+    raw.clear()
+
+    with timer.stage("filter_dedupe") as info:
+        rows = normalize.dedupe_rows(normalize.filter_rows(rows, ["en"], 10))
+        if near_duplicates:
+            rows = list(normalize.iter_near_dedupe_rows(rows, normalize.NearDuplicateIndex()))
+        info["rows"] = len(rows)
+
+    with timer.stage("enrich") as info:
+        rows = normalize.enrich_rows(rows)
+        info["rows"] = len(rows)
+
+    csv_path = work_dir / "combined_engagement_data.csv"
+    with timer.stage("write_output") as info:
+        output_df = normalize.output_frame(rows)
+        output_df.to_csv(csv_path, index=False, encoding="utf-8")
+        if pa is not None:
+            write_typed_engagement(output_df, csv_path.with_suffix(".arrow"))
+        info["rows"] = len(output_df)
+    del rows, output_df
+
+    with timer.stage("eda") as info:
+        df = load_engagement_data(csv_path)
+        by_platform = df.groupby("platform", observed=True)["engagement_rate"].mean()
+        times = posting_time_columns(df).join(df["engagement_rate"])
+        times.groupby("day_of_week", observed=False)["engagement_rate"].mean()
+        times.groupby("hour_of_day")["engagement_rate"].mean()
+        info["rows"] = len(df)
+        info["platforms"] = len(by_platform)
+
+    if build_scoring_summary is None:
+        print("[WARN] scorer dependencies missing; skipping scoring stage", file=sys.stderr)
+    elif score_sample > 0:
+        sample = df["text"].head(score_sample).astype(str).to_frame("generated_text")
+        with timer.stage("scoring") as info:
+            build_scoring_summary(sample, TRENDING_KEYWORDS)
+            info["rows"] = len(sample)
+    return timer.stages
+
+
+def run_scale(args: argparse.Namespace, posts: int) -> Dict[str, Any]:
+    """Generate data for one scale and time it in a fresh interpreter (clean peak RSS)."""
+    with tempfile.TemporaryDirectory(prefix=f"bench_{posts}_") as tmp:
+        raw_dir = Path(args.data_dir) / str(posts) if args.data_dir else Path(tmp) / "raw"
+        started = time.perf_counter()
+        if not (raw_dir / RAW_FILENAMES["youtube"]).exists():
+            generate_raw_data(raw_dir, posts, seed=args.seed)
+        generate_seconds = round(time.perf_counter() - started, 4)
+        cmd = [
+            sys.executable, str(Path(__file__).resolve()), "--single",
+            "--raw-dir", str(raw_dir), "--work-dir", tmp,
+            "--engine", args.engine, "--score-sample", str(args.score_sample),
+        ]
+        cmd += ["--near-duplicates"] if args.near_duplicates else []
+        cmd += ["--trace-python"] if args.trace_python else []
+        proc = subprocess.run(cmd, stdout=subprocess.PIPE, check=True, text=True)
+    return {"posts": posts, "generate_seconds": generate_seconds, "stages": json.loads(proc.stdout.strip().splitlines()[-1])}
+
+
+def git_revision() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=PROJECT_ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except Exception:
+        return ""
+
+
+def parse_args(argv: List[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Time normalize -> EDA -> scoring on synthetic data at several scales (offline).")
+    parser.add_argument("--scales", type=int, nargs="+", default=[1_000, 10_000, 100_000], help="Total posts per run.")
+    parser.add_argument("--engine", choices=normalize.ENGINES, default="columnar")
+    parser.add_argument("--near-duplicates", action="store_true", help="Include the MinHash near-duplicate stage.")
+    parser.add_argument("--score-sample", type=int, default=1000, help="Posts scored in the scoring stage (0 skips it).")
+    parser.add_argument("--trace-python", action="store_true", help="Also record each stage's own peak traced Python heap (slower).")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--data-dir", default=None, help="Reuse/keep generated raw data under <data-dir>/<scale>.")
+    parser.add_argument("--output", default=None, help="Results JSON path (default: reports/benchmarks/pipeline_<timestamp>.json).")
+    # Internal: run one scale in this process and print its stage list as JSON.
+    parser.add_argument("--single", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--raw-dir", default=None, help=argparse.SUPPRESS)
+    parser.add_argument("--work-dir", default=None, help=argparse.SUPPRESS)
+    return parser.parse_args(argv)
+
+
+def main(argv: List[str] | None = None):
+    args = parse_args(argv)
+    if args.single:
+        stages = run_stages(
+            Path(args.raw_dir), Path(args.work_dir), args.engine, args.near_duplicates, args.score_sample, args.trace_python
+        )
+        print(json.dumps(stages))
+        return
+
+    results = []
+    for posts in args.scales:
+        print(f"Scale {posts} posts", file=sys.stderr)
+        results.append(run_scale(args, posts))
+    report = {
+        "version": 1,
+        "benchmark": "pipeline",
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "git_revision": git_revision(),
+        "python": platform.python_version(),
+        "pandas": pd.__version__,
+        "pyarrow": getattr(pa, "__version__", None),
+        "machine": platform.platform(),
+        "settings": {
+            "engine": args.engine,
+            "near_duplicates": args.near_duplicates,
+            "score_sample": args.score_sample,
+            "seed": args.seed,
+        },
+        "results": results,
+    }
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    output = Path(args.output) if args.output else RESULTS_DIR / f"pipeline_{stamp}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    print(f"Saved benchmark results: {output}")
+
+
+if __name__ == "__main__":
+    main()
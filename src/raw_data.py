@@ -0,0 +1,330 @@
+import csv
+import json
+import time
+from collections import deque
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+# Optional dep: pyarrow. Without it raw CSVs are read with the pandas C parser
+# (and the python parser after a ParserError), still quarantining bad lines.
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except Exception:
+    pa = None
+
+# Columns each normalizer reads, by kind. "date" columns stay raw strings here;
+# normalize parses them once per column. Columns missing from a file are skipped,
+# the same as a missing key in row.get().
+RAW_SCHEMAS: Dict[str, Dict[str, str]] = {
+    "youtube": {
+        "video_id": "string",
+        "channel_id": "string",
+        "title": "string",
+        "channel_title": "string",
+        "description": "string",
+        "publish_date": "date",
+        "thumbnail_url": "string",
+        "view_count": "number",
+        "like_count": "number",
+        "comment_count": "number",
+        "video_url": "string",
+        "tags": "string",
+        "language": "string",
+        "category_id": "string",
+    },
+    "twitter": {
+        "tweet_id": "string",
+        "text": "string",
+        "author_id": "string",
+        "author_name": "string",
+        "author_username": "string",
+        "author_followers": "number",
+        "created_at": "date",
+        "like_count": "number",
+        "retweet_count": "number",
+        "reply_count": "number",
+        "quote_count": "number",
+        "lang": "string",
+    },
+    "reddit": {
+        "id": "string",
+        "title": "string",
+        "selftext": "string",
+        "author": "string",
+        "subreddit": "string",
+        "created_utc": "number",
+        "ups": "number",
+        "num_comments": "number",
+        "num_crossposts": "number",
+        "view_count": "number",
+        "url": "string",
+        "permalink": "string",
+        "language": "string",
+    },
+    "pinterest": {
+        "pin_id": "string",
+        "title": "string",
+        "description": "string",
+        "author": "string",
+        "created_at": "date",
+        "repin_count": "number",
+        "comment_count": "number",
+        "link": "string",
+        "url": "string",
+        "tags": "string",
+        "language": "string",
+    },
+}
+
+# pandas' default NA strings, so the pyarrow path yields the same missing values as read_csv.
+NA_VALUES = [
+    "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan", "1.#IND", "1.#QNAN",
+    "<NA>", "N/A", "NA", "NULL", "NaN", "None", "n/a", "nan", "null",
+]
+ARROW_BLOCK_SIZE = 16 << 20
+
+
+@dataclass
+class LoadStats:
+    source: str
+    engine: str
+    rows: int = 0
+    quarantined: int = 0
+    seconds: float = 0.0
+
+    def report(self) -> None:
+        print(f"Loaded {self.source}: {self.rows} rows, {self.quarantined} quarantined, {self.seconds:.3f}s ({self.engine})")
+
+
+class Quarantine:
+    """Collects malformed lines of one source file into <dir>/<stem>.bad_lines.jsonl."""
+
+    def __init__(self, source: Path, quarantine_dir: Path | None):
+        self.source = source
+        self.path = quarantine_dir / f"{source.stem}.bad_lines.jsonl" if quarantine_dir is not None else None
+        self.entries: List[Dict[str, Any]] = []
+        self._python_lines: deque[int] = deque()
+        if self.path is not None and self.path.exists():
+            self.path.unlink()
+
+    def arrow_row(self, row: Any) -> str:
+        entry: Dict[str, Any] = {
+            "expected_columns": row.expected_columns,
+            "actual_columns": row.actual_columns,
+            "text": row.text,
+        }
+        # pyarrow reports no line number for some reads; leave the key out rather than write null.
+        if row.number is not None and row.number >= 0:
+            entry = {"line": row.number, **entry}
+        self.entries.append(entry)
+        return "skip"
+
+    def track_python_lines(self) -> None:
+        """
+        The python parser's on_bad_lines callback only gets the fields, so find the
+        physical start line of every row with more fields than the header up front
+        (pandas parses with the same csv module) and hand them out in order.
+        """
+        lines: deque[int] = deque()
+        with open(self.source, newline="", encoding="utf-8", errors="replace") as fh:
+            reader = csv.reader(fh)
+            width = len(next(reader, []))
+            end = reader.line_num
+            for row in reader:
+                if len(row) > width:
+                    lines.append(end + 1)
+                end = reader.line_num
+        self._python_lines = lines
+
+    def python_row(self, fields: List[str]) -> None:
+        entry: Dict[str, Any] = {"actual_columns": len(fields), "fields": fields}
+        if self._python_lines:
+            entry = {"line": self._python_lines.popleft(), **entry}
+        self.entries.append(entry)
+        return None
+
+    def reset(self) -> None:
+        self.entries.clear()
+
+    def flush(self) -> int:
+        if self.entries and self.path is not None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "w", encoding="utf-8") as fh:
+                for entry in self.entries:
+                    fh.write(json.dumps({"source": self.source.name, **entry}, ensure_ascii=False) + "\n")
+            print(f"[WARN] {len(self.entries)} malformed lines in {self.source.name} quarantined to {self.path}")
+        return len(self.entries)
+
+
+def _present_columns(path: Path, platform: str) -> List[str]:
+    header = pd.read_csv(path, nrows=0).columns
+    return [col for col in RAW_SCHEMAS[platform] if col in header]
+
+
+def _arrow_types(platform: str, columns: List[str], numbers_as_strings: bool) -> Dict[str, Any]:
+    number = pa.string() if numbers_as_strings else pa.float64()
+    return {col: number if RAW_SCHEMAS[platform][col] == "number" else pa.string() for col in columns}
+
+
+def _to_frame(table: "pa.Table", platform: str, numbers_as_strings: bool) -> pd.DataFrame:
+    df = table.to_pandas()
+    for col in df.columns:
+        if RAW_SCHEMAS[platform][col] == "number":
+            if numbers_as_strings:
+                df[col] = pd.to_numeric(df[col], errors="coerce")
+        else:
+            # read_csv marks missing strings as NaN, pyarrow as None.
+            df[col] = df[col].astype(object).where(df[col].notna(), np.nan)
+    return df
+
+
+def _pandas_frame(df: pd.DataFrame, platform: str, columns: List[str]) -> pd.DataFrame:
+    # No usecols in read_csv: with it the C parser accepts lines with extra fields
+    # instead of raising, and those lines would never reach the quarantine.
+    df = df[columns].copy()
+    for col in columns:
+        if RAW_SCHEMAS[platform][col] == "number":
+            df[col] = pd.to_numeric(df[col], errors="coerce")
+    return df
+
+
+def _string_dtypes(platform: str, columns: List[str]) -> Dict[str, Any]:
+    return {col: str for col in columns if RAW_SCHEMAS[platform][col] != "number"}
+
+
+def _arrow_options(platform: str, columns: List[str], quarantine: Quarantine, numbers_as_strings: bool):
+    parse = pa_csv.ParseOptions(newlines_in_values=True, invalid_row_handler=quarantine.arrow_row)
+    convert = pa_csv.ConvertOptions(
+        column_types=_arrow_types(platform, columns, numbers_as_strings),
+        include_columns=columns,
+        null_values=NA_VALUES,
+        strings_can_be_null=True,
+    )
+    return parse, convert
+
+
+def _iter_arrow_tables(
+    path: Path, platform: str, columns: List[str], quarantine: Quarantine, chunksize: int | None
+) -> Iterator[Tuple["pa.Table", bool]]:
+    """
+    Yield (table, numbers_as_strings). A number column that does not parse as a
+    float (e.g. "1,234") fails the whole read in pyarrow; the file is then re-read
+    with those columns as strings and coerced like read_csv would.
+    """
+    emitted = 0
+    for numbers_as_strings in (False, True):
+        quarantine.reset()
+        parse, convert = _arrow_options(platform, columns, quarantine, numbers_as_strings)
+        skip = emitted
+        try:
+            if chunksize is None:
+                yield pa_csv.read_csv(path, parse_options=parse, convert_options=convert), numbers_as_strings
+                return
+            read = pa_csv.ReadOptions(block_size=ARROW_BLOCK_SIZE)
+            pending: List[Any] = []
+            pending_rows = 0
+            for batch in pa_csv.open_csv(path, read_options=read, parse_options=parse, convert_options=convert):
+                if skip >= batch.num_rows:
+                    skip -= batch.num_rows
+                    continue
+                batch, skip = batch.slice(skip), 0
+                pending.append(batch)
+                pending_rows += batch.num_rows
+                while pending_rows >= chunksize:
+                    table = pa.Table.from_batches(pending)
+                    yield table.slice(0, chunksize), numbers_as_strings
+                    emitted += chunksize
+                    rest = table.slice(chunksize)
+                    pending, pending_rows = rest.to_batches(), rest.num_rows
+            if pending_rows:
+                yield pa.Table.from_batches(pending), numbers_as_strings
+            return
+        except pa.ArrowInvalid:
+            if numbers_as_strings:
+                raise
+            print(f"[WARN] Non-numeric values in number columns of {path.name}; re-reading them as text")
+
+
+def read_raw_csv(path: Path, platform: str, quarantine_dir: Path | None = None) -> Tuple[pd.DataFrame, LoadStats]:
+    """
+    Load one raw platform export with its declared schema. Malformed lines are
+    skipped into the quarantine file instead of dropping to the slow parser.
+    """
+    start = time.perf_counter()
+    quarantine = Quarantine(path, quarantine_dir)
+    columns = _present_columns(path, platform)
+    if pa is not None:
+        stats = LoadStats(path.name, "pyarrow")
+        df = pd.DataFrame(columns=columns)
+        for table, numbers_as_strings in _iter_arrow_tables(path, platform, columns, quarantine, None):
+            df = _to_frame(table, platform, numbers_as_strings)
+    else:
+        stats = LoadStats(path.name, "c")
+        dtypes = _string_dtypes(platform, columns)
+        try:
+            df = pd.read_csv(path, dtype=dtypes)
+        except pd.errors.ParserError:
+            stats.engine = "python"
+            quarantine.track_python_lines()
+            df = pd.read_csv(path, dtype=dtypes, engine="python", on_bad_lines=quarantine.python_row)
+        df = _pandas_frame(df, platform, columns)
+    stats.quarantined = quarantine.flush()
+    stats.rows = len(df)
+    stats.seconds = time.perf_counter() - start
+    return df, stats
+
+
+def iter_raw_csv_chunks(
+    path: Path, platform: str, chunksize: int, quarantine_dir: Path | None = None
+) -> Iterator[pd.DataFrame]:
+    """
+    Chunked read_raw_csv; the stats line is printed once the file is exhausted.
+    Parse time only counts time spent reading, not the consumer's work between chunks.
+    """
+    start = time.perf_counter()
+    quarantine = Quarantine(path, quarantine_dir)
+    columns = _present_columns(path, platform)
+    stats = LoadStats(path.name, "pyarrow" if pa is not None else "c")
+    if pa is not None:
+        for table, numbers_as_strings in _iter_arrow_tables(path, platform, columns, quarantine, chunksize):
+            chunk = _to_frame(table, platform, numbers_as_strings)
+            stats.rows += len(chunk)
+            stats.seconds += time.perf_counter() - start
+            yield chunk
+            start = time.perf_counter()
+    else:
+        dtypes = _string_dtypes(platform, columns)
+        try:
+            with pd.read_csv(path, dtype=dtypes, chunksize=chunksize) as reader:
+                for chunk in reader:
+                    stats.rows += len(chunk)
+                    chunk = _pandas_frame(chunk, platform, columns)
+                    stats.seconds += time.perf_counter() - start
+                    yield chunk
+                    start = time.perf_counter()
+        except pd.errors.ParserError:
+            # Rows before the C parser's first bad line were good; skip the ones already emitted.
+            stats.engine = "python"
+            emitted, stats.rows = stats.rows, 0
+            quarantine.track_python_lines()
+            with pd.read_csv(
+                path, dtype=dtypes, chunksize=chunksize, engine="python", on_bad_lines=quarantine.python_row
+            ) as reader:
+                for chunk in reader:
+                    stats.rows += len(chunk)
+                    if emitted >= len(chunk):
+                        emitted -= len(chunk)
+                        continue
+                    chunk = _pandas_frame(chunk.iloc[emitted:], platform, columns)
+                    stats.seconds += time.perf_counter() - start
+                    yield chunk
+                    start = time.perf_counter()
+                    emitted = 0
+    stats.quarantined = quarantine.flush()
+    stats.seconds += time.perf_counter() - start
+    stats.report()
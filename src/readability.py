@@ -0,0 +1,141 @@
+import math
+import os
+import re
+from collections import Counter
+from itertools import islice
+from typing import Dict, Iterable, NamedTuple
+
+import numpy as np
+
+# Optional dep: pyphen (installed with textstat). With it syllables are counted
+# exactly like textstat's pyphen counter; without it a vowel-group heuristic is used.
+try:
+    from pyphen import Pyphen
+
+    _HYPHENATOR = Pyphen(lang="en_US")
+except Exception:
+    _HYPHENATOR = None
+
+# Optional dep: textstat, only for the "textstat" reference engine.
+try:
+    import textstat
+except Exception:
+    textstat = None
+
+READABILITY_ENGINE_ENV = "SCORER_READABILITY_ENGINE"
+READABILITY_ENGINES = ("builtin", "textstat")
+SYLLABLE_CACHE_SIZE = 200_000
+
+# Same tokenization as textstat's flesch_kincaid_grade (textstat 0.7.x defaults):
+# punctuation (apostrophes included) is dropped before counting words/syllables,
+# and sentences of two words or fewer do not count as sentences.
+PUNCT_RE = re.compile(r"[^\w\s]")
+SENTENCE_RE = re.compile(r"\b[^.!?]+[.!?]*")
+# Whitespace-separated tokens that still hold a character once punctuation is dropped.
+WORD_TOKEN_RE = re.compile(r"\S*\w\S*")
+_VOWEL_GROUP_RE = re.compile(r"[aeiouy]+")
+
+
+class TextCounts(NamedTuple):
+    sentences: int
+    words: int
+    syllables: int
+
+
+_SYLLABLES: Dict[str, int] = {}
+
+
+def _count_syllables(word: str) -> int:
+    if _HYPHENATOR is not None:
+        return len(_HYPHENATOR.positions(word)) + 1
+    groups = len(_VOWEL_GROUP_RE.findall(word))
+    if word.endswith("e") and not word.endswith(("le", "ee")) and groups > 1:
+        groups -= 1
+    return max(1, groups)
+
+
+def word_syllables(word: str) -> int:
+    """Syllables in one lowercased, punctuation-free word (memoized across texts)."""
+    count = _SYLLABLES.get(word)
+    if count is None:
+        if len(_SYLLABLES) >= SYLLABLE_CACHE_SIZE:
+            _SYLLABLES.clear()
+        count = _SYLLABLES[word] = _count_syllables(word)
+    return count
+
+
+def _legacy_round(number: float, points: int) -> float:
+    # textstat's rounding (half away from zero), applied at the same steps.
+    p = 10 ** points
+    return float(math.floor((number * p) + math.copysign(0.5, number))) / p
+
+
+def _grade_from_counts(sentences: int, words: int, syllables: int) -> float:
+    asl = _legacy_round(float(words / sentences), 1)
+    aspw = _legacy_round(float(syllables) / float(words), 1) if words else 0.0
+    return _legacy_round(float(0.39 * asl) + float(11.8 * aspw) - 15.59, 1)
+
+
+def text_counts(text: str) -> TextCounts:
+    sentences = SENTENCE_RE.findall(text)
+    # A sentence is short when it has no third word; stop scanning once one is found.
+    short = sum(1 for s in sentences if next(islice(WORD_TOKEN_RE.finditer(s), 2, None), None) is None)
+    clean = PUNCT_RE.sub("", text)
+    words = clean.split()
+    # Lowercasing ASCII maps letters to letters, so it commutes with dropping punctuation.
+    lowered = clean.lower().split() if text.isascii() else PUNCT_RE.sub("", text.lower()).split()
+    syllables = 0
+    table = _SYLLABLES
+    for word, count in Counter(lowered).items():
+        n = table.get(word)
+        syllables += (word_syllables(word) if n is None else n) * count
+    return TextCounts(max(1, len(sentences) - short), len(words), syllables)
+
+
+def flesch_kincaid_grade(text: str) -> float:
+    """Flesch-Kincaid grade of one text."""
+    return _grade_from_counts(*text_counts(text))
+
+
+def flesch_kincaid_grade_many(texts: Iterable[str]) -> np.ndarray:
+    """Flesch-Kincaid grades of a batch; repeated texts are counted once."""
+    grades: Dict[str, float] = {}
+    out = []
+    for text in texts:
+        g = grades.get(text)
+        if g is None:
+            g = grades[text] = flesch_kincaid_grade(text)
+        out.append(g)
+    return np.array(out, dtype=float)
+
+
+_engine: str | None = None
+
+
+def get_readability_engine() -> str:
+    global _engine
+    if _engine is None:
+        _engine = set_readability_engine(os.getenv(READABILITY_ENGINE_ENV) or "builtin")
+    return _engine
+
+
+def set_readability_engine(engine: str) -> str:
+    """Select the grade engine behind the scorer ("builtin" by default, "textstat" as reference)."""
+    global _engine
+    if engine not in READABILITY_ENGINES:
+        raise ValueError(f"Unknown readability engine '{engine}'. Choose from: {', '.join(READABILITY_ENGINES)}")
+    _engine = engine
+    return _engine
+
+
+def grade(text: str) -> float:
+    if get_readability_engine() == "textstat":
+        # Without textstat the scorer has always assumed grade 10.
+        return float(textstat.flesch_kincaid_grade(text)) if textstat is not None else 10.0
+    return flesch_kincaid_grade(text)
+
+
+def grade_many(texts: Iterable[str]) -> np.ndarray:
+    if get_readability_engine() == "textstat":
+        return np.array([grade(t) for t in texts], dtype=float)
+    return flesch_kincaid_grade_many(texts)
@@ -1,189 +1,436 @@
+import os
 import re
-from textblob import TextBlob
-import textstat
-from typing import Dict, List
+from typing import Dict, Iterable, List, NamedTuple, Sequence, Tuple
 from pathlib import Path
+import numpy as np
 import pandas as pd
 
-def score_post(text, trending_keywords=None, hashtag_count_override: int | None = None):
-    score = 0
+from src.hashtag_index import load_hashtag_index
+from src.keyword_matcher import KeywordMatcher, keyword_matcher
+from src.learned_model import LearnedScoringModel, load_learned_model
+# Polarity backend behind every score; select with set_sentiment_backend("lexicon") etc.
+from src.sentiment import SENTIMENT_BACKENDS, get_sentiment_backend, set_sentiment_backend
+from src.text_features import TextFeatures, text_features, text_features_many
+
+CTA_RE = re.compile(r"(?:discover|learn|try|join|explore|check)")
+
+
+# score_post and optimize_post are two weightings of one feature vector. The NLP
+# features (polarity, Flesch-Kincaid grade, word/hashtag counts) are taken from the
+# original text and come from the shared content-hash cache in text_features, so
+# each distinct text is analysed once per process whichever entry point asks.
+class PostFeatures(NamedTuple):
+    word_count: int
+    hashtags: int
+    polarity: float
+    grade: float | None  # None when the readability engine failed on the text
+    keyword_hits: int
+    has_cta: bool
+    is_question: bool
+
+
+def _polarity_value(features: TextFeatures) -> float:
+    return 0.0 if features.polarity is None else features.polarity
+
+
+def extract_post_features(
+    text: str,
+    trending_keywords: List[str] | KeywordMatcher | None = None,
+    hashtag_count_override: int | None = None,
+) -> PostFeatures:
     text_l = text.lower()
+    features = text_features(text)
+    hashtags = hashtag_count_override if hashtag_count_override is not None else features.hashtag_count
+    kw_hits = keyword_matcher(trending_keywords).count_lowered(text_l) if trending_keywords else 0
+    return PostFeatures(
+        features.word_count,
+        hashtags,
+        _polarity_value(features),
+        features.grade,
+        kw_hits,
+        CTA_RE.search(text_l) is not None,
+        text_l.endswith("?"),
+    )
 
-    wc = len(re.findall(r'\w+', text_l))
-    if 20 <= wc <= 80:
-        score += 2
 
-    hashtags_in_text = len(re.findall(r'#\w+', text_l))
-    hashtags = hashtag_count_override if hashtag_count_override is not None else hashtags_in_text
-    if 1 <= hashtags <= 3:
-        score += 1
+def _grade_term(grade: float | None) -> float:
+    return 0 if grade is None else max(0, 2 - (grade / 10))
 
-    polarity = TextBlob(text_l).sentiment.polarity if TextBlob else 0.0
-    score += round(polarity, 2)
 
-    if trending_keywords:
-        score += sum(1 for kw in trending_keywords if kw.lower() in text_l)
+def _readability_bonus(grade: float | None) -> float:
+    if grade is None:
+        return 1.0
+    # Map grade to 0..2: grade 0 => 2.0, grade 10 => 1.0, grade 20 => 0.0 (clamped)
+    score = 2.0 - max(0.0, min(2.0, grade / 10.0 * 1.0))
+    return float(max(0.0, min(2.0, score)))
 
-    try:
-        grade = textstat.flesch_kincaid_grade(text_l) if textstat else 10
-        score += max(0, 2 - (grade / 10))
-    except Exception:
-        pass
 
-    if re.search(r"(discover|learn|try|join|explore|check)", text_l):
+def _length_bonus(wc: int) -> float:
+    if 20 <= wc <= 80:
+        return 2.0
+    if 10 <= wc < 20 or 80 < wc <= 120:
+        return 1.0
+    return 0.0
+
+
+def score_from_features(f: PostFeatures) -> float:
+    score = 0
+    if 20 <= f.word_count <= 80:
+        score += 2
+    if 1 <= f.hashtags <= 3:
+        score += 1
+    score += round(f.polarity, 2)
+    score += f.keyword_hits
+    score += _grade_term(f.grade)
+    if f.has_cta:
         score += 1
-    if text_l.endswith("?"):
+    if f.is_question:
         score += 0.5
-
     return round(score, 2)
 
 
+def optimize_from_features(f: PostFeatures) -> Dict:
+    readability = _readability_bonus(f.grade)
+    length_bonus = _length_bonus(f.word_count)
+    hashtag_bonus = 1.0 if 1 <= f.hashtags <= 3 else 0.0
+
+    score = (
+        1.5 * f.keyword_hits
+        + 1.0 * f.polarity
+        + 1.0 * readability
+        + length_bonus
+        + hashtag_bonus
+    )
+
+    return {
+        "word_count": f.word_count,
+        "hashtags": f.hashtags,
+        "sentiment": round(f.polarity, 3),
+        "keyword_hits": f.keyword_hits,
+        "readability_bonus": round(readability, 3),
+        "length_bonus": length_bonus,
+        "hashtag_bonus": hashtag_bonus,
+        "final_score": round(float(score), 3),
+    }
+
+
+def score_post(text, trending_keywords=None, hashtag_count_override: int | None = None):
+    return score_from_features(extract_post_features(text, trending_keywords, hashtag_count_override))
+
 
+def optimize_post(text: str, trending_keywords: List[str] | KeywordMatcher, hashtag_count_override: int | None = None) -> Dict:
+    return optimize_from_features(extract_post_features(text, trending_keywords, hashtag_count_override))
 
-# Optional deps: TextBlob, textstat. Handle gracefully if missing.
-try:
-    from textblob import TextBlob
-except Exception:
-    TextBlob = None
 
-try:
-    import textstat
-except Exception:
-    textstat = None
+def score_and_optimize_post(
+    text: str,
+    trending_keywords: List[str] | KeywordMatcher | None,
+    hashtag_count_override: int | None = None,
+) -> Tuple[float, Dict]:
+    """score_post and optimize_post of one text from a single feature pass."""
+    features = extract_post_features(text, trending_keywords, hashtag_count_override)
+    return score_from_features(features), optimize_from_features(features)
 
 
 def _sentiment_polarity(text: str) -> float:
     """
     Returns polarity in [-1, 1]. Falls back to 0 if TextBlob not available.
     """
-    if TextBlob is None:
-        return 0.0
-    try:
-        return float(TextBlob(text).sentiment.polarity)
-    except Exception:
-        return 0.0
+    return _polarity_value(text_features(text))
 
 
 def _readability_score(text: str) -> float:
     """
     Returns a 0..2 readability bonus (higher = easier to read).
     Uses Flesch-Kincaid grade; lower grade -> higher score.
-    Falls back to 1.0 if textstat not available.
+    Falls back to 1.0 if no grade could be computed.
     """
-    if textstat is None:
-        return 1.0
-    try:
-        grade = textstat.flesch_kincaid_grade(text)
-        # Map grade to 0..2: grade 0 => 2.0, grade 10 => 1.0, grade 20 => 0.0 (clamped)
-        score = 2.0 - max(0.0, min(2.0, grade / 10.0 * 1.0))
-        return float(max(0.0, min(2.0, score)))
-    except Exception:
-        return 1.0
+    return _readability_bonus(text_features(text).grade)
 
 
-def _keyword_hits(text: str, trending_keywords: List[str]) -> int:
+def _keyword_hits(text: str, trending_keywords: List[str] | KeywordMatcher) -> int:
     """
     Counts how many of the trending keywords appear (case-insensitive).
     """
-    t = text.lower()
-    return sum(1 for kw in (trending_keywords or []) if kw.lower() in t)
+    return keyword_matcher(trending_keywords or []).count(text)
 
 
 def _hashtag_count(text: str) -> int:
-    return len(re.findall(r'#\w+', text))
+    return text_features(text).hashtag_count
 
 
 def _word_count(text: str) -> int:
-    return len(re.findall(r'\w+', text))
+    return text_features(text).word_count
 
 
-def optimize_post(text: str, trending_keywords: List[str], hashtag_count_override: int | None = None) -> Dict:
-    wc = _word_count(text)
-    hashtags_in_text = _hashtag_count(text)
-    hashtags = hashtag_count_override if hashtag_count_override is not None else hashtags_in_text
-    sentiment = _sentiment_polarity(text)
-    kw_hits = _keyword_hits(text, trending_keywords)
-    readability = _readability_score(text)
+# Batch versions of score_post / optimize_post over a feature frame (one row of
+# PostFeatures per text). Terms are added in the same order and rounded with the
+# builtin round(), so every value is identical to the per-text functions.
+def _text_series(texts: Iterable[str] | pd.Series) -> pd.Series:
+    if isinstance(texts, pd.Series):
+        return texts.astype(object)
+    return pd.Series(list(texts), dtype=object)
 
-    if 20 <= wc <= 80:
-        length_bonus = 2.0
-    elif 10 <= wc < 20 or 80 < wc <= 120:
-        length_bonus = 1.0
+
+def _hashtag_counts(counted: np.ndarray, override: int | Sequence[int | None] | None) -> np.ndarray:
+    if override is None:
+        return counted
+    if np.isscalar(override):
+        return np.full(len(counted), override)
+    values = list(override)
+    return np.array([counted[i] if v is None else v for i, v in enumerate(values)])
+
+
+def _keyword_hit_counts(lowered: pd.Series, trending_keywords: Sequence[str] | KeywordMatcher | None) -> np.ndarray:
+    return keyword_matcher(trending_keywords or []).count_many(lowered, lowered=True)
+
+
+def _round_each(values: Iterable[float], digits: int) -> List[float]:
+    return [round(float(v), digits) for v in values]
+
+
+def extract_post_features_many(
+    texts: Iterable[str] | pd.Series,
+    trending_keywords: Sequence[str] | KeywordMatcher | None = None,
+    hashtag_count_override: int | Sequence[int | None] | None = None,
+    workers: int | None = None,
+) -> pd.DataFrame:
+    """
+    PostFeatures for many texts as a frame (aligned with `texts` when it is a
+    Series; missing grades are NaN). hashtag_count_override may be one value for
+    all texts or one per text (None = count the text's own hashtags). With
+    workers > 1 (default: SCORER_WORKERS) the NLP features are computed in a
+    process pool; rows and values are the same either way.
+    """
+    s = _text_series(texts)
+    lowered = s.str.lower()
+    features = text_features_many(s, workers)
+    hashtags = _hashtag_counts(np.array([f.hashtag_count for f in features], dtype="int64"), hashtag_count_override)
+    if trending_keywords:
+        kw_hits = _keyword_hit_counts(lowered, trending_keywords)
     else:
-        length_bonus = 0.0
+        kw_hits = np.zeros(len(s), dtype="int64")
+    return pd.DataFrame(
+        {
+            "word_count": np.array([f.word_count for f in features], dtype="int64"),
+            "hashtags": hashtags,
+            "polarity": np.array([_polarity_value(f) for f in features], dtype=float),
+            "grade": np.array([np.nan if f.grade is None else f.grade for f in features], dtype=float),
+            "keyword_hits": kw_hits,
+            "has_cta": lowered.str.contains(CTA_RE).to_numpy(dtype=bool),
+            "is_question": lowered.str.endswith("?").to_numpy(dtype=bool),
+        },
+        index=s.index,
+        columns=list(PostFeatures._fields),
+    )
 
-    hashtag_bonus = 1.0 if 1 <= hashtags <= 3 else 0.0
 
-    score = (
-        1.5 * kw_hits
-        + 1.0 * sentiment
-        + 1.0 * readability
-        + length_bonus
-        + hashtag_bonus
+def score_from_feature_frame(feats: pd.DataFrame) -> pd.Series:
+    wc = feats["word_count"].to_numpy()
+    hashtags = feats["hashtags"].to_numpy()
+    grade = feats["grade"].to_numpy()
+    score = np.where((wc >= 20) & (wc <= 80), 2.0, 0.0)
+    score = score + np.where((hashtags >= 1) & (hashtags <= 3), 1.0, 0.0)
+    score = score + np.array(_round_each(feats["polarity"], 2), dtype=float)
+    score = score + feats["keyword_hits"].to_numpy()
+    score = score + np.where(np.isnan(grade), 0.0, np.maximum(0.0, 2 - (grade / 10)))
+    score = score + np.where(feats["has_cta"].to_numpy(), 1.0, 0.0)
+    score = score + np.where(feats["is_question"].to_numpy(), 0.5, 0.0)
+    return pd.Series(_round_each(score, 2), index=feats.index, name="score", dtype=float)
+
+
+OPTIMIZE_COLUMNS = [
+    "word_count",
+    "hashtags",
+    "sentiment",
+    "keyword_hits",
+    "readability_bonus",
+    "length_bonus",
+    "hashtag_bonus",
+    "final_score",
+]
+
+
+def _bonus_columns(feats: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    # (readability_bonus, length_bonus, hashtag_bonus), unrounded.
+    wc = feats["word_count"].to_numpy()
+    hashtags = feats["hashtags"].to_numpy()
+    grade = feats["grade"].to_numpy()
+    readability = np.where(np.isnan(grade), 1.0, 2.0 - np.clip(grade / 10.0 * 1.0, 0.0, 2.0))
+    readability = np.clip(readability, 0.0, 2.0)
+
+    length_bonus = np.select(
+        [(wc >= 20) & (wc <= 80), ((wc >= 10) & (wc < 20)) | ((wc > 80) & (wc <= 120))],
+        [2.0, 1.0],
+        0.0,
+    )
+    hashtag_bonus = np.where((hashtags >= 1) & (hashtags <= 3), 1.0, 0.0)
+    return readability, length_bonus, hashtag_bonus
+
+
+def optimize_from_feature_frame(feats: pd.DataFrame) -> pd.DataFrame:
+    wc = feats["word_count"].to_numpy()
+    hashtags = feats["hashtags"].to_numpy()
+    sentiment = feats["polarity"].to_numpy()
+    kw_hits = feats["keyword_hits"].to_numpy()
+    readability, length_bonus, hashtag_bonus = _bonus_columns(feats)
+    score = 1.5 * kw_hits + 1.0 * sentiment + 1.0 * readability + length_bonus + hashtag_bonus
+
+    return pd.DataFrame(
+        {
+            "word_count": wc,
+            "hashtags": hashtags,
+            "sentiment": _round_each(sentiment, 3),
+            "keyword_hits": kw_hits,
+            "readability_bonus": _round_each(readability, 3),
+            "length_bonus": length_bonus,
+            "hashtag_bonus": hashtag_bonus,
+            "final_score": _round_each(score, 3),
+        },
+        index=feats.index,
+        columns=OPTIMIZE_COLUMNS,
     )
 
-    return {
-        "word_count": wc,
-        "hashtags": hashtags,
-        "sentiment": round(sentiment, 3),
-        "keyword_hits": kw_hits,
-        "readability_bonus": round(readability, 3),
-        "length_bonus": length_bonus,
-        "hashtag_bonus": hashtag_bonus,
-        "final_score": round(float(score), 3),
-    }
+
+# "heuristic" is score_post's hand-picked formula; "learned" uses the per-platform
+# weights fitted by src/train_scorer.py and needs a target platform. SCORER_MODE
+# picks the default.
+SCORING_MODES = ("heuristic", "learned")
+SCORING_MODE_ENV = "SCORER_MODE"
+
+
+def resolve_scoring_mode(mode: str | None = None) -> str:
+    mode = mode or os.getenv(SCORING_MODE_ENV) or "heuristic"
+    if mode not in SCORING_MODES:
+        raise ValueError(f"Unknown scoring mode '{mode}'. Choose from: {', '.join(SCORING_MODES)}")
+    return mode
+
+
+def learned_feature_matrix(feats: pd.DataFrame) -> np.ndarray:
+    """Design matrix for the learned model: one row per post, columns in LEARNED_FEATURES order."""
+    readability, length_bonus, hashtag_bonus = _bonus_columns(feats)
+    return np.column_stack(
+        [
+            np.ones(len(feats)),
+            feats["keyword_hits"].to_numpy(dtype=float),
+            feats["polarity"].to_numpy(dtype=float),
+            readability,
+            length_bonus,
+            hashtag_bonus,
+            feats["has_cta"].to_numpy(dtype=float),
+            feats["is_question"].to_numpy(dtype=float),
+        ]
+    )
+
+
+def learned_score_from_feature_frame(
+    feats: pd.DataFrame,
+    platform: str | Sequence[str],
+    model: LearnedScoringModel | None = None,
+) -> pd.Series:
+    """
+    Predicted engagement rank within `platform` (one name for all rows, or one per
+    row), in [0, 1]. Raises ValueError when a platform is missing or has no weights.
+    `feats` should count keyword_hits against model.keywords (see learned_features).
+    """
+    model = model or load_learned_model()
+    predicted = model.predict(learned_feature_matrix(feats), platform)
+    return pd.Series(np.round(predicted, 4), index=feats.index, name="learned_score", dtype=float)
+
+
+def learned_features(
+    texts: Iterable[str] | pd.Series,
+    model: LearnedScoringModel,
+    trending_keywords: Sequence[str] | KeywordMatcher | None = None,
+    hashtag_count_override: int | Sequence[int | None] | None = None,
+    workers: int | None = None,
+) -> pd.DataFrame:
+    # keyword_hits is counted against the keywords the model was trained with, so its
+    # weight means the same thing at scoring time; older models without them use the caller's.
+    keywords = list(model.keywords) if model.keywords else trending_keywords
+    return extract_post_features_many(texts, keywords, hashtag_count_override, workers)
+
+
+def score_many(
+    texts: Iterable[str] | pd.Series,
+    trending_keywords: Sequence[str] | KeywordMatcher | None = None,
+    hashtag_count_override: int | Sequence[int | None] | None = None,
+    workers: int | None = None,
+    mode: str | None = None,
+    platform: str | Sequence[str] | None = None,
+) -> pd.Series:
+    """
+    score_post over many texts in one call. Returns a float Series (aligned with
+    `texts` when it is a Series). mode="learned" returns the learned model's
+    predicted engagement rank for `platform` instead (required in that mode, see
+    learned_score_from_feature_frame).
+    """
+    if resolve_scoring_mode(mode) == "learned":
+        model = load_learned_model()
+        feats = learned_features(texts, model, trending_keywords, hashtag_count_override, workers)
+        return learned_score_from_feature_frame(feats, platform, model).rename("score")
+    feats = extract_post_features_many(texts, trending_keywords, hashtag_count_override, workers)
+    return score_from_feature_frame(feats)
+
+
+def optimize_many(
+    texts: Iterable[str] | pd.Series,
+    trending_keywords: Sequence[str] | KeywordMatcher | None,
+    hashtag_count_override: int | Sequence[int | None] | None = None,
+    workers: int | None = None,
+) -> pd.DataFrame:
+    """
+    optimize_post over many texts in one call. Returns one row per text with the
+    optimize_post keys as columns (aligned with `texts` when it is a Series).
+    """
+    return optimize_from_feature_frame(
+        extract_post_features_many(texts, trending_keywords, hashtag_count_override, workers)
+    )
 
 
-def build_scoring_summary(df: pd.DataFrame, trending_keywords: List[str]) -> pd.DataFrame:
-    """Return a scored summary for each row in df using scorer helpers."""
+def build_scoring_summary(
+    df: pd.DataFrame,
+    trending_keywords: List[str] | KeywordMatcher,
+    workers: int | None = None,
+    mode: str | None = None,
+    platform: str | None = None,
+) -> pd.DataFrame:
+    """
+    Return a scored summary for each row in df using scorer helpers (see
+    extract_post_features_many for workers). In "learned" mode a learned_score
+    column is added (for each row's platform when df has a platform column,
+    otherwise for `platform`) and rows are ranked by it.
+    """
+    mode = resolve_scoring_mode(mode)
     if df.empty:
         return df.copy()
 
-    records = []
-    keywords = trending_keywords or []
-    for _, row in df.iterrows():
-        text = str(row.get("generated_text", ""))
-        variation = row.get("variation_no")
-        topic = row.get("topic", "")
-        tone = row.get("tone", "")
-
-        score_val = score_post(text, keywords)
-        feature = optimize_post(text, keywords)
-
-        records.append(
-            {
-                "topic": topic,
-                "tone": tone,
-                "variation_no": variation,
-                "generated_text": text,
-                "score": score_val,
-                "word_count": feature["word_count"],
-                "hashtags": feature["hashtags"],
-                "sentiment": feature["sentiment"],
-                "keyword_hits": feature["keyword_hits"],
-                "readability_bonus": feature["readability_bonus"],
-                "length_bonus": feature["length_bonus"],
-                "hashtag_bonus": feature["hashtag_bonus"],
-                "final_score": feature["final_score"],
-            }
-        )
-
-    return pd.DataFrame(records).sort_values("final_score", ascending=False).reset_index(drop=True)
+    keywords = keyword_matcher(trending_keywords or [])
+    texts = df["generated_text"].astype(str) if "generated_text" in df.columns else pd.Series("", index=df.index)
+    feats = extract_post_features_many(texts, keywords, workers=workers)
+    summary = pd.DataFrame(
+        {
+            "topic": df["topic"] if "topic" in df.columns else "",
+            "tone": df["tone"] if "tone" in df.columns else "",
+            "variation_no": df["variation_no"] if "variation_no" in df.columns else None,
+            "generated_text": texts,
+            "score": score_from_feature_frame(feats),
+        },
+        index=df.index,
+    )
+    summary = pd.concat([summary, optimize_from_feature_frame(feats)], axis=1)
+    rank_by = "final_score"
+    if mode == "learned":
+        model = load_learned_model()
+        platforms = list(df["platform"].astype(object).where(df["platform"].notna(), None)) if "platform" in df.columns else platform
+        learned_feats = learned_features(texts, model, keywords, workers=workers) if model.keywords else feats
+        summary["learned_score"] = learned_score_from_feature_frame(learned_feats, platforms, model)
+        rank_by = "learned_score"
+    return summary.sort_values(rank_by, ascending=False).reset_index(drop=True)
 
 def load_hashtag_counts(hashtags_dir: Path) -> dict[str, int]:
     """
     Aggregate hashtag counts per post_id from the per‑platform hashtag CSVs.
-    Returns {post_id: hashtag_count}.
-    """
-    lookup: dict[str, int] = {}
-    for csv in hashtags_dir.glob("*_hashtags.csv"):
-        try:
-            df = pd.read_csv(csv)
-        except Exception:
-            continue
-        if "post_id" not in df.columns:
-            continue
-        counts = df.groupby("post_id").size()
-        for pid, cnt in counts.items():
-            lookup[str(pid)] = int(cnt)
-    return lookup
+    Returns {post_id: hashtag_count}. Served from the cached hashtag index.
+    """
+    return dict(load_hashtag_index(hashtags_dir).post_counts)
@@ -0,0 +1,221 @@
+import argparse
+import json
+import platform
+import sys
+import time
+from datetime import datetime, timezone
+from importlib import metadata
+from itertools import product
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Sequence
+
+import numpy as np
+import pandas as pd
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.append(str(PROJECT_ROOT))
+
+from src import text_features
+from src.hashtag_index import clear_hashtag_index_cache
+from src.pipeline_benchmark import RESULTS_DIR, git_revision
+from src.readability import get_readability_engine
+from src.scorer import build_scoring_summary, load_hashtag_counts, optimize_post, resolve_scoring_mode, score_post
+from src.sentiment import get_sentiment_backend
+from src.synthetic_data import HASHTAGS, OPENERS, TREND_KEYWORDS, WORDS
+
+DATA_DIR = PROJECT_ROOT / "data" / "processed"
+GENERATED_POSTS_PATH = DATA_DIR / "generated_posts.csv"
+EDA_KEYWORDS_PATH = DATA_DIR / "eda_top_keywords.csv"
+HASHTAGS_DIR = DATA_DIR / "hashtags"
+
+
+def generated_posts(path: Path = GENERATED_POSTS_PATH) -> List[str]:
+    return pd.read_csv(path)["generated_text"].dropna().astype(str).tolist()
+
+
+def synthetic_posts(n: int, seed: int = 7) -> List[str]:
+    """Post-like texts: 1-4 sentences of 5-20 words, some with hashtags, CTA openers or a closing question."""
+    rng = np.random.default_rng(seed)
+    words = np.array(WORDS, dtype=object)
+    posts = []
+    for i in range(n):
+        sentences = []
+        for _ in range(int(rng.integers(1, 5))):
+            body = " ".join(words[rng.integers(0, len(words), size=int(rng.integers(5, 21)))])
+            sentences.append(f"{OPENERS[int(rng.integers(0, len(OPENERS)))]} {body}.")
+        text = " ".join(sentences)
+        if rng.random() < 0.6:
+            text += " " + " ".join(rng.choice(HASHTAGS, size=int(rng.integers(1, 4)), replace=False))
+        if rng.random() < 0.15:
+            text = text.rstrip(".") + "?"
+        posts.append(text)
+    return posts
+
+
+def keyword_pool(size: int, path: Path = EDA_KEYWORDS_PATH) -> List[str]:
+    """`size` trending keywords: the synthetic trend terms, then EDA keywords, then word pairs."""
+    pool = list(dict.fromkeys(TREND_KEYWORDS + pd.read_csv(path)["keyword"].dropna().astype(str).tolist()))
+    for a, b in product(WORDS, WORDS):
+        if len(pool) >= size:
+            break
+        if a != b:
+            pool.append(f"{a} {b}")
+    return pool[:size]
+
+
+def latency_summary(seconds: Sequence[float], texts_per_sample: int = 1) -> Dict[str, Any]:
+    """Percentiles of per-text latency (ms) and throughput from per-sample wall times."""
+    per_text = np.asarray(seconds, dtype=float) / texts_per_sample * 1000
+    total = float(np.sum(seconds))
+    return {
+        "samples": len(per_text),
+        "p50_ms": round(float(np.percentile(per_text, 50)), 4),
+        "p90_ms": round(float(np.percentile(per_text, 90)), 4),
+        "p99_ms": round(float(np.percentile(per_text, 99)), 4),
+        "max_ms": round(float(per_text.max()), 4),
+        "mean_ms": round(float(per_text.mean()), 4),
+        "texts_per_s": round(len(per_text) * texts_per_sample / total, 1) if total else None,
+    }
+
+
+def _timed(fn: Callable[[], Any]) -> float:
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def bench_per_text(name: str, fn: Callable, texts: List[str], keywords: List[str], cache: str) -> Dict[str, Any]:
+    """Time every call of fn(text, keywords) separately."""
+    if cache == "cold":
+        text_features.FEATURE_CACHE.clear()
+    else:
+        for text in texts:
+            fn(text, keywords)
+    samples = [_timed(lambda: fn(text, keywords)) for text in texts]
+    return {"function": name, "texts": len(texts), "keywords": len(keywords), "cache": cache, **latency_summary(samples)}
+
+
+def bench_summary(texts: List[str], keywords: List[str], cache: str, repeat: int, workers: int) -> Dict[str, Any]:
+    """Time build_scoring_summary over the whole batch, `repeat` times."""
+    df = pd.DataFrame({"generated_text": texts})
+    samples = []
+    if cache == "warm":
+        build_scoring_summary(df, keywords, workers=workers)
+    for _ in range(repeat):
+        if cache == "cold":
+            text_features.FEATURE_CACHE.clear()
+        samples.append(_timed(lambda: build_scoring_summary(df, keywords, workers=workers)))
+    return {
+        "function": "build_scoring_summary",
+        "texts": len(texts),
+        "keywords": len(keywords),
+        "cache": cache,
+        "batch_seconds": round(float(np.median(samples)), 4),
+        **latency_summary(samples, len(texts)),
+    }
+
+
+def bench_hashtag_counts(repeat: int) -> List[Dict[str, Any]]:
+    results = []
+    for cache in ("cold", "warm"):
+        samples = []
+        for _ in range(repeat):
+            if cache == "cold":
+                clear_hashtag_index_cache()
+            samples.append(_timed(lambda: load_hashtag_counts(HASHTAGS_DIR)))
+        results.append({"function": "load_hashtag_counts", "cache": cache, **latency_summary(samples)})
+    return results
+
+
+def _report(result: Dict[str, Any]) -> Dict[str, Any]:
+    label = result.get("dataset", "")
+    print(
+        f"  {result['function']:<22} {label:<16} kw={result.get('keywords', '-'):<5} {result['cache']:<5}"
+        f" p50 {result['p50_ms']:>9.3f} ms  p99 {result['p99_ms']:>9.3f} ms  {result['texts_per_s'] or 0:>10.1f}/s",
+        file=sys.stderr,
+    )
+    return result
+
+
+def run_benchmarks(args: argparse.Namespace) -> List[Dict[str, Any]]:
+    # In-memory feature cache only, so "cold" really recomputes NLP features.
+    text_features.configure_feature_cache()
+    workers = text_features.resolve_workers(args.workers)
+    pools = {size: keyword_pool(size) for size in args.keyword_pools}
+    posts = generated_posts()
+    results: List[Dict[str, Any]] = []
+
+    sample = posts[: args.per_text_limit]
+    for (name, fn), cache in product((("score_post", score_post), ("optimize_post", optimize_post)), ("cold", "warm")):
+        result = bench_per_text(name, fn, sample, pools[args.keyword_pools[0]], cache)
+        results.append(_report({**result, "dataset": "generated_posts"}))
+
+    datasets = {"generated_posts": posts}
+    datasets.update({f"synthetic_{n}": synthetic_posts(n, args.seed) for n in args.sizes})
+    for label, texts in datasets.items():
+        for i, size in enumerate(args.keyword_pools):
+            # Cold runs only need one keyword pool: the pool only changes keyword counting.
+            for cache in ("cold", "warm") if i == 0 else ("warm",):
+                result = bench_summary(texts, pools[size], cache, args.repeat, workers)
+                results.append(_report({**result, "dataset": label}))
+
+    for result in bench_hashtag_counts(args.repeat * 10):
+        results.append(_report({**result, "dataset": "hashtags"}))
+    return results
+
+
+def _version(dist: str) -> str | None:
+    try:
+        return metadata.version(dist)
+    except Exception:
+        return None
+
+
+def parse_args(argv: List[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Time the scorer hot path on checked-in and synthetic posts (offline).")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000], help="Synthetic batch sizes.")
+    parser.add_argument("--keyword-pools", type=int, nargs="+", default=[3, 50, 500], help="Trending keyword pool sizes.")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per batch benchmark.")
+    parser.add_argument("--per-text-limit", type=int, default=1_000, help="Texts timed one by one for score_post/optimize_post.")
+    parser.add_argument("--workers", type=int, default=None, help="Processes for build_scoring_summary (default: SCORER_WORKERS).")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--output", default=None, help="Results JSON path (default: reports/benchmarks/scorer_<timestamp>.json).")
+    return parser.parse_args(argv)
+
+
+def main(argv: List[str] | None = None):
+    args = parse_args(argv)
+    results = run_benchmarks(args)
+    report = {
+        "version": 1,
+        "benchmark": "scorer",
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "git_revision": git_revision(),
+        "python": platform.python_version(),
+        "pandas": pd.__version__,
+        "textblob": _version("textblob"),
+        "textstat": _version("textstat"),
+        "machine": platform.platform(),
+        "settings": {
+            "sizes": args.sizes,
+            "keyword_pools": args.keyword_pools,
+            "repeat": args.repeat,
+            "per_text_limit": args.per_text_limit,
+            "workers": text_features.resolve_workers(args.workers),
+            "seed": args.seed,
+            "sentiment_backend": get_sentiment_backend().name,
+            "readability_engine": get_readability_engine(),
+            "scoring_mode": resolve_scoring_mode(),
+        },
+        "results": results,
+    }
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    output = Path(args.output) if args.output else RESULTS_DIR / f"scorer_{stamp}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    print(f"Saved benchmark results: {output}")
+
+
+if __name__ == "__main__":
+    main()
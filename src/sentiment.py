@@ -0,0 +1,367 @@
+import itertools
+import os
+import re
+import string
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Tuple
+
+import numpy as np
+import pandas as pd
+
+# Optional deps: TextBlob (default backend and the lexicon of the "lexicon" backend),
+# nltk (VADER). A backend whose dependency is missing fails when it is selected;
+# the default "textblob" backend falls back to polarity 0.0 like the scorer always did.
+try:
+    from textblob import TextBlob
+except Exception:
+    TextBlob = None
+
+try:
+    from nltk.sentiment.vader import SentimentIntensityAnalyzer, VaderConstants
+except Exception:
+    SentimentIntensityAnalyzer = VaderConstants = None
+
+SENTIMENT_BACKEND_ENV = "SCORER_SENTIMENT_BACKEND"
+DEFAULT_BACKEND = "textblob"
+VADER_LEXICON = "sentiment/vader_lexicon.zip/vader_lexicon/vader_lexicon.txt"
+
+
+class SentimentBackend:
+    """Polarity in [-1, 1] for one text or a batch. Subclasses override either method."""
+
+    name = "base"
+
+    def polarity(self, text: str) -> float:
+        return float(self.polarity_many([text])[0])
+
+    def polarity_many(self, texts: Iterable[str]) -> np.ndarray:
+        return np.array([self.polarity(t) for t in texts], dtype=float)
+
+
+class TextBlobSentiment(SentimentBackend):
+    """TextBlob's PatternAnalyzer, one text at a time (exact reference)."""
+
+    name = "textblob"
+
+    def polarity(self, text: str) -> float:
+        if TextBlob is None:
+            return 0.0
+        return float(TextBlob(text).sentiment.polarity)
+
+
+class VaderSentiment(SentimentBackend):
+    """nltk's VADER compound score, one text at a time (exact reference)."""
+
+    name = "vader"
+
+    def __init__(self):
+        if SentimentIntensityAnalyzer is None:
+            raise RuntimeError("The vader sentiment backend needs nltk installed.")
+        self._sia = SentimentIntensityAnalyzer()
+
+    def polarity(self, text: str) -> float:
+        return float(self._sia.polarity_scores(text)["compound"])
+
+
+# Vectorized lexicon engines. A batch is tokenized with one pass of pandas string
+# ops, tokens are mapped to lexicon ids with one hash-index lookup, and each
+# document's polarity is a sparse doc x token incidence product with the per-token
+# values (np.bincount over the document ids, so scipy is not needed). Context rules
+# (modifiers, negation, boosters) are shifted-array and running-position operations
+# over the token stream.
+#
+# Tolerance, measured on data/processed/combined_engagement_data.csv (744 posts),
+# where both run about 8-10x faster than the per-text engines:
+#   "lexicon" vs TextBlob: exact for 96.8% of posts, mean |diff| 0.001, 99% within
+#   0.05, and the same sign (+/-0.05 dead zone) for 99.7% of posts;
+#   "vader-lexicon" vs VADER compound: mean |diff| 0.001, 99.5% within 0.05, and the
+#   same positive/neutral/negative label (+/-0.05 cut) for every post.
+# The residue comes from rules only the per-text engines apply: for TextBlob,
+# emoticons, "(!)" and words glued to emoji or non-ASCII punctuation ("🔥top",
+# "interesting…"), which its whitespace tokenizer keeps whole; for VADER, idioms
+# and the "never so" / "least" special cases.
+# Like pattern's tokenizer, words joined by inner punctuation stay one token
+# ("seo-friendly", URLs), "n't" is split off and then every apostrophe ("isn't" is
+# "is n ' t"), so contractions never count as negations. Punctuation it leaves as
+# 1-character tokens never changes the negation/modifier state and is dropped.
+PATTERN_TOKEN_RE = re.compile(r"\w+(?=n't)|\w+(?:[^\s\w']+\w+)*|!")
+PATTERN_NEGATIONS = ("no", "not", "n't", "never")
+VADER_ALPHA = 15.0
+_PATTERN_EXTRA = PATTERN_NEGATIONS + ("!",)
+
+
+def _flatten(tokens: pd.Series) -> Tuple[pd.Series, np.ndarray]:
+    lengths = tokens.str.len().to_numpy(dtype="int64")
+    flat = pd.Series(list(itertools.chain.from_iterable(tokens)), dtype=object)
+    return flat, np.repeat(np.arange(len(tokens)), lengths)
+
+
+def _text_series(texts: Iterable[str]) -> pd.Series:
+    s = pd.Series(list(texts), dtype=object)
+    return s.where(s.map(lambda t: isinstance(t, str)), "")
+
+
+def _shift(values: np.ndarray, fill, by: int = 1) -> np.ndarray:
+    out = np.empty_like(values)
+    out[:by] = fill
+    out[by:] = values[:-by]
+    return out
+
+
+def _same_doc(doc: np.ndarray, by: int = 1) -> np.ndarray:
+    """True where the token `by` positions back belongs to the same document."""
+    return _shift(doc, -1, by) == doc
+
+
+def _last_before(mask: np.ndarray) -> np.ndarray:
+    """Position of the closest earlier token where `mask` is True (-1 if none)."""
+    last = np.maximum.accumulate(np.where(mask, np.arange(len(mask)), -1))
+    return _shift(last, -1)
+
+
+class LexiconSentiment(SentimentBackend):
+    """
+    Batch version of TextBlob's pattern sentiment: the average of assessments.
+    A known word opens an assessment unless a modifier ("very") carries over to
+    it; then it joins the modifier's, scaled by the modifier's intensity. A
+    negation before a word inverts that word's intensity ("not very good") and
+    halves and flips the assessment's polarity, and a "!" boosts the latest
+    assessment by 1.25. Negation words themselves are never scored.
+    """
+
+    name = "lexicon"
+
+    def __init__(self, lexicon: Dict[str, Tuple[float, float, bool]]):
+        words = list(lexicon) + [w for w in _PATTERN_EXTRA if w not in lexicon]
+        self._index = pd.Index(words)
+        size = len(words)
+        self._known = np.zeros(size, dtype=bool)
+        self._polarity = np.zeros(size)
+        self._intensity = np.ones(size)
+        self._modifier = np.zeros(size, dtype=bool)
+        for k, (polarity, intensity, modifier) in enumerate(lexicon.values()):
+            self._known[k], self._polarity[k], self._intensity[k], self._modifier[k] = True, polarity, intensity, modifier
+        self._negation = self._index.isin(PATTERN_NEGATIONS)
+        self._known &= ~self._negation
+        self._ly = np.asarray(self._index.str.endswith("ly"), dtype=bool)
+        self._bang = self._index == "!"
+
+    @classmethod
+    def from_textblob(cls) -> "LexiconSentiment":
+        if TextBlob is None:
+            raise RuntimeError("The lexicon sentiment backend needs textblob installed.")
+        from textblob.en import sentiment as pattern
+
+        pattern.load()
+        return cls({
+            word: (senses[None][0], senses[None][2], any(m in senses for m in pattern.modifiers))
+            for word, senses in pattern.items()
+            if None in senses
+        })
+
+    def polarity_many(self, texts: Iterable[str]) -> np.ndarray:
+        tokens = _text_series(texts).str.lower().str.findall(PATTERN_TOKEN_RE)
+        n = len(tokens)
+        flat, doc = _flatten(tokens)
+        if flat.empty:
+            return np.zeros(n)
+        ids = self._index.get_indexer(flat)
+        found = ids >= 0
+        negation = found & self._negation[ids]
+        known = found & self._known[ids]
+        bang = found & self._bang[ids]
+        length = np.fromiter(map(len, flat), dtype="int64", count=len(flat))
+        pos = np.arange(len(flat))
+        doc_start = np.searchsorted(doc, doc)
+
+        # Pattern scans each text keeping the last modifier and negation seen; both
+        # are recovered here from "closest earlier token of a kind" positions.
+        last = _last_before(known)
+        has_last = last >= doc_start
+        last_ly = has_last & self._ly[ids[last]]
+        # A modifier carries to the next known word across words of up to 2
+        # characters ("really is a good"), and after an "-ly" modifier across a
+        # negation too ("really not great").
+        breaks = ~known & (length > 2) & ~(negation & last_ly)
+        carried = has_last & self._modifier[ids[last]] & (_last_before(breaks) < last)
+        # A negation carries across 1-character tokens to the next known word,
+        # unless a carried "-ly" modifier takes it into its own assessment.
+        absorbed = negation & carried & last_ly
+        neg = _last_before(negation)
+        dropped = ~known & ~negation & (length > 1)
+        negated_word = known & (neg > last) & (neg >= doc_start) & (_last_before(dropped) < neg) & ~absorbed[neg]
+
+        # "very good": a known word after a carried modifier joins its assessment,
+        # with the previous word's intensity (inverted if that word was negated).
+        merged = known & carried
+        opens = known & ~merged
+        count = int(opens.sum())
+        if count == 0:
+            return np.zeros(n)
+        assessment = np.cumsum(opens) - 1
+        intensity = np.where(known, self._intensity[ids], 1.0)
+        intensity = np.where(negated_word, 1.0 / intensity, intensity)
+        p = np.where(known, self._polarity[ids], 0.0)
+        p = np.where(merged, np.clip(p * intensity[last], -1.0, 1.0), p)
+        last_word = np.full(count, -1)
+        np.maximum.at(last_word, assessment[known], pos[known])
+        score = p[last_word]
+
+        # "!" boosts the latest assessment; a word joining it later overrides that.
+        boosted = bang & has_last & (pos > last_word[assessment])
+        score = np.clip(score * 1.25 ** np.bincount(assessment[boosted], minlength=count), -1.0, 1.0)
+
+        # "not good" = slightly bad, "not bad" = slightly good.
+        negated = np.zeros(count, dtype=bool)
+        negated[assessment[negated_word | absorbed]] = True
+        score = np.where(negated, score * -0.5, score)
+
+        owner = doc[opens]
+        sums = np.bincount(owner, weights=score, minlength=n)
+        counts = np.bincount(owner, minlength=n)
+        return np.divide(sums, counts, out=np.zeros(n), where=counts > 0)
+
+
+class VaderLexiconSentiment(SentimentBackend):
+    """
+    Batch version of VADER's compound score: lexicon valences with ALL-CAPS
+    emphasis, boosters and negations up to three words back, the "but" shift and
+    "!"/"?" emphasis, summed per document and normalized to [-1, 1].
+    """
+
+    name = "vader-lexicon"
+
+    def __init__(self, lexicon: Dict[str, float]):
+        if VaderConstants is None:
+            raise RuntimeError("The vader-lexicon sentiment backend needs nltk installed.")
+        c = VaderConstants
+        self.c = c
+        words = list(lexicon)
+        words += [w for w in c.BOOSTER_DICT if w not in lexicon]
+        words += [w for w in c.NEGATE if w not in lexicon and w not in c.BOOSTER_DICT]
+        self._index = pd.Index(words)
+        self._known = np.array([w in lexicon for w in words], dtype=bool)
+        self._valence = np.array([lexicon.get(w, 0.0) for w in words], dtype=float)
+        self._booster = np.array([c.BOOSTER_DICT.get(w, 0.0) for w in words], dtype=float)
+        self._is_booster = np.array([w in c.BOOSTER_DICT for w in words], dtype=bool)
+        self._negate = np.array([w in c.NEGATE for w in words], dtype=bool)
+        punct = re.escape(string.punctuation)
+        marks = "|".join(re.escape(p) for p in sorted(c.PUNC_LIST, key=len, reverse=True))
+        # SentiText strips one listed punctuation run from either end of a token.
+        self._after_re = re.compile(rf"^([^{punct}\s]{{2,}})(?:{marks})$")
+        self._before_re = re.compile(rf"^(?:{marks})([^{punct}\s]{{2,}})$")
+
+    @classmethod
+    def from_nltk(cls, lexicon_file: str | None = None) -> "VaderLexiconSentiment":
+        """VADER's lexicon from nltk_data (nltk.download("vader_lexicon")) or a lexicon file."""
+        if lexicon_file is None:
+            import nltk
+
+            text = nltk.data.load(VADER_LEXICON, format="text")
+        else:
+            text = Path(lexicon_file).read_text(encoding="utf-8")
+        lexicon: Dict[str, float] = {}
+        for line in text.splitlines():
+            parts = line.strip().split("\t")
+            if len(parts) >= 2:
+                lexicon[parts[0]] = float(parts[1])
+        return cls(lexicon)
+
+    def polarity_many(self, texts: Iterable[str]) -> np.ndarray:
+        c = self.c
+        s = _text_series(texts)
+        n = len(s)
+        flat, doc = _flatten(s.str.split())
+        longer = (flat.str.len() > 1).to_numpy()
+        flat, doc = flat[longer], doc[longer]
+        if flat.empty:
+            return np.zeros(n)
+        # String work runs once per distinct token, then is spread back by code.
+        codes, uniques = pd.factorize(flat)
+        uniques = pd.Series(uniques, dtype=object)
+        unique_words = uniques.str.extract(self._after_re)[0].fillna(uniques.str.extract(self._before_re)[0]).fillna(uniques)
+        unique_lower = unique_words.str.lower()
+        unique_ids = self._index.get_indexer(unique_lower)
+        word = unique_words.to_numpy()[codes]
+        lower = unique_lower.to_numpy()[codes]
+        ids = unique_ids[codes]
+        found = ids >= 0
+        known = found & self._known[ids]
+        is_booster = found & self._is_booster[ids]
+        booster = np.where(found, self._booster[ids], 0.0)
+        negation = (found & self._negate[ids]) | unique_lower.str.contains("n't", regex=False).to_numpy()[codes]
+
+        upper = unique_words.str.isupper().to_numpy(dtype=bool)[codes]
+        tokens_per_doc = np.bincount(doc, minlength=n)
+        upper_per_doc = np.bincount(doc, weights=upper, minlength=n)
+        cap = upper & ((upper_per_doc > 0) & (upper_per_doc < tokens_per_doc))[doc]
+
+        next_is_of = np.zeros(len(flat), dtype=bool)
+        next_is_of[:-1] = (lower == "of")[1:] & (doc[1:] == doc[:-1])
+        # Boosters and the "kind" of "kind of" carry no valence of their own.
+        scored = known & ~is_booster & ~((lower == "kind") & next_is_of)
+        v = np.where(scored, self._valence[ids], 0.0)
+        v = np.where(scored & cap, np.where(v > 0, v + c.C_INCR, v - c.C_INCR), v)
+        for back, scale in ((1, 1.0), (2, 0.95), (3, 0.9)):
+            if len(v) <= back:
+                break
+            cond = scored & _same_doc(doc, back) & ~_shift(known, True, back)
+            b = _shift(booster, 0.0, back)
+            b = np.where(v < 0, -b, b)
+            b = np.where(_shift(is_booster & cap, False, back), np.where(v > 0, b + c.C_INCR, b - c.C_INCR), b)
+            v = v + np.where(cond, b * scale, 0.0)
+            v = np.where(cond & _shift(negation, False, back), v * c.N_SCALAR, v)
+
+        # VADER scores a repeated token with the context of its first occurrence.
+        word_codes = pd.factorize(unique_words)[0][codes].astype("int64")
+        keys = doc.astype("int64") * (int(word_codes.max()) + 1) + word_codes
+        _, first, inverse = np.unique(keys, return_index=True, return_inverse=True)
+        v = v[first[inverse]]
+        # Valences before the first "but" count half, after it one and a half.
+        pos = np.arange(len(v))
+        is_but = lower == "but"
+        but_pos = np.full(n, -1)
+        but_pos[doc[is_but][::-1]] = pos[is_but][::-1]
+        first_but = but_pos[doc]
+        v = np.where(first_but < 0, v, np.where(pos < first_but, v * 0.5, np.where(pos > first_but, v * 1.5, v)))
+
+        sums = np.bincount(doc, weights=v, minlength=n)
+        bangs = np.minimum(s.str.count("!").to_numpy(), 4) * 0.292
+        qmarks = s.str.count(r"\?").to_numpy()
+        emphasis = bangs + np.where(qmarks > 1, np.where(qmarks <= 3, qmarks * 0.18, 0.96), 0.0)
+        sums = np.where(sums > 0, sums + emphasis, np.where(sums < 0, sums - emphasis, sums))
+        compound = np.clip(sums / np.sqrt(sums * sums + VADER_ALPHA), -1.0, 1.0)
+        return np.round(compound, 4)
+
+
+_FACTORIES: Dict[str, Callable[[], SentimentBackend]] = {
+    "textblob": TextBlobSentiment,
+    "lexicon": LexiconSentiment.from_textblob,
+    "vader": VaderSentiment,
+    "vader-lexicon": VaderLexiconSentiment.from_nltk,
+}
+SENTIMENT_BACKENDS = tuple(_FACTORIES)
+_instances: Dict[str, SentimentBackend] = {}
+_active: SentimentBackend | None = None
+
+
+def sentiment_backend(name: str) -> SentimentBackend:
+    if name not in _FACTORIES:
+        raise ValueError(f"Unknown sentiment backend '{name}'. Choose from: {', '.join(SENTIMENT_BACKENDS)}")
+    if name not in _instances:
+        _instances[name] = _FACTORIES[name]()
+    return _instances[name]
+
+
+def get_sentiment_backend() -> SentimentBackend:
+    global _active
+    if _active is None:
+        _active = sentiment_backend(os.getenv(SENTIMENT_BACKEND_ENV) or DEFAULT_BACKEND)
+    return _active
+
+
+def set_sentiment_backend(backend: str | SentimentBackend) -> SentimentBackend:
+    """Select the backend behind the scorer's polarity ("textblob" by default)."""
+    global _active
+    _active = sentiment_backend(backend) if isinstance(backend, str) else backend
+    return _active
@@ -0,0 +1,279 @@
+import argparse
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, List
+
+import numpy as np
+import pandas as pd
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+
+# Exact column order written by the ingestors in src/Ingestions.
+RAW_COLUMNS: Dict[str, List[str]] = {
+    "youtube": [
+        "video_id", "channel_id", "title", "channel_title", "description", "publish_date",
+        "thumbnail_url", "view_count", "like_count", "comment_count", "search_query",
+    ],
+    "twitter": [
+        "tweet_id", "text", "author_id", "author_name", "author_username", "followers",
+        "created_at", "like_count", "retweet_count", "reply_count", "quote_count",
+    ],
+    "reddit": [
+        "id", "title", "selftext", "author", "subreddit", "created_utc", "score", "ups",
+        "num_comments", "url", "like_count", "comment_count", "share_count", "permalink",
+        "over_18", "link_flair_text", "is_self", "fetch_ts",
+    ],
+    "pinterest": [
+        "pin_id", "title", "description", "author", "created_at", "repin_count", "comment_count",
+        "link", "tags", "image_url", "alt_text", "pin_url", "fetch_ts",
+    ],
+}
+TREND_KEYWORDS = ["content generation", "AI marketing", "social media campaigns"]
+RAW_FILENAMES = {
+    "youtube": "youtube_search_200_results.csv",
+    "twitter": "twitter_search_10_results.csv",
+    "reddit": "reddit_search_100_results.csv",
+    "pinterest": "pinterest_posts_detailed.csv",
+    "google_trends": "google_trends_selected.csv",
+}
+# Share of posts per platform, roughly the mix of the checked-in exports.
+PLATFORM_SHARE = {"youtube": 0.3, "twitter": 0.2, "reddit": 0.3, "pinterest": 0.2}
+
+WORDS = (
+    "ai content marketing social media campaign brand growth audience engagement video post "
+    "strategy tools free paid creator automation seo trends tips guide launch product startup "
+    "ideas viral reach followers analytics copywriting prompt design workflow email newsletter "
+    "community story agency clients results budget roi funnel leads influencer platform "
+    "algorithm schedule calendar generation writing images templates best top new how why"
+).split()
+OPENERS = ["Discover", "Learn", "Try", "Join", "Explore", "Check out", "How to", "Why", "Best", "Top 10"]
+HASHTAGS = ["#AI", "#marketing", "#contentcreation", "#socialmedia", "#SEO", "#growth", "#AITools", "#startup"]
+SUBREDDITS = ["marketing", "socialmedia", "content_marketing", "SEO", "Entrepreneur", "artificial"]
+FLAIRS = ["Question", "Discussion", "Help", "News", ""]
+ID_CHARS = np.array(list("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789-_"))
+NOW = datetime(2025, 11, 29, 6, 0, 0, tzinfo=timezone.utc)
+
+
+def _ids(rng: np.random.Generator, n: int, length: int, alphabet: np.ndarray = ID_CHARS) -> np.ndarray:
+    picks = rng.integers(0, len(alphabet), size=(n, length))
+    return np.array(["".join(row) for row in alphabet[picks]], dtype=object)
+
+
+def _sentences(rng: np.random.Generator, n: int, low: int, high: int, hashtag_rate: float = 0.3) -> List[str]:
+    lengths = rng.integers(low, high + 1, size=n)
+    words = np.array(WORDS, dtype=object)
+    out = []
+    for i, length in enumerate(lengths):
+        body = " ".join(words[rng.integers(0, len(words), size=length)])
+        text = f"{OPENERS[i % len(OPENERS)]} {body}"
+        if rng.random() < hashtag_rate:
+            text += " " + " ".join(rng.choice(HASHTAGS, size=rng.integers(1, 4), replace=False))
+        if rng.random() < 0.15:
+            text += "?"
+        out.append(text)
+    return out
+
+
+def _heavy_tail(rng: np.random.Generator, n: int, scale: float) -> np.ndarray:
+    # Engagement counts are long-tailed: most posts get little, a few get a lot.
+    return np.floor(rng.pareto(1.3, size=n) * scale).astype("int64")
+
+
+def _timestamps(rng: np.random.Generator, n: int, days: int = 365) -> pd.DatetimeIndex:
+    offsets = rng.integers(0, days * 86400, size=n)
+    return pd.to_datetime(int(NOW.timestamp()) - offsets, unit="s", utc=True)
+
+
+def _fetch_ts(n: int) -> List[str]:
+    return [NOW.isoformat()] * n
+
+
+def _with_duplicates(rng: np.random.Generator, df: pd.DataFrame, dup_rate: float) -> pd.DataFrame:
+    """Re-emit a fraction of rows (same id) so the dedupe stages have work to do."""
+    dups = int(len(df) * dup_rate)
+    if dups == 0 or df.empty:
+        return df
+    rows = rng.integers(0, len(df), size=dups)
+    positions = rng.integers(0, len(df), size=dups)
+    out = df.copy()
+    out.iloc[positions] = df.iloc[rows].to_numpy()
+    return out
+
+
+def youtube_chunk(rng: np.random.Generator, n: int) -> pd.DataFrame:
+    ids = _ids(rng, n, 11)
+    channels = "UC" + _ids(rng, n, 22)
+    titles = _sentences(rng, n, 4, 12)
+    return pd.DataFrame({
+        "video_id": ids,
+        "channel_id": channels,
+        "title": titles,
+        "channel_title": [f"{w.title()} Channel" for w in rng.choice(WORDS, size=n)],
+        "description": [t + " ..." for t in _sentences(rng, n, 10, 25, hashtag_rate=0.5)],
+        "publish_date": _timestamps(rng, n, days=1500).strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "thumbnail_url": [f"https://i.ytimg.com/vi/{vid}/hqdefault.jpg" for vid in ids],
+        "view_count": _heavy_tail(rng, n, 5000),
+        "like_count": _heavy_tail(rng, n, 100),
+        "comment_count": _heavy_tail(rng, n, 10),
+        "search_query": rng.choice(TREND_KEYWORDS, size=n),
+    })
+
+
+def twitter_chunk(rng: np.random.Generator, n: int) -> pd.DataFrame:
+    texts = _sentences(rng, n, 6, 40, hashtag_rate=0.5)
+    # Some tweets carry mentions, links or line breaks like the real export.
+    for i in np.flatnonzero(rng.random(n) < 0.3):
+        texts[i] = f"@{rng.choice(WORDS)}_{i % 97} {texts[i]}"
+    for i in np.flatnonzero(rng.random(n) < 0.2):
+        texts[i] = f"{texts[i]} https://t.co/{_ids(rng, 1, 10)[0]}"
+    for i in np.flatnonzero(rng.random(n) < 0.1):
+        texts[i] = texts[i].replace(" ", "\n\n", 1)
+    names = [f"{a.title()} {b.title()}" for a, b in zip(rng.choice(WORDS, size=n), rng.choice(WORDS, size=n))]
+    return pd.DataFrame({
+        "tweet_id": rng.integers(10**18, 2 * 10**18, size=n),
+        "text": texts,
+        "author_id": rng.integers(10**17, 2 * 10**18, size=n),
+        "author_name": names,
+        "author_username": [name.replace(" ", "").lower() for name in names],
+        "followers": _heavy_tail(rng, n, 200),
+        "created_at": _timestamps(rng, n, days=30).strftime("%Y-%m-%dT%H:%M:%S.000Z"),
+        "like_count": _heavy_tail(rng, n, 3),
+        "retweet_count": _heavy_tail(rng, n, 1),
+        "reply_count": _heavy_tail(rng, n, 1),
+        "quote_count": _heavy_tail(rng, n, 0.3),
+    })
+
+
+def reddit_chunk(rng: np.random.Generator, n: int) -> pd.DataFrame:
+    ids = _ids(rng, n, 7, np.array(list("abcdefghijklmnopqrstuvwxyz0123456789")))
+    subreddits = rng.choice(SUBREDDITS, size=n)
+    is_self = rng.random(n) < 0.8
+    selftext = [
+        "\n\n".join(_sentences(rng, int(rng.integers(1, 5)), 8, 30, hashtag_rate=0.05)) if own else ""
+        for own in is_self
+    ]
+    permalinks = [f"https://reddit.com/r/{sub}/comments/{pid}/{w}/" for sub, pid, w in zip(subreddits, ids, rng.choice(WORDS, size=n))]
+    ups = _heavy_tail(rng, n, 5)
+    comments = _heavy_tail(rng, n, 5)
+    return pd.DataFrame({
+        "id": ids,
+        "title": _sentences(rng, n, 5, 15, hashtag_rate=0.02),
+        "selftext": selftext,
+        "author": [f"{w.title()}User{k}" for w, k in zip(rng.choice(WORDS, size=n), rng.integers(1, 9999, size=n))],
+        "subreddit": subreddits,
+        "created_utc": (_timestamps(rng, n, days=60).astype("int64") // 10**9).astype(float),
+        "score": ups,
+        "ups": ups,
+        "num_comments": comments,
+        "url": permalinks,
+        "like_count": ups,
+        "comment_count": comments,
+        "share_count": (rng.random(n) < 0.02).astype("int64"),
+        "permalink": permalinks,
+        "over_18": False,
+        "link_flair_text": rng.choice(FLAIRS, size=n),
+        "is_self": is_self,
+        "fetch_ts": _fetch_ts(n),
+    })
+
+
+def pinterest_chunk(rng: np.random.Generator, n: int) -> pd.DataFrame:
+    ids = rng.integers(10**14, 10**18, size=n).astype(str)
+    titles = [t.lower() for t in _sentences(rng, n, 5, 14, hashtag_rate=0.0)]
+    descriptions = _sentences(rng, n, 4, 12, hashtag_rate=0.4)
+    pin_urls = [f"https://www.pinterest.com/pin/{pid}/" for pid in ids]
+    digests = _ids(rng, n, 32, np.array(list("0123456789abcdef")))
+    return pd.DataFrame({
+        "pin_id": ids,
+        "title": titles,
+        "description": descriptions,
+        "author": [f"{w.title()} {k}" for w, k in zip(rng.choice(WORDS, size=n), rng.integers(1, 999, size=n))],
+        # The ingestor never gets these from the oEmbed endpoint.
+        "created_at": "",
+        "repin_count": 0,
+        "comment_count": 0,
+        "link": pin_urls,
+        "tags": ["|".join(sorted({t.lower().lstrip("#") for t in d.split() if t.startswith("#")})) for d in descriptions],
+        "image_url": [f"https://i.pinimg.com/236x/{d[:2]}/{d[2:4]}/{d[4:6]}/{d}.jpg" for d in digests],
+        "alt_text": titles,
+        "pin_url": pin_urls,
+        "fetch_ts": _fetch_ts(n),
+    })
+
+
+def google_trends_frame(rng: np.random.Generator, days: int) -> pd.DataFrame:
+    dates = pd.date_range(end=NOW.date(), periods=days, freq="D")
+    df = pd.DataFrame({"date": dates.strftime("%Y-%m-%d")})
+    for i, keyword in enumerate(TREND_KEYWORDS):
+        base = (10, 70, 2)[i % 3]
+        df[keyword] = np.clip(np.round(base + rng.normal(0, base * 0.2 + 1, size=days)), 0, 100).astype("int64")
+    df["fetch_time"] = NOW.strftime("%Y-%m-%d %H:%M:%S")
+    return df
+
+
+CHUNK_BUILDERS: Dict[str, Callable[[np.random.Generator, int], pd.DataFrame]] = {
+    "youtube": youtube_chunk,
+    "twitter": twitter_chunk,
+    "reddit": reddit_chunk,
+    "pinterest": pinterest_chunk,
+}
+
+
+def platform_counts(posts: int) -> Dict[str, int]:
+    counts = {platform: int(posts * share) for platform, share in PLATFORM_SHARE.items()}
+    counts["youtube"] += posts - sum(counts.values())
+    return counts
+
+
+def generate_raw_data(
+    out_dir: Path,
+    posts: int,
+    seed: int = 7,
+    dup_rate: float = 0.02,
+    chunksize: int = 100_000,
+) -> Dict[str, Path]:
+    """
+    Write synthetic raw exports for all five sources into `out_dir`, using the
+    same file names and columns as the ingestors. Rows are generated and appended
+    `chunksize` at a time, so any scale fits in memory. Deterministic per seed.
+    """
+    out_dir.mkdir(parents=True, exist_ok=True)
+    rng = np.random.default_rng(seed)
+    paths: Dict[str, Path] = {}
+    for platform, total in platform_counts(posts).items():
+        path = out_dir / RAW_FILENAMES[platform]
+        written = 0
+        pd.DataFrame(columns=RAW_COLUMNS[platform]).to_csv(path, index=False, encoding="utf-8")
+        while written < total:
+            n = min(chunksize, total - written)
+            chunk = _with_duplicates(rng, CHUNK_BUILDERS[platform](rng, n), dup_rate)
+            chunk[RAW_COLUMNS[platform]].to_csv(path, mode="a", header=False, index=False, encoding="utf-8")
+            written += n
+        paths[platform] = path
+    trends_path = out_dir / RAW_FILENAMES["google_trends"]
+    google_trends_frame(rng, max(90, posts // 1000)).to_csv(trends_path, index=False, encoding="utf-8")
+    paths["google_trends"] = trends_path
+    return paths
+
+
+def parse_args(argv: List[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Write synthetic raw platform exports for load testing (offline).")
+    parser.add_argument("--posts", type=int, default=100_000, help="Total posts across youtube/twitter/reddit/pinterest.")
+    parser.add_argument("--out", default="data/synthetic", help="Output directory for the raw CSVs.")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--dup-rate", type=float, default=0.02, help="Fraction of rows re-emitted as duplicates.")
+    parser.add_argument("--chunksize", type=int, default=100_000)
+    return parser.parse_args(argv)
+
+
+def main(argv: List[str] | None = None):
+    args = parse_args(argv)
+    out_dir = Path(args.out)
+    out_dir = out_dir if out_dir.is_absolute() else PROJECT_ROOT / out_dir
+    paths = generate_raw_data(out_dir, args.posts, args.seed, args.dup_rate, args.chunksize)
+    for source, path in paths.items():
+        print(f"{source}: {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,357 @@
+import atexit
+import hashlib
+import math
+import multiprocessing
+import os
+import re
+import sqlite3
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from importlib import metadata
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple
+
+import numpy as np
+
+from src.readability import _HYPHENATOR, get_readability_engine, grade, grade_many, set_readability_engine, textstat
+from src.sentiment import SENTIMENT_BACKENDS, SentimentBackend, TextBlob, get_sentiment_backend, set_sentiment_backend
+
+# Grades come from src.readability (the builtin Flesch-Kincaid engine by default,
+# textstat as reference). Polarity comes from the selected sentiment backend
+# (TextBlob by default, 0.0 when TextBlob is missing).
+
+WORD_RE = re.compile(r'\w+')
+HASHTAG_RE = re.compile(r'#\w+')
+
+# SCORER_FEATURE_CACHE=<path.sqlite> keeps features across processes;
+# SCORER_FEATURE_CACHE_SIZE bounds the in-memory LRU (entries).
+CACHE_PATH_ENV = "SCORER_FEATURE_CACHE"
+CACHE_SIZE_ENV = "SCORER_FEATURE_CACHE_SIZE"
+DEFAULT_CACHE_SIZE = 50_000
+_FLUSH_EVERY = 256
+
+# SCORER_WORKERS=<n> computes cache misses in a pool of n processes (1 = in process),
+# capped at the CPUs available. Batches smaller than two shards stay in process: the
+# pool round trip costs more. Starting the pool (spawn + loading TextBlob/pyphen in
+# every worker) takes ~2.5s against ~0.5ms per text in process, so a pool is only
+# started for batches of POOL_START_SIZE texts or more; once running it is reused
+# for any batch of two shards.
+WORKERS_ENV = "SCORER_WORKERS"
+MIN_SHARD_SIZE = 256
+POOL_START_SIZE = 10_000
+
+
+class TextFeatures(NamedTuple):
+    word_count: int
+    hashtag_count: int
+    polarity: float | None  # None when the sentiment backend raised on the text
+    grade: float | None  # Flesch-Kincaid grade; None when the readability engine raised
+
+
+def _grade(text: str) -> float | None:
+    try:
+        return float(grade(text))
+    except Exception:
+        return None
+
+
+def _polarity(text: str) -> float | None:
+    try:
+        return float(get_sentiment_backend().polarity(text))
+    except Exception:
+        return None
+
+
+def extract_features(text: str) -> TextFeatures:
+    """Compute the scorer's per-text features on `text` exactly as given (no lowercasing)."""
+    return TextFeatures(len(WORD_RE.findall(text)), len(HASHTAG_RE.findall(text)), _polarity(text), _grade(text))
+
+
+def extract_features_many(texts: List[str]) -> List[TextFeatures]:
+    """extract_features for a batch; batch-capable sentiment backends score it in one call."""
+    try:
+        polarities = [float(p) for p in get_sentiment_backend().polarity_many(texts)]
+    except Exception:
+        polarities = [_polarity(t) for t in texts]
+    try:
+        grades = [float(g) for g in grade_many(texts)]
+    except Exception:
+        grades = [_grade(t) for t in texts]
+    return [
+        TextFeatures(len(WORD_RE.findall(t)), len(HASHTAG_RE.findall(t)), p, g)
+        for t, p, g in zip(texts, polarities, grades)
+    ]
+
+
+def _init_worker(sentiment: "str | SentimentBackend", readability: str) -> None:
+    # Runs once per worker process: select the parent's engines and load their models.
+    set_sentiment_backend(sentiment)
+    set_readability_engine(readability)
+    extract_features("Warm up the sentiment and readability models.")
+
+
+def _feature_columns(texts: List[str]) -> Dict[str, np.ndarray]:
+    # Columnar so a shard travels back to the parent as four arrays, not one tuple per text.
+    features = extract_features_many(texts)
+    return {
+        "word_count": np.array([f.word_count for f in features], dtype="int64"),
+        "hashtag_count": np.array([f.hashtag_count for f in features], dtype="int64"),
+        "polarity": np.array([np.nan if f.polarity is None else f.polarity for f in features], dtype=float),
+        "grade": np.array([np.nan if f.grade is None else f.grade for f in features], dtype=float),
+    }
+
+
+def _optional(value: float) -> float | None:
+    return None if math.isnan(value) else float(value)
+
+
+def resolve_workers(workers: int | None = None) -> int:
+    if workers is None:
+        try:
+            workers = int(os.getenv(WORKERS_ENV, 1))
+        except ValueError:
+            workers = 1
+    try:
+        cpus = len(os.sched_getaffinity(0))
+    except AttributeError:
+        cpus = os.cpu_count() or 1
+    return max(1, min(workers, cpus))
+
+
+_pool: ProcessPoolExecutor | None = None
+_pool_key: tuple | None = None
+_pool_lock = threading.Lock()
+
+
+def _worker_pool(workers: int) -> ProcessPoolExecutor:
+    """A process-wide pool, kept across calls so workers load their models once."""
+    global _pool, _pool_key
+    backend = get_sentiment_backend()
+    sentiment = backend.name if backend.name in SENTIMENT_BACKENDS else backend
+    key = (workers, backend.name, id(backend), get_readability_engine())
+    with _pool_lock:
+        if _pool is None or _pool_key != key:
+            if _pool is not None:
+                _pool.shutdown(wait=False, cancel_futures=True)
+            # spawn, not fork: the parent may be Streamlit with threads and an open SQLite cache.
+            _pool = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(sentiment, get_readability_engine()),
+            )
+            _pool_key = key
+        return _pool
+
+
+def shutdown_workers() -> None:
+    global _pool, _pool_key
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=True, cancel_futures=True)
+        _pool = _pool_key = None
+
+
+atexit.register(shutdown_workers)
+
+
+def extract_features_parallel(texts: List[str], workers: int | None = None) -> List[TextFeatures]:
+    """
+    extract_features_many sharded across `workers` processes; results keep the
+    order of `texts`. Falls back to in-process extraction for small batches, and
+    for batches too small to pay for starting the pool when none is running.
+    """
+    workers = resolve_workers(workers)
+    if workers <= 1 or len(texts) < 2 * MIN_SHARD_SIZE:
+        return extract_features_many(texts)
+    if _pool is None and len(texts) < POOL_START_SIZE:
+        return extract_features_many(texts)
+    # A few shards per worker keeps them all busy when shard costs differ.
+    size = max(MIN_SHARD_SIZE, math.ceil(len(texts) / (4 * workers)))
+    shards = [texts[i:i + size] for i in range(0, len(texts), size)]
+    features: List[TextFeatures] = []
+    for cols in _worker_pool(workers).map(_feature_columns, shards):
+        features.extend(
+            TextFeatures(int(wc), int(hc), _optional(p), _optional(g))
+            for wc, hc, p, g in zip(cols["word_count"], cols["hashtag_count"], cols["polarity"], cols["grade"])
+        )
+    return features
+
+
+def _backend_version() -> str:
+    # Stored with the disk cache; features from another TextBlob/textstat/pyphen version are dropped.
+    parts = []
+    for dist, module in (("textblob", TextBlob), ("textstat", textstat), ("pyphen", _HYPHENATOR)):
+        try:
+            version = metadata.version(dist) if module is not None else "missing"
+        except Exception:
+            version = "unknown"
+        parts.append(f"{dist}={version}")
+    return ";".join(parts)
+
+
+def text_key(text: str) -> bytes:
+    # Salted with the sentiment backend and readability engine, whose outputs are part of the features.
+    salt = f"{get_sentiment_backend().name}:{get_readability_engine()}".encode("utf-8")
+    return hashlib.blake2b(salt + b"\0" + text.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+
+
+class FeatureCache:
+    """
+    Content-hash keyed TextFeatures: a bounded in-memory LRU, optionally backed by
+    a SQLite file so features survive restarts. Safe to share between threads.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_CACHE_SIZE, path: str | Path | None = None):
+        self.maxsize = maxsize
+        self.path = Path(path) if path else None
+        self.hits = 0
+        self.misses = 0
+        self._lru: "OrderedDict[bytes, TextFeatures]" = OrderedDict()
+        self._pending: List[tuple] = []
+        self._lock = threading.Lock()
+        self._db = self._open_db(self.path) if self.path is not None else None
+
+    @staticmethod
+    def _open_db(path: Path) -> sqlite3.Connection:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        db = sqlite3.connect(str(path), check_same_thread=False)
+        db.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+        db.execute(
+            "CREATE TABLE IF NOT EXISTS features ("
+            "key BLOB PRIMARY KEY, word_count INTEGER, hashtag_count INTEGER, polarity REAL, grade REAL)"
+        )
+        version = _backend_version()
+        row = db.execute("SELECT value FROM meta WHERE key = 'backend'").fetchone()
+        if row is None or row[0] != version:
+            db.execute("DELETE FROM features")
+            db.execute("INSERT OR REPLACE INTO meta VALUES ('backend', ?)", (version,))
+        db.commit()
+        return db
+
+    def _remember(self, key: bytes, features: TextFeatures) -> None:
+        self._lru[key] = features
+        if len(self._lru) > self.maxsize:
+            self._lru.popitem(last=False)
+
+    def _lookup(self, key: bytes) -> TextFeatures | None:
+        features = self._lru.get(key)
+        if features is not None:
+            self._lru.move_to_end(key)
+            return features
+        if self._db is not None:
+            row = self._db.execute(
+                "SELECT word_count, hashtag_count, polarity, grade FROM features WHERE key = ?", (key,)
+            ).fetchone()
+            if row is not None:
+                features = TextFeatures(*row)
+                self._remember(key, features)
+        return features
+
+    def get(self, text: str) -> TextFeatures:
+        key = text_key(text)
+        with self._lock:
+            features = self._lookup(key)
+            if features is not None:
+                self.hits += 1
+                return features
+            self.misses += 1
+        # Computed outside the lock; a concurrent miss on the same text just computes it twice.
+        features = extract_features(text)
+        with self._lock:
+            self._remember(key, features)
+            if self._db is not None:
+                self._pending.append((key, *features))
+                if len(self._pending) >= _FLUSH_EVERY:
+                    self._flush_locked()
+        return features
+
+    def get_many(self, texts: Iterable[str], workers: int | None = None) -> List[TextFeatures]:
+        """Features for many texts; misses are computed once per distinct text, in `workers` processes."""
+        texts = list(texts)
+        keys = [text_key(t) for t in texts]
+        features: List[TextFeatures | None] = []
+        with self._lock:
+            for key in keys:
+                features.append(self._lookup(key))
+        missing = {}
+        for i, (key, found) in enumerate(zip(keys, features)):
+            if found is None:
+                missing.setdefault(key, []).append(i)
+        with self._lock:
+            self.hits += len(texts) - len(missing)
+            self.misses += len(missing)
+        if missing:
+            firsts = [positions[0] for positions in missing.values()]
+            computed = extract_features_parallel([texts[i] for i in firsts], workers)
+            with self._lock:
+                for key, value in zip(missing, computed):
+                    self._remember(key, value)
+                    if self._db is not None:
+                        self._pending.append((key, *value))
+                    for i in missing[key]:
+                        features[i] = value
+        self.flush()
+        return features
+
+    def _flush_locked(self) -> None:
+        if self._db is not None and self._pending:
+            self._db.executemany("INSERT OR REPLACE INTO features VALUES (?, ?, ?, ?, ?)", self._pending)
+            self._db.commit()
+        self._pending.clear()
+
+    def flush(self) -> None:
+        with self._lock:
+            self._flush_locked()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._lru.clear()
+            self._pending.clear()
+            self.hits = self.misses = 0
+            if self._db is not None:
+                self._db.execute("DELETE FROM features")
+                self._db.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._flush_locked()
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "entries": len(self._lru), "path": str(self.path or "")}
+
+    def __len__(self) -> int:
+        return len(self._lru)
+
+
+def _cache_from_env() -> FeatureCache:
+    try:
+        maxsize = int(os.getenv(CACHE_SIZE_ENV, DEFAULT_CACHE_SIZE))
+    except ValueError:
+        maxsize = DEFAULT_CACHE_SIZE
+    return FeatureCache(maxsize, os.getenv(CACHE_PATH_ENV) or None)
+
+
+FEATURE_CACHE = _cache_from_env()
+atexit.register(lambda: FEATURE_CACHE.close())
+
+
+def configure_feature_cache(maxsize: int = DEFAULT_CACHE_SIZE, path: str | Path | None = None) -> FeatureCache:
+    """Replace the process-wide cache (e.g. to turn on the disk store)."""
+    global FEATURE_CACHE
+    FEATURE_CACHE.close()
+    FEATURE_CACHE = FeatureCache(maxsize, path)
+    return FEATURE_CACHE
+
+
+def text_features(text: str) -> TextFeatures:
+    return FEATURE_CACHE.get(text)
+
+
+def text_features_many(texts: Iterable[str], workers: int | None = None) -> List[TextFeatures]:
+    return FEATURE_CACHE.get_many(texts, workers)
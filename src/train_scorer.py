@@ -0,0 +1,107 @@
+import argparse
+import sys
+from pathlib import Path
+from typing import Dict, List
+
+import numpy as np
+import pandas as pd
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.append(str(PROJECT_ROOT))
+
+from src.learned_model import DEFAULT_MODEL_PATH, LearnedScoringModel
+from src.scorer import extract_post_features_many, learned_feature_matrix, optimize_from_feature_frame
+
+DATA_PATH = PROJECT_ROOT / "data" / "processed" / "combined_engagement_data.csv"
+EDA_KEYWORDS_PATH = PROJECT_ROOT / "data" / "processed" / "eda_top_keywords.csv"
+TARGET = "engagement_rate"
+
+
+def load_training_keywords(path: Path = EDA_KEYWORDS_PATH, top_n: int | None = None) -> List[str]:
+    """Trending keywords by avg_engagement_rate, as load_generation_context ranks them."""
+    df = pd.read_csv(path)
+    keywords = df.sort_values("avg_engagement_rate", ascending=False)["keyword"].dropna().astype(str)
+    return keywords.head(top_n).tolist() if top_n is not None else keywords.tolist()
+
+
+def load_training_frame(path: Path = DATA_PATH) -> pd.DataFrame:
+    df = pd.read_csv(path, usecols=["platform", "text", TARGET])
+    df = df.dropna(subset=[TARGET])
+    df["text"] = df["text"].fillna("").astype(str)
+    df["platform"] = df["platform"].fillna("").astype(str)
+    return df.reset_index(drop=True)
+
+
+def _spearman(a: np.ndarray, b: np.ndarray) -> float:
+    # Pearson on average ranks (Series.corr(method="spearman") needs scipy). Undefined
+    # (NaN) when either side is constant, e.g. a platform whose rates are all 1.0.
+    ra, rb = pd.Series(a).rank().to_numpy(), pd.Series(b).rank().to_numpy()
+    if len(a) < 3 or ra.std() == 0 or rb.std() == 0:
+        return float("nan")
+    return float(np.corrcoef(ra, rb)[0, 1])
+
+
+def evaluate(
+    X: np.ndarray, heuristic: np.ndarray, y: np.ndarray, platforms: np.ndarray, args: argparse.Namespace
+) -> pd.DataFrame:
+    """
+    Holdout rank correlation with engagement_rate, learned weights vs the heuristic
+    final_score, per platform only: rates are not comparable across platforms, so a
+    pooled figure would mostly measure how well a score separates the platforms.
+    Platforms without learned weights report NaN for the learned model.
+    """
+    rng = np.random.default_rng(args.seed)
+    test = rng.random(len(y)) < args.holdout
+    model = LearnedScoringModel.fit(X[~test], y[~test], platforms[~test], args.ridge, args.min_rows)
+    rows: List[Dict] = []
+    for platform in sorted(set(platforms[test])):
+        mask = test & (platforms == platform)
+        learned = model.predict(X[mask], platform) if platform in model.platforms else np.full(mask.sum(), np.nan)
+        rows.append(
+            {
+                "platform": platform,
+                "holdout_rows": int(mask.sum()),
+                "spearman_heuristic": round(_spearman(heuristic[mask], y[mask]), 3),
+                "spearman_learned": round(_spearman(learned, y[mask]), 3),
+            }
+        )
+    return pd.DataFrame(rows)
+
+
+def parse_args(argv: List[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Fit per-platform scoring weights against within-platform engagement_rate ranks (offline).")
+    parser.add_argument("--data", default=str(DATA_PATH), help="Historical posts CSV (platform, text, engagement_rate).")
+    parser.add_argument("--keywords", default=str(EDA_KEYWORDS_PATH), help="Trending keywords CSV used for keyword_hits.")
+    parser.add_argument("--top-keywords", type=int, default=None, help="Only use the N best keywords.")
+    parser.add_argument("--output", default=str(DEFAULT_MODEL_PATH), help="Where to write the weights (.npz).")
+    parser.add_argument("--ridge", type=float, default=1.0, help="L2 penalty (intercept not penalized).")
+    parser.add_argument("--min-rows", type=int, default=10, help="Platforms with fewer posts get no learned weights.")
+    parser.add_argument("--holdout", type=float, default=0.2, help="Share of posts held out for the report (0 skips it).")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--workers", type=int, default=None, help="Processes for feature extraction (default: SCORER_WORKERS).")
+    return parser.parse_args(argv)
+
+
+def main(argv: List[str] | None = None) -> LearnedScoringModel:
+    args = parse_args(argv)
+    df = load_training_frame(Path(args.data))
+    keywords = load_training_keywords(Path(args.keywords), args.top_keywords)
+    feats = extract_post_features_many(df["text"], keywords, workers=args.workers)
+    X = learned_feature_matrix(feats)
+    y = df[TARGET].to_numpy(dtype=float)
+    platforms = df["platform"].to_numpy(dtype=object)
+
+    if args.holdout > 0:
+        heuristic = optimize_from_feature_frame(feats)["final_score"].to_numpy(dtype=float)
+        print(evaluate(X, heuristic, y, platforms, args).to_string(index=False))
+
+    model = LearnedScoringModel.fit(X, y, platforms, args.ridge, args.min_rows, keywords)
+    path = model.save(Path(args.output))
+    print(model.to_frame().round(4).to_string())
+    print(f"Saved learned scoring weights for {len(model.platforms)} platforms ({', '.join(model.platforms)}) to {path}")
+    return model
+
+
+if __name__ == "__main__":
+    main()
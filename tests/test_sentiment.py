@@ -0,0 +1,42 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.append(str(PROJECT_ROOT))
+
+pytest.importorskip("textblob")
+
+from src.sentiment import LexiconSentiment, TextBlobSentiment
+
+# Negation/modifier interactions the "lexicon" backend must score exactly like TextBlob.
+PHRASES = [
+    "not very good",
+    "This is really not great",
+    "The product is not very useful",
+    "Great tool, not very expensive",
+    "very not good",
+    "not a good idea",
+    "really is a good idea",
+    "isn't good",
+    "very! good",
+    "good!!",
+]
+
+
+@pytest.fixture(scope="module")
+def lexicon() -> LexiconSentiment:
+    return LexiconSentiment.from_textblob()
+
+
+@pytest.mark.parametrize("text", PHRASES)
+def test_lexicon_matches_textblob(lexicon, text):
+    assert lexicon.polarity(text) == pytest.approx(TextBlobSentiment().polarity(text), abs=1e-9)
+
+
+def test_lexicon_batch_matches_single_texts(lexicon):
+    batch = lexicon.polarity_many(PHRASES + ["", "no sentiment words here"])
+    assert batch[-2:].tolist() == [0.0, 0.0]
+    assert batch[:-2] == pytest.approx([lexicon.polarity(t) for t in PHRASES], abs=1e-12)